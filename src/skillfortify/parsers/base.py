@@ -36,7 +36,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSkill:
     """Universal intermediate representation for a parsed agent skill.
 
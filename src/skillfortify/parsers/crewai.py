@@ -8,88 +8,56 @@ or @tool decorated functions.
 from __future__ import annotations
 
 import ast
+import functools
+import os
 import re
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 import yaml
 
 from skillfortify.parsers.base import ParsedSkill, SkillParser
+from skillfortify.parsers.crewai_extractors import extract_tools, extract_tools_fallback
+from skillfortify.parsers.file_scan import iter_source_files, map_files, read_head
 
-_URL_PATTERN = re.compile(r"https?://[^\s\"'`)\]>]+")
+# Prefer the LibYAML-backed loader; PyYAML wheels built without it fall
+# back to the pure-Python implementation with identical semantics.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-_ENV_VAR_PATTERN = re.compile(
-    r"""(?:"""
-    r"""\$\{?([A-Z][A-Z0-9_]{1,})\}?"""
-    r"""|os\.environ\[["']([A-Z][A-Z0-9_]{1,})["']\]"""
-    r"""|os\.getenv\(["']([A-Z][A-Z0-9_]{1,})["']\)"""
-    r""")""",
-    re.MULTILINE,
-)
-
-# Detect shell-execution calls in Python source (for pattern scanning).
-_SHELL_CALL_PATTERN = re.compile(
-    r"(?:subprocess\.(?:run|call|check_call|check_output|Popen)"
-    r"|os\.(?:system|popen))"
-    r"""\s*\(\s*["']([^"']+)["']""",
-)
+# Byte-level pre-check: every tool definition the AST pass can find
+# mentions BaseTool or uses a (possibly qualified) @tool decorator.
+_TOOL_DEFINITION_MARKER = re.compile(rb"BaseTool|@\s*(?:[\w.]+\.)?tool\b")
 
-# CrewAI import markers.
+# CrewAI import markers, probed as bytes against each file's head.
 _CREWAI_IMPORT_MARKERS = (
-    "from crewai",
-    "import crewai",
+    b"from crewai",
+    b"import crewai",
 )
 
 # YAML config filenames.
 _CREW_CONFIG_FILES = ("crew.yaml", "crew.yml", "agents.yaml", "agents.yml")
+_CREW_CONFIG_NAMES = frozenset(_CREW_CONFIG_FILES)
 
 
-def _extract_urls(text: str) -> list[str]:
-    """Extract all HTTP/HTTPS URLs from text."""
-    return _URL_PATTERN.findall(text)
-
-
-def _extract_env_vars(text: str) -> list[str]:
-    """Extract unique environment variable names from text."""
-    found: set[str] = set()
-    for match in _ENV_VAR_PATTERN.finditer(text):
-        for group in match.groups():
-            if group:
-                found.add(group)
-    return sorted(found)
+def _has_crewai_imports(head: bytes) -> bool:
+    """Check if a file head contains CrewAI import statements."""
+    return any(marker in head for marker in _CREWAI_IMPORT_MARKERS)
 
 
-def _extract_shell_commands(text: str) -> list[str]:
-    """Extract shell commands from subprocess/os calls in source."""
-    return _SHELL_CALL_PATTERN.findall(text)
-
-
-def _extract_imports(text: str) -> list[str]:
-    """Extract import names from Python source via AST with regex fallback."""
-    imports: list[str] = []
-    try:
-        tree = ast.parse(text)
-    except SyntaxError:
-        for line in text.splitlines():
-            stripped = line.strip()
-            if stripped.startswith("import ") or stripped.startswith("from "):
-                parts = stripped.split()
-                if len(parts) >= 2:
-                    imports.append(parts[1].split(".")[0])
-        return sorted(set(imports))
+@functools.lru_cache(maxsize=1024)
+def _probe_tool_file(path: Path, mtime_ns: int, size: int) -> bool:
+    """Report whether a file head imports CrewAI, memoised per file revision.
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append(alias.name.split(".")[0])
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                imports.append(node.module.split(".")[0])
-    return sorted(set(imports))
-
-
-def _has_crewai_imports(text: str) -> bool:
-    """Check if text contains CrewAI import statements."""
-    return any(marker in text for marker in _CREWAI_IMPORT_MARKERS)
+    ``can_parse`` followed by ``parse`` on the same directory probes the
+    same files twice; the second probe is served from this cache.
+    ``mtime_ns`` and ``size`` only key the cache.
+    """
+    head = read_head(path)
+    return head is not None and _has_crewai_imports(head)
 
 
 def _parse_yaml_config(config_path: Path) -> list[ParsedSkill]:
@@ -100,152 +68,74 @@ def _parse_yaml_config(config_path: Path) -> list[ParsedSkill]:
     tools that are referenced but not yet analysed.
     """
     try:
-        raw = config_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(raw)
+        # LibYAML reads bytes directly; decode only once we know we need text.
+        raw_bytes = config_path.read_bytes()
+        data = yaml.load(raw_bytes, Loader=_YamlLoader)
     except (OSError, yaml.YAMLError):
         return []
 
-    if not isinstance(data, dict):
+    # Malformed configs (agents as a list, tools as a string, ...) must be
+    # skipped rather than raise, so each level keeps its type guard.
+    agents = data.get("agents") if isinstance(data, dict) else None
+    if not isinstance(agents, dict):
+        return []
+
+    try:
+        raw = raw_bytes.decode("utf-8")
+    except UnicodeDecodeError:
         return []
 
     results: list[ParsedSkill] = []
-    agents = data.get("agents", {})
-    if isinstance(agents, dict):
-        for agent_name, agent_cfg in agents.items():
-            if not isinstance(agent_cfg, dict):
-                continue
-            tools = agent_cfg.get("tools", [])
-            if not isinstance(tools, list):
-                continue
-            for tool_name in tools:
-                results.append(
-                    ParsedSkill(
-                        name=str(tool_name),
-                        version="unknown",
-                        source_path=config_path,
-                        format="crewai",
-                        description=f"Tool referenced by agent '{agent_name}'",
-                        raw_content=raw,
-                    )
+    for agent_name, agent_cfg in agents.items():
+        tools = agent_cfg.get("tools") if isinstance(agent_cfg, dict) else None
+        if not isinstance(tools, list):
+            continue
+        for tool_name in tools:
+            results.append(
+                ParsedSkill(
+                    name=sys.intern(str(tool_name)),
+                    version="unknown",
+                    source_path=config_path,
+                    format="crewai",
+                    description=f"Tool referenced by agent '{agent_name}'",
+                    raw_content=raw,
                 )
+            )
     return results
 
 
-def _parse_python_tool_file(py_file: Path) -> list[ParsedSkill]:
-    """Parse a Python file for CrewAI BaseTool subclasses and @tool funcs."""
-    try:
-        source = py_file.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        return []
+def _load_module(path: Path) -> tuple[str, ast.Module | None]:
+    """Read and AST-parse a Python file.
+
+    Returns:
+        The source text and its module AST, or None for the AST when the
+        source has a syntax error.
 
+    Raises:
+        OSError, UnicodeDecodeError: If the file cannot be read.
+    """
+    raw = path.read_bytes()
+    source = raw.decode("utf-8-sig")
+    if not _TOOL_DEFINITION_MARKER.search(raw):
+        # No BaseTool subclass or @tool decorator can exist; skip the parse.
+        return source, ast.Module(body=[], type_ignores=[])
     try:
-        tree = ast.parse(source)
+        # Parsing the bytes skips CPython's internal re-encode of a str.
+        return source, ast.parse(raw, filename=str(path))
     except SyntaxError:
-        return _regex_fallback(source, py_file)
+        return source, None
 
-    results: list[ParsedSkill] = []
-    for node in ast.walk(tree):
-        skill = None
-        if isinstance(node, ast.ClassDef):
-            skill = _parse_class_tool(node, source, py_file)
-        elif isinstance(node, ast.FunctionDef):
-            skill = _parse_function_tool(node, source, py_file)
-        if skill is not None:
-            results.append(skill)
-    return results
 
+def _parse_python_tool_file(py_file: Path) -> list[ParsedSkill]:
+    """Parse a Python file for CrewAI BaseTool subclasses and @tool funcs."""
+    try:
+        source, tree = _load_module(py_file)
+    except (OSError, UnicodeDecodeError):
+        return []
 
-def _parse_class_tool(
-    node: ast.ClassDef,
-    source: str,
-    file_path: Path,
-) -> ParsedSkill | None:
-    """Extract a ParsedSkill from a CrewAI BaseTool subclass."""
-    is_base_tool = any(
-        (isinstance(b, ast.Name) and b.id == "BaseTool")
-        or (isinstance(b, ast.Attribute) and b.attr == "BaseTool")
-        for b in node.bases
-    )
-    if not is_base_tool:
-        return None
-
-    name = node.name
-    description = ""
-
-    for item in node.body:
-        if isinstance(item, ast.AnnAssign):
-            if (
-                isinstance(item.target, ast.Name)
-                and item.value is not None
-                and isinstance(item.value, ast.Constant)
-            ):
-                if item.target.id == "name":
-                    name = str(item.value.value)
-                elif item.target.id == "description":
-                    description = str(item.value.value)
-        elif isinstance(item, ast.Assign):
-            for target in item.targets:
-                if isinstance(target, ast.Name) and isinstance(item.value, ast.Constant):
-                    if target.id == "name":
-                        name = str(item.value.value)
-                    elif target.id == "description":
-                        description = str(item.value.value)
-
-    body_text = ast.get_source_segment(source, node) or ""
-    return _build_skill(name, description, body_text, file_path, source)
-
-
-def _parse_function_tool(
-    node: ast.FunctionDef,
-    source: str,
-    file_path: Path,
-) -> ParsedSkill | None:
-    """Extract a ParsedSkill from a @tool decorated function."""
-    has_tool_dec = any(
-        (isinstance(d, ast.Name) and d.id == "tool")
-        or (isinstance(d, ast.Attribute) and d.attr == "tool")
-        for d in node.decorator_list
-    )
-    if not has_tool_dec:
-        return None
-
-    name = node.name
-    description = ast.get_docstring(node) or ""
-    body_text = ast.get_source_segment(source, node) or ""
-    return _build_skill(name, description, body_text, file_path, source)
-
-
-def _build_skill(
-    name: str,
-    description: str,
-    body: str,
-    path: Path,
-    source: str,
-) -> ParsedSkill:
-    """Construct a ParsedSkill from extracted CrewAI tool metadata."""
-    return ParsedSkill(
-        name=name,
-        version="unknown",
-        source_path=path,
-        format="crewai",
-        description=description,
-        code_blocks=[body] if body else [],
-        urls=_extract_urls(body),
-        env_vars_referenced=_extract_env_vars(body),
-        shell_commands=_extract_shell_commands(body),
-        dependencies=_extract_imports(source),
-        raw_content=source,
-    )
-
-
-def _regex_fallback(source: str, file_path: Path) -> list[ParsedSkill]:
-    """Regex fallback for files that fail AST parsing."""
-    results: list[ParsedSkill] = []
-    for match in re.finditer(r"class\s+(\w+)\s*\(\s*BaseTool\s*\)", source):
-        results.append(_build_skill(match.group(1), "", source, file_path, source))
-    for match in re.finditer(r"@tool\s*\n\s*def\s+(\w+)", source):
-        results.append(_build_skill(match.group(1), "", source, file_path, source))
-    return results
+    if tree is None:
+        return extract_tools_fallback(source, py_file)
+    return extract_tools(tree, source, py_file)
 
 
 class CrewAIParser(SkillParser):
@@ -253,12 +143,15 @@ class CrewAIParser(SkillParser):
 
     def can_parse(self, path: Path) -> bool:
         """Check if the directory contains CrewAI tool definitions."""
-        # Check YAML configs.
-        for cfg_name in _CREW_CONFIG_FILES:
-            if (path / cfg_name).is_file():
-                return True
-        # Check Python files for crewai imports.
-        return bool(self._find_python_tool_files(path))
+        # Check YAML configs by name from a single directory listing.
+        try:
+            with os.scandir(path) as entries:
+                if any(e.name in _CREW_CONFIG_NAMES and e.is_file() for e in entries):
+                    return True
+        except OSError:
+            return False
+        # Check Python files for crewai imports, stopping at the first hit.
+        return next(self._iter_python_tool_files(path), None) is not None
 
     def parse(self, path: Path) -> list[ParsedSkill]:
         """Parse all CrewAI tools in the directory."""
@@ -270,27 +163,27 @@ class CrewAIParser(SkillParser):
             if cfg_path.is_file():
                 results.extend(_parse_yaml_config(cfg_path))
 
-        # Parse Python tool files.
-        for py_file in self._find_python_tool_files(path):
-            results.extend(_parse_python_tool_file(py_file))
+        # Parse Python tool files. Large tool directories are read on a
+        # thread pool so file I/O overlaps; results keep file order.
+        py_files = list(self._iter_python_tool_files(path))
+        for skills in map_files(_parse_python_tool_file, py_files):
+            results.extend(skills)
 
         return results
 
-    def _find_python_tool_files(self, path: Path) -> list[Path]:
-        """Find Python files containing CrewAI tool definitions."""
-        candidates: list[Path] = []
+    def _iter_python_tool_files(self, path: Path) -> Iterator[Path]:
+        """Yield Python files whose head contains a CrewAI import.
+
+        Only a fixed-size head of each file is read here, and the verdict
+        is cached per file revision; full reads and AST parsing are
+        deferred to ``parse`` for files that match.
+        """
         search_dirs = [path]
         for sub_name in ("tools", "crewai_tools"):
             sub = path / sub_name
             if sub.is_dir():
                 search_dirs.append(sub)
 
-        for search_dir in search_dirs:
-            for py_file in sorted(search_dir.glob("*.py")):
-                try:
-                    head = py_file.read_text(encoding="utf-8")[:4096]
-                except (OSError, UnicodeDecodeError):
-                    continue
-                if _has_crewai_imports(head):
-                    candidates.append(py_file)
-        return candidates
+        for py_file, st in iter_source_files(search_dirs, ".py"):
+            if _probe_tool_file(py_file, st.st_mtime_ns, st.st_size):
+                yield py_file
@@ -0,0 +1,296 @@
+"""Extraction helpers for CrewAI Python tool files.
+
+This module contains the AST visitors and regex fallbacks that turn a
+parsed CrewAI tool file into ParsedSkill instances: BaseTool subclasses,
+@tool decorated functions, and the URLs, env vars and shell commands
+referenced inside each tool. Text-based helpers for files that fail to
+parse live in ``crewai_utils.py``.
+
+Separated from the main ``crewai`` module to respect the 300-line cap
+and single-responsibility principle.
+"""
+
+from __future__ import annotations
+
+import ast
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from skillfortify.parsers.base import ParsedSkill
+from skillfortify.parsers.crewai_utils import (
+    CLASS_TOOL_FALLBACK_PATTERN,
+    DECORATOR_TOOL_FALLBACK_PATTERN,
+    ENV_NAME_PATTERN,
+    SHELL_CALL_FUNCTIONS,
+    SHELL_VAR_PATTERN,
+    URL_PATTERN,
+    extract_env_vars,
+    extract_imports,
+    extract_shell_commands,
+    extract_urls,
+)
+
+# ---------------------------------------------------------------------------
+# AST visitors
+# ---------------------------------------------------------------------------
+
+
+class _CrewAIExtractor(ast.NodeVisitor):
+    """Collect candidate tool definitions and imports in one tree walk.
+
+    Replaces a walk for tool definitions followed by a second parse and
+    walk of the same source for import names.
+    """
+
+    def __init__(self) -> None:
+        self.definitions: list[ast.ClassDef | ast.FunctionDef] = []
+        self.imports: set[str] = set()
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.definitions.append(node)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.definitions.append(node)
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports.add(sys.intern(alias.name.partition(".")[0]))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self.imports.add(sys.intern(node.module.partition(".")[0]))
+
+
+def _dotted_name(node: ast.AST) -> str | None:
+    """Return ``"a.b"`` for an ``a.b`` attribute access, else None."""
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        return f"{node.value.id}.{node.attr}"
+    return None
+
+
+class _ToolBodyScanner(ast.NodeVisitor):
+    """Collect URLs, env vars and shell commands from a tool's AST subtree.
+
+    URLs and ``$VAR`` references are matched only inside string literals,
+    so comments and identifiers are never scanned. An f-string is scanned
+    as one string with a ``{name}`` placeholder (``{}`` for other
+    expressions) per interpolated value, so its literal host and path
+    survive. ``os.environ[...]``, ``os.getenv(...)``
+    and shell-execution calls are recognised structurally.
+
+    Nodes are dispatched through a dict keyed on node type rather than
+    NodeVisitor's per-node ``"visit_" + class name`` attribute lookup.
+    """
+
+    def __init__(self) -> None:
+        self.urls: list[str] = []
+        self.env_vars: set[str] = set()
+        self.shell_commands: list[str] = []
+        self._dispatch: dict[type[ast.AST], Callable[[Any], None]] = {
+            ast.Constant: self._on_constant,
+            ast.JoinedStr: self._on_joined_str,
+            ast.Subscript: self._on_subscript,
+            ast.Call: self._on_call,
+        }
+
+    def visit(self, node: ast.AST) -> None:
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(node)
+
+    def _scan_literal(self, text: str) -> None:
+        self.urls.extend(URL_PATTERN.findall(text))
+        self.env_vars.update(SHELL_VAR_PATTERN.findall(text))
+
+    def _add_env_name(self, node: ast.AST) -> None:
+        if (
+            isinstance(node, ast.Constant)
+            and isinstance(node.value, str)
+            and ENV_NAME_PATTERN.fullmatch(node.value)
+        ):
+            self.env_vars.add(node.value)
+
+    def _on_constant(self, node: ast.Constant) -> None:
+        if isinstance(node.value, str):
+            self._scan_literal(node.value)
+
+    def _on_joined_str(self, node: ast.JoinedStr) -> None:
+        parts: list[str] = []
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                expr = value.value
+                name = expr.id if isinstance(expr, ast.Name) else _dotted_name(expr)
+                parts.append(f"{{{name or ''}}}")
+                self.visit(expr)
+            elif isinstance(value, ast.Constant) and isinstance(value.value, str):
+                parts.append(value.value)
+        self._scan_literal("".join(parts))
+
+    def _on_subscript(self, node: ast.Subscript) -> None:
+        if _dotted_name(node.value) == "os.environ":
+            self._add_env_name(node.slice)
+        self.generic_visit(node)
+
+    def _on_call(self, node: ast.Call) -> None:
+        func = node.func
+        if node.args:
+            first = node.args[0]
+            if _dotted_name(func) == "os.getenv":
+                self._add_env_name(first)
+            elif (
+                isinstance(func, ast.Attribute)
+                and isinstance(func.value, ast.Name)
+                and func.attr in SHELL_CALL_FUNCTIONS.get(func.value.id, ())
+                and isinstance(first, ast.Constant)
+                and isinstance(first.value, str)
+            ):
+                self.shell_commands.append(first.value)
+        self.generic_visit(node)
+
+
+# ---------------------------------------------------------------------------
+# Tool extraction
+# ---------------------------------------------------------------------------
+
+
+def extract_tools(tree: ast.Module, source: str, file_path: Path) -> list[ParsedSkill]:
+    """Extract BaseTool subclasses and @tool functions from a parsed file.
+
+    Args:
+        tree: Module AST of ``source``; only read, never mutated.
+        source: Python source code the tree was parsed from.
+        file_path: Path to the source file on disk.
+
+    Returns:
+        List of ParsedSkill instances, one per tool definition found.
+    """
+    extractor = _CrewAIExtractor()
+    extractor.visit(tree)
+    dependencies = sorted(extractor.imports)
+
+    results: list[ParsedSkill] = []
+    for node in extractor.definitions:
+        if isinstance(node, ast.ClassDef):
+            skill = _parse_class_tool(node, source, file_path, dependencies)
+        else:
+            skill = _parse_function_tool(node, source, file_path, dependencies)
+        if skill is not None:
+            results.append(skill)
+    return results
+
+
+def extract_tools_fallback(source: str, file_path: Path) -> list[ParsedSkill]:
+    """Regex fallback for files that fail AST parsing."""
+    results: list[ParsedSkill] = []
+    dependencies = extract_imports(source)
+    for match in CLASS_TOOL_FALLBACK_PATTERN.finditer(source):
+        results.append(_build_skill(match.group(1), "", source, file_path, source, dependencies))
+    for match in DECORATOR_TOOL_FALLBACK_PATTERN.finditer(source):
+        results.append(_build_skill(match.group(1), "", source, file_path, source, dependencies))
+    return results
+
+
+def _parse_class_tool(
+    node: ast.ClassDef,
+    source: str,
+    file_path: Path,
+    dependencies: list[str],
+) -> ParsedSkill | None:
+    """Extract a ParsedSkill from a CrewAI BaseTool subclass."""
+    is_base_tool = any(
+        (isinstance(b, ast.Name) and b.id == "BaseTool")
+        or (isinstance(b, ast.Attribute) and b.attr == "BaseTool")
+        for b in node.bases
+    )
+    if not is_base_tool:
+        return None
+
+    name = node.name
+    description = ""
+
+    for item in node.body:
+        if isinstance(item, ast.AnnAssign):
+            if (
+                isinstance(item.target, ast.Name)
+                and item.value is not None
+                and isinstance(item.value, ast.Constant)
+            ):
+                if item.target.id == "name":
+                    name = str(item.value.value)
+                elif item.target.id == "description":
+                    description = str(item.value.value)
+        elif isinstance(item, ast.Assign):
+            for target in item.targets:
+                if isinstance(target, ast.Name) and isinstance(item.value, ast.Constant):
+                    if target.id == "name":
+                        name = str(item.value.value)
+                    elif target.id == "description":
+                        description = str(item.value.value)
+
+    body_text = ast.get_source_segment(source, node) or ""
+    return _build_skill(name, description, body_text, file_path, source, dependencies, node)
+
+
+def _parse_function_tool(
+    node: ast.FunctionDef,
+    source: str,
+    file_path: Path,
+    dependencies: list[str],
+) -> ParsedSkill | None:
+    """Extract a ParsedSkill from a @tool decorated function."""
+    has_tool_dec = any(
+        (isinstance(d, ast.Name) and d.id == "tool")
+        or (isinstance(d, ast.Attribute) and d.attr == "tool")
+        for d in node.decorator_list
+    )
+    if not has_tool_dec:
+        return None
+
+    name = node.name
+    description = ast.get_docstring(node) or ""
+    body_text = ast.get_source_segment(source, node) or ""
+    return _build_skill(name, description, body_text, file_path, source, dependencies, node)
+
+
+def _build_skill(
+    name: str,
+    description: str,
+    body: str,
+    path: Path,
+    source: str,
+    dependencies: list[str],
+    node: ast.AST | None = None,
+) -> ParsedSkill:
+    """Construct a ParsedSkill from extracted CrewAI tool metadata.
+
+    When the tool's AST ``node`` is available, URLs, env vars and shell
+    commands are read from its string literals and call sites. Tools recovered by
+    the regex fallback have no AST and are scanned as raw text instead.
+    """
+    if node is not None:
+        scanner = _ToolBodyScanner()
+        scanner.visit(node)
+        urls, shell_commands = scanner.urls, scanner.shell_commands
+        env_vars = sorted(sys.intern(var) for var in scanner.env_vars)
+    else:
+        urls, shell_commands = extract_urls(body), extract_shell_commands(body)
+        env_vars = extract_env_vars(body)
+    return ParsedSkill(
+        name=sys.intern(name),
+        version="unknown",
+        source_path=path,
+        format="crewai",
+        description=description,
+        code_blocks=[body] if body else [],
+        urls=urls,
+        env_vars_referenced=env_vars,
+        shell_commands=shell_commands,
+        dependencies=list(dependencies),
+        raw_content=source,
+    )
@@ -0,0 +1,99 @@
+"""Text extraction utilities for the CrewAI parser.
+
+Provides compiled regex patterns and helper functions for extracting
+URLs, environment variables, shell commands, and import names from
+Python source text. The AST-based extractors in ``crewai_extractors.py``
+share the patterns and fall back to these helpers for files that fail
+to parse.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+import sys
+
+# --------------------------------------------------------------------------- #
+# Compiled patterns                                                            #
+# --------------------------------------------------------------------------- #
+
+URL_PATTERN = re.compile(r"https?://[^\s\"'`)\]>]+")
+
+ENV_VAR_PATTERN = re.compile(
+    r"""(?:"""
+    r"""\$\{?([A-Z][A-Z0-9_]{1,})\}?"""
+    r"""|os\.environ\[["']([A-Z][A-Z0-9_]{1,})["']\]"""
+    r"""|os\.getenv\(["']([A-Z][A-Z0-9_]{1,})["']\)"""
+    r""")""",
+    re.MULTILINE,
+)
+
+# Detect shell-execution calls in Python source (for pattern scanning).
+SHELL_CALL_PATTERN = re.compile(
+    r"(?:subprocess\.(?:run|call|check_call|check_output|Popen)"
+    r"|os\.(?:system|popen))"
+    r"""\s*\(\s*["']([^"']+)["']""",
+)
+
+# Env-var names as matched by ENV_VAR_PATTERN, for AST-based extraction.
+ENV_NAME_PATTERN = re.compile(r"[A-Z][A-Z0-9_]{1,}")
+SHELL_VAR_PATTERN = re.compile(r"\$\{?([A-Z][A-Z0-9_]{1,})\}?")
+
+# Shell-execution callables by module, mirroring SHELL_CALL_PATTERN.
+SHELL_CALL_FUNCTIONS: dict[str, frozenset[str]] = {
+    "subprocess": frozenset({"run", "call", "check_call", "check_output", "Popen"}),
+    "os": frozenset({"system", "popen"}),
+}
+
+# Regex fallbacks for tool definitions in files that fail AST parsing.
+CLASS_TOOL_FALLBACK_PATTERN = re.compile(r"class\s+(\w+)\s*\(\s*BaseTool\s*\)")
+DECORATOR_TOOL_FALLBACK_PATTERN = re.compile(r"@tool\s*\n\s*def\s+(\w+)")
+
+
+# --------------------------------------------------------------------------- #
+# Text extraction functions                                                    #
+# --------------------------------------------------------------------------- #
+
+
+def extract_urls(text: str) -> list[str]:
+    """Extract all HTTP/HTTPS URLs from text."""
+    return URL_PATTERN.findall(text)
+
+
+def extract_env_vars(text: str) -> list[str]:
+    """Extract unique environment variable names from text."""
+    found: set[str] = set()
+    for match in ENV_VAR_PATTERN.finditer(text):
+        for group in match.groups():
+            if group:
+                found.add(sys.intern(group))
+    return sorted(found)
+
+
+def extract_shell_commands(text: str) -> list[str]:
+    """Extract shell commands from subprocess/os calls in source."""
+    return SHELL_CALL_PATTERN.findall(text)
+
+
+def extract_imports(text: str) -> list[str]:
+    """Extract import names from Python source via AST with regex fallback."""
+    imports: list[str] = []
+    try:
+        tree = ast.parse(text)
+    except SyntaxError:
+        for line in text.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("import ") or stripped.startswith("from "):
+                parts = stripped.split()
+                if len(parts) >= 2:
+                    imports.append(sys.intern(parts[1].partition(".")[0]))
+        return sorted(set(imports))
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(alias.name.partition(".")[0])
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                imports.append(node.module.partition(".")[0])
+    return sorted(set(imports))
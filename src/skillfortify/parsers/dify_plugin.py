@@ -20,6 +20,8 @@ Security Relevance:
 
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -29,6 +31,7 @@ from skillfortify.parsers.dify_plugin_extractors import (
     DIFY_PLUGIN_DIR,
     PROVIDER_CREDENTIAL_KEY,
     YAML_EXTENSIONS,
+    decode_manifest_text,
     extract_credentials,
     extract_dependencies,
     extract_env_vars,
@@ -36,11 +39,16 @@ from skillfortify.parsers.dify_plugin_extractors import (
     extract_tool_descriptions,
     extract_urls,
     is_dify_manifest,
+    load_json_bytes,
+    load_yaml_bytes,
     parse_multi_tools,
+    read_file_bytes,
     safe_load_json,
     safe_load_yaml,
 )
 
+_MANIFEST_NAMES = frozenset(DIFY_MANIFEST_FILENAMES)
+
 
 class DifyPluginParser(SkillParser):
     """Parser for Dify plugin manifest files and provider configs.
@@ -67,14 +75,24 @@ class DifyPluginParser(SkillParser):
         Returns:
             True if Dify plugin files are detected.
         """
-        for filename in DIFY_MANIFEST_FILENAMES:
-            manifest_path = path / filename
-            if manifest_path.is_file():
-                data = self._load_manifest(manifest_path)
-                if data is not None and is_dify_manifest(data):
-                    return True
-        if (path / DIFY_PLUGIN_DIR).is_dir():
-            return True
+        try:
+            with os.scandir(path) as entries:
+                files: set[str] = set()
+                for entry in entries:
+                    if entry.name == DIFY_PLUGIN_DIR and entry.is_dir():
+                        return True
+                    if entry.is_file():
+                        files.add(entry.name)
+        except OSError:
+            return False
+        for filename in _MANIFEST_NAMES & files:
+            try:
+                raw = read_file_bytes(path / filename)
+            except OSError:
+                continue
+            data = load_json_bytes(raw) if filename.endswith(".json") else load_yaml_bytes(raw)
+            if data is not None and is_dify_manifest(data):
+                return True
         return False
 
     def parse(self, path: Path) -> list[ParsedSkill]:
@@ -140,11 +158,11 @@ class DifyPluginParser(SkillParser):
             List of ParsedSkill instances.
         """
         try:
-            raw_content = file_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+            raw_content = decode_manifest_text(read_file_bytes(file_path))
+        except OSError:
             raw_content = ""
 
-        plugin_name = str(data.get("name", file_path.stem))
+        plugin_name = sys.intern(str(data.get("name", file_path.stem)))
         plugin_version = str(data.get("version", "unknown"))
         plugin_description = extract_tool_descriptions(data)
 
@@ -241,15 +259,15 @@ class DifyPluginParser(SkillParser):
             ParsedSkill, or None if insufficient data.
         """
         try:
-            raw_content = file_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+            raw_content = decode_manifest_text(read_file_bytes(file_path))
+        except OSError:
             raw_content = ""
 
         identity = data.get("identity", {})
         if not isinstance(identity, dict):
             identity = {}
 
-        name = str(identity.get("name", file_path.stem))
+        name = sys.intern(str(identity.get("name", file_path.stem)))
         description_raw = identity.get("description", "")
         if isinstance(description_raw, dict):
             description = str(
@@ -7,13 +7,25 @@ shell commands, credentials, dependencies, and tool descriptions.
 
 from __future__ import annotations
 
+import codecs
 import json
+import os
 import re
+import sys
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from skillfortify.parsers.json_utils import loads as json_loads
+
+# Prefer the LibYAML-backed loader; PyYAML wheels built without it fall
+# back to the pure-Python implementation with identical semantics.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # --- Constants -----------------------------------------------------------
 
 DIFY_MANIFEST_FILENAMES = ("manifest.yaml", "manifest.yml", "manifest.json")
@@ -67,7 +79,7 @@ def extract_env_vars(text: str) -> list[str]:
     for match in _ENV_VAR_PATTERN.finditer(text):
         for group in match.groups():
             if group:
-                found.add(group)
+                found.add(sys.intern(group))
     return sorted(found)
 
 
@@ -106,13 +118,53 @@ def extract_credentials(data: dict[str, Any]) -> list[str]:
         if isinstance(entry, dict):
             var_name = entry.get("variable", "")
             if var_name:
-                result.append(str(var_name))
+                result.append(sys.intern(str(var_name)))
     return result
 
 
 # --- File loaders --------------------------------------------------------
 
 
+def read_file_bytes(file_path: Path) -> bytes:
+    """Read a whole file with raw ``os`` calls, bypassing buffered IO.
+
+    Manifests are small, so a single unbuffered read sized from ``fstat``
+    avoids constructing a ``BufferedReader`` per file.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        The file contents.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        chunks = [os.read(fd, os.fstat(fd).st_size + 1)]
+        # Loop only if the file grew or the OS returned a short read.
+        while chunks[-1]:
+            chunks.append(os.read(fd, 1 << 16))
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def decode_manifest_text(raw: bytes) -> str:
+    """Decode manifest bytes by their BOM (UTF-32/16, else UTF-8), or ``""``."""
+    if raw.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+        encoding = "utf-32"
+    elif raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encoding = "utf-16"
+    else:
+        encoding = "utf-8-sig"
+    try:
+        return raw.decode(encoding)
+    except UnicodeDecodeError:
+        return ""
+
+
 def safe_load_yaml(file_path: Path) -> dict[str, Any] | None:
     """Load a YAML file, returning None on any error.
 
@@ -123,9 +175,17 @@ def safe_load_yaml(file_path: Path) -> dict[str, Any] | None:
         Parsed dict, or None if malformed or unreadable.
     """
     try:
-        raw = file_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(raw)
-    except (OSError, yaml.YAMLError, UnicodeDecodeError):
+        raw = read_file_bytes(file_path)
+    except OSError:
+        return None
+    return load_yaml_bytes(raw)
+
+
+def load_yaml_bytes(raw: bytes) -> dict[str, Any] | None:
+    """Parse YAML bytes to a dict or None; the loader handles byte order marks."""
+    try:
+        data = yaml.load(raw, Loader=_YamlLoader)
+    except yaml.YAMLError:
         return None
     if not isinstance(data, dict):
         return None
@@ -142,9 +202,17 @@ def safe_load_json(file_path: Path) -> dict[str, Any] | None:
         Parsed dict, or None if malformed or unreadable.
     """
     try:
-        raw = file_path.read_text(encoding="utf-8")
-        data = json.loads(raw)
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        raw = read_file_bytes(file_path)
+    except OSError:
+        return None
+    return load_json_bytes(raw)
+
+
+def load_json_bytes(raw: bytes) -> dict[str, Any] | None:
+    """Parse JSON bytes, returning None unless they hold an object."""
+    try:
+        data = json_loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return None
     if not isinstance(data, dict):
         return None
@@ -226,4 +294,4 @@ def extract_dependencies(data: dict[str, Any]) -> list[str]:
     deps = data.get("dependencies", [])
     if not isinstance(deps, list):
         return []
-    return [str(dep) for dep in deps]
+    return [sys.intern(str(dep)) for dep in deps]
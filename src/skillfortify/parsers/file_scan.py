@@ -0,0 +1,106 @@
+"""File discovery helpers shared by the source-code parsers.
+
+Several parsers decide whether a directory belongs to their framework by
+probing only the head of each candidate source file. ``iter_source_files``
+lists the candidates, and ``read_head`` reads a head with the same UTF-8
+check a full ``read_text`` would apply, so a file accepted by
+``can_parse`` is also one ``parse`` can read. ``map_files`` runs the
+per-file work of ``parse``, on a thread pool once there are enough files.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+HEAD_BYTES = 4096
+
+# Below this many files, thread start-up costs more than overlapping reads saves.
+PARALLEL_MIN_FILES = 8
+MAX_WORKERS = 8
+
+
+def iter_source_files(
+    search_dirs: Iterable[Path],
+    suffixes: str | tuple[str, ...],
+) -> Iterator[tuple[Path, os.stat_result]]:
+    """Yield regular files ending in ``suffixes`` with their stat results.
+
+    Each directory is listed with one ``os.scandir`` pass, and its
+    matching entries are yielded in name order. Entry types come from the
+    listing, so non-files are dropped without a stat call of their own.
+    A directory that cannot be listed is skipped. An entry whose type or stat cannot be read, such
+    as a symlink loop or a file removed mid-scan, is skipped on its own
+    without dropping the rest of its directory.
+
+    Args:
+        search_dirs: Directories to list, in order.
+        suffixes: File name suffix, or tuple of suffixes, to accept.
+
+    Yields:
+        ``(path, stat)`` pairs for each matching regular file.
+    """
+    for search_dir in search_dirs:
+        try:
+            with os.scandir(search_dir) as entries:
+                matches = sorted(
+                    (e for e in entries if e.name.endswith(suffixes)), key=lambda e: e.name
+                )
+        except OSError:
+            continue
+        for entry in matches:
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            yield search_dir / entry.name, st
+
+
+def read_head(path: Path) -> bytes | None:
+    """Read the first ``HEAD_BYTES`` of a UTF-8 source file.
+
+    Args:
+        path: File to probe.
+
+    Returns:
+        The head bytes, or None if the file cannot be read or is not valid
+        UTF-8. A multi-byte character cut off by the read limit is allowed.
+    """
+    try:
+        with path.open("rb") as handle:
+            head = handle.read(HEAD_BYTES)
+    except OSError:
+        return None
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        if len(head) < HEAD_BYTES or exc.reason != "unexpected end of data":
+            return None
+    return head
+
+
+def map_files(func: Callable[[Path], _T], files: list[Path]) -> list[_T]:
+    """Apply ``func`` to each file and return the results in file order.
+
+    From ``PARALLEL_MIN_FILES`` files on, the calls run on a thread pool of
+    at most ``MAX_WORKERS`` threads so their file reads overlap.
+
+    Args:
+        func: Per-file work, such as reading or parsing one file.
+        files: Files to process.
+
+    Returns:
+        One result per file, in the order of ``files``.
+    """
+    if len(files) < PARALLEL_MIN_FILES:
+        return [func(file) for file in files]
+    workers = min(MAX_WORKERS, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, files))
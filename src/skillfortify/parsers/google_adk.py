@@ -8,6 +8,7 @@ OpenAPIToolset, sub-agent references, and callback hooks.
 from __future__ import annotations
 
 import ast
+import functools
 import re
 from pathlib import Path
 
@@ -30,6 +31,12 @@ _SHELL_CALL_PATTERN = re.compile(
     r"""\s*\(\s*["']([^"']+)["']""",
 )
 
+# Regex fallback for Agent(...) definitions in unparseable source.
+_AGENT_FALLBACK_PATTERN = re.compile(
+    r"""Agent\s*\([^)]*name\s*=\s*["'](\w+)["']""",
+    re.DOTALL,
+)
+
 _ADK_IMPORT_MARKERS = (
     "from google.adk",
     "import google.adk",
@@ -78,12 +85,20 @@ def _extract_shell_commands(text: str) -> list[str]:
     return _SHELL_CALL_PATTERN.findall(text)
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_module(source: str) -> ast.Module | None:
+    """Parse source once for all extractors of one file (tree is read-only)."""
+    try:
+        return ast.parse(source)
+    except SyntaxError:
+        return None
+
+
 def _extract_imports(text: str) -> list[str]:
     """Extract top-level import package names via AST, regex fallback."""
     imports: list[str] = []
-    try:
-        tree = ast.parse(text)
-    except SyntaxError:
+    tree = _parse_module(text)
+    if tree is None:
         for line in text.splitlines():
             stripped = line.strip()
             if stripped.startswith(("import ", "from ")):
@@ -209,9 +224,8 @@ def _extract_agent_definitions(
     file_path: Path,
 ) -> list[ParsedSkill]:
     """Extract Agent() constructor calls from Python AST."""
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    tree = _parse_module(source)
+    if tree is None:
         return _regex_fallback_agents(source, file_path)
 
     results: list[ParsedSkill] = []
@@ -232,11 +246,7 @@ def _regex_fallback_agents(
 ) -> list[ParsedSkill]:
     """Regex fallback for Agent(...) definitions in unparseable source."""
     results: list[ParsedSkill] = []
-    pattern = re.compile(
-        r"""Agent\s*\([^)]*name\s*=\s*["'](\w+)["']""",
-        re.DOTALL,
-    )
-    for match in pattern.finditer(source):
+    for match in _AGENT_FALLBACK_PATTERN.finditer(source):
         results.append(
             _build_skill(match.group(1), "", source, file_path, source),
         )
@@ -268,6 +278,7 @@ class GoogleADKParser(SkillParser):
             results.extend(extract_function_tools(source, py_file))
             results.extend(extract_mcp_toolsets(source, py_file))
             results.extend(extract_openapi_toolsets(source, py_file))
+        _parse_module.cache_clear()
         return results
 
     def _find_adk_files(self, path: Path) -> list[Path]:
@@ -21,6 +21,7 @@ from skillfortify.parsers.google_adk import (
     _get_agent_tools,
     _get_kwarg_str,
     _is_agent_constructor,
+    _parse_module,
 )
 
 # ---------------------------------------------------------------------------
@@ -62,9 +63,8 @@ def extract_function_tools(
     Returns:
         List of ParsedSkill instances for each function tool found.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    tree = _parse_module(source)
+    if tree is None:
         return []
 
     referenced: set[str] = set()
@@ -156,9 +156,8 @@ def extract_mcp_toolsets(
     Returns:
         List of ParsedSkill instances for each MCPToolset found.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    tree = _parse_module(source)
+    if tree is None:
         return []
 
     results: list[ParsedSkill] = []
@@ -211,9 +210,8 @@ def extract_openapi_toolsets(
     Returns:
         List of ParsedSkill instances for each OpenAPIToolset found.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    tree = _parse_module(source)
+    if tree is None:
         return []
 
     results: list[ParsedSkill] = []
@@ -251,9 +249,8 @@ def extract_callbacks(source: str) -> list[str]:
     Returns:
         List of callback function names found.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    tree = _parse_module(source)
+    if tree is None:
         return []
 
     callbacks: list[str] = []
@@ -19,6 +19,10 @@ from skillfortify.parsers.haystack_tools import (
     _build_skill,
     _get_kwarg_str,
 )
+from skillfortify.parsers.haystack_utils import index_module
+
+# Tool names recovered from source that fails to parse.
+_CREATE_TOOL_FALLBACK_PATTERN = re.compile(r"create_tool_from_function\s*\(\s*(\w+)\s*\)")
 
 # ---------------------------------------------------------------------------
 # Tool detection helpers
@@ -77,17 +81,14 @@ def extract_tool_definitions(
     Returns:
         List of ParsedSkill instances for each Haystack tool found.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    index = index_module(source)
+    if index is None:
         return _regex_fallback_tools(source, file_path)
 
     referenced_funcs: set[str] = set()
     tool_names: dict[str, str] = {}
 
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Call):
-            continue
+    for node in index.calls:
         if _is_create_tool_call(node) or _is_tool_constructor(node):
             fn_name = _get_tool_function_name(node)
             if fn_name:
@@ -97,9 +98,7 @@ def extract_tool_definitions(
                 tool_names[fn_name] = tool_name
 
     results: list[ParsedSkill] = []
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.FunctionDef):
-            continue
+    for node in index.functions:
         if node.name not in referenced_funcs:
             continue
         desc = ast.get_docstring(node) or ""
@@ -117,10 +116,7 @@ def _regex_fallback_tools(
 ) -> list[ParsedSkill]:
     """Regex fallback for tool definitions in unparseable source."""
     results: list[ParsedSkill] = []
-    pattern = re.compile(
-        r"""create_tool_from_function\s*\(\s*(\w+)\s*\)""",
-    )
-    for match in pattern.finditer(source):
+    for match in _CREATE_TOOL_FALLBACK_PATTERN.finditer(source):
         results.append(
             _build_skill(match.group(1), "", source, file_path, source),
         )
@@ -193,15 +189,12 @@ def extract_pipeline_components(
     Returns:
         List of ParsedSkill instances for each pipeline component found.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    index = index_module(source)
+    if index is None:
         return []
 
     results: list[ParsedSkill] = []
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Call):
-            continue
+    for node in index.calls:
         if not _is_add_component_call(node):
             continue
         comp_name, comp_type = _parse_add_component(node)
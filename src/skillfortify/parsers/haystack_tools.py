@@ -13,96 +13,64 @@ References:
 from __future__ import annotations
 
 import ast
-import re
+import functools
+from collections.abc import Iterator
 from pathlib import Path
 
 from skillfortify.parsers.base import ParsedSkill, SkillParser
-
-FORMAT_NAME = "haystack"
-
-_URL_PATTERN = re.compile(r"https?://[^\s\"'`)\]>]+")
-
-_ENV_VAR_PATTERN = re.compile(
-    r"""(?:"""
-    r"""\$\{?([A-Z][A-Z0-9_]{1,})\}?"""
-    r"""|os\.environ\[["']([A-Z][A-Z0-9_]{1,})["']\]"""
-    r"""|os\.getenv\(["']([A-Z][A-Z0-9_]{1,})["']\)"""
-    r""")""",
-    re.MULTILINE,
-)
-
-_SHELL_CALL_PATTERN = re.compile(
-    r"(?:subprocess\.(?:run|call|check_call|check_output|Popen)"
-    r"|os\.(?:system|popen))"
-    r"""\s*\(\s*["']([^"']+)["']""",
+from skillfortify.parsers.file_scan import iter_source_files, map_files, read_head
+from skillfortify.parsers.haystack_utils import (
+    extract_env_vars,
+    extract_imports,
+    extract_shell_commands,
+    extract_urls,
 )
 
-_SECRET_FROM_ENV_PATTERN = re.compile(
-    r"""Secret\.from_env_var\(\s*["']([A-Z][A-Z0-9_]*)["']\s*\)""",
-)
+FORMAT_NAME = "haystack"
 
 _HAYSTACK_IMPORT_MARKERS = (
     "from haystack",
     "import haystack",
 )
+_HAYSTACK_IMPORT_MARKERS_B = tuple(marker.encode() for marker in _HAYSTACK_IMPORT_MARKERS)
+
 
 # ---------------------------------------------------------------------------
-# Low-level extraction helpers
+# Detection and skill-building helpers
 # ---------------------------------------------------------------------------
 
 
-def _extract_urls(text: str) -> list[str]:
-    """Extract all HTTP/HTTPS URLs from text."""
-    return _URL_PATTERN.findall(text)
-
-
-def _extract_env_vars(text: str) -> list[str]:
-    """Extract unique environment variable names from text.
+def _has_haystack_imports(text: str) -> bool:
+    """Check if text contains Haystack import statements.
 
-    Captures os.environ[], os.getenv(), $VAR, and Secret.from_env_var().
+    Text that never mentions ``haystack`` is rejected with a single scan
+    before the per-marker checks.
     """
-    found: set[str] = set()
-    for match in _ENV_VAR_PATTERN.finditer(text):
-        for group in match.groups():
-            if group:
-                found.add(group)
-    for match in _SECRET_FROM_ENV_PATTERN.finditer(text):
-        found.add(match.group(1))
-    return sorted(found)
-
+    if "haystack" not in text:
+        return False
+    return any(marker in text for marker in _HAYSTACK_IMPORT_MARKERS)
 
-def _extract_shell_commands(text: str) -> list[str]:
-    """Extract shell commands from subprocess/os calls in source."""
-    return _SHELL_CALL_PATTERN.findall(text)
 
+@functools.lru_cache(maxsize=1024)
+def _probe_haystack_file(path: Path, mtime_ns: int, size: int) -> bool:
+    """Check a file's first bytes for Haystack imports, cached per revision.
 
-def _extract_imports(text: str) -> list[str]:
-    """Extract top-level import package names via AST, regex fallback."""
-    imports: list[str] = []
-    try:
-        tree = ast.parse(text)
-    except SyntaxError:
-        for line in text.splitlines():
-            stripped = line.strip()
-            if stripped.startswith(("import ", "from ")):
-                parts = stripped.split()
-                if len(parts) >= 2:
-                    imports.append(parts[1].split(".")[0])
-        return sorted(set(imports))
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append(alias.name.split(".")[0])
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                imports.append(node.module.split(".")[0])
-    return sorted(set(imports))
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    file is probed again. A head that is not valid UTF-8 fails the probe,
+    since ``parse`` could not read the file either.
+    """
+    head = read_head(path)
+    if head is None or b"haystack" not in head:
+        return False
+    return any(marker in head for marker in _HAYSTACK_IMPORT_MARKERS_B)
 
 
-def _has_haystack_imports(text: str) -> bool:
-    """Check if text contains Haystack import statements."""
-    return any(marker in text for marker in _HAYSTACK_IMPORT_MARKERS)
+def _read_source(path: Path) -> str | None:
+    """Read a file as UTF-8, or return None if it cannot be read."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
 
 
 def _get_kwarg_str(call: ast.Call, key: str) -> str:
@@ -130,20 +98,25 @@ def _build_skill(
         description=description,
         declared_capabilities=capabilities or [],
         code_blocks=[body] if body else [],
-        urls=_extract_urls(body),
-        env_vars_referenced=_extract_env_vars(body),
-        shell_commands=_extract_shell_commands(body),
-        dependencies=_extract_imports(source),
+        urls=extract_urls(body),
+        env_vars_referenced=extract_env_vars(body),
+        shell_commands=extract_shell_commands(body),
+        dependencies=extract_imports(source),
         raw_content=source,
     )
 
 
 # ---------------------------------------------------------------------------
 # Backward-compatible aliases for the extraction functions that moved to
-# haystack_extractors.  Tests and external callers can still import from
-# this module without breaking.
+# haystack_extractors and haystack_utils.  Tests and external callers can
+# still import from this module without breaking.
 # ---------------------------------------------------------------------------
 
+_extract_urls = extract_urls
+_extract_env_vars = extract_env_vars
+_extract_shell_commands = extract_shell_commands
+_extract_imports = extract_imports
+
 
 def _extract_tool_definitions(
     source: str,
@@ -185,8 +158,11 @@ class HaystackParser(SkillParser):
     """
 
     def can_parse(self, path: Path) -> bool:
-        """Check if the directory contains Haystack definitions."""
-        return bool(self._find_haystack_files(path))
+        """Check if the directory contains Haystack definitions.
+
+        Stops at the first matching file instead of probing them all.
+        """
+        return next(self._iter_haystack_files(path), None) is not None
 
     def parse(self, path: Path) -> list[ParsedSkill]:
         """Parse all Haystack tools and pipelines in the directory."""
@@ -195,31 +171,32 @@ class HaystackParser(SkillParser):
             extract_tool_definitions,
         )
 
+        # Reads of many files overlap on a thread pool; results keep file order.
+        py_files = list(self._iter_haystack_files(path))
+        sources = map_files(_read_source, py_files)
+
         results: list[ParsedSkill] = []
-        for py_file in self._find_haystack_files(path):
-            try:
-                source = py_file.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+        for py_file, source in zip(py_files, sources):
+            if source is None:
                 continue
             results.extend(extract_tool_definitions(source, py_file))
             results.extend(extract_pipeline_components(source, py_file))
         return results
 
-    def _find_haystack_files(self, path: Path) -> list[Path]:
-        """Find Python files containing Haystack definitions."""
-        candidates: list[Path] = []
+    def _iter_haystack_files(self, path: Path) -> Iterator[Path]:
+        """Yield Python files whose head imports Haystack.
+
+        Each search directory is listed with one ``os.scandir`` pass, whose
+        entries filter out non-files without extra syscalls. Only the first
+        ``HEAD_BYTES`` of each file are read, and the result is cached, so
+        ``can_parse`` followed by ``parse`` reads each head once.
+        """
         search_dirs = [path]
         for sub_name in ("pipelines", "tools", "agents", "components"):
             sub = path / sub_name
             if sub.is_dir():
                 search_dirs.append(sub)
 
-        for search_dir in search_dirs:
-            for py_file in sorted(search_dir.glob("*.py")):
-                try:
-                    head = py_file.read_text(encoding="utf-8")[:4096]
-                except (OSError, UnicodeDecodeError):
-                    continue
-                if _has_haystack_imports(head):
-                    candidates.append(py_file)
-        return candidates
+        for py_file, st in iter_source_files(search_dirs, ".py"):
+            if _probe_haystack_file(py_file, st.st_mtime_ns, st.st_size):
+                yield py_file
@@ -0,0 +1,121 @@
+"""Text and AST extraction utilities for the Haystack parser.
+
+Provides the compiled regex patterns and helpers that pull URLs,
+environment variables, shell commands and import names out of Python
+source, plus a per-source cache of a one-pass index of the calls,
+function definitions and imports of a module. Shared by
+``haystack_tools.py`` and ``haystack_extractors.py``.
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import re
+
+_URL_PATTERN = re.compile(r"https?://[^\s\"'`)\]>]+")
+
+_ENV_VAR_PATTERN = re.compile(
+    r"""(?:"""
+    r"""\$\{?([A-Z][A-Z0-9_]{1,})\}?"""
+    r"""|os\.environ\[["']([A-Z][A-Z0-9_]{1,})["']\]"""
+    r"""|os\.getenv\(["']([A-Z][A-Z0-9_]{1,})["']\)"""
+    r""")""",
+    re.MULTILINE,
+)
+
+_SHELL_CALL_PATTERN = re.compile(
+    r"(?:subprocess\.(?:run|call|check_call|check_output|Popen)"
+    r"|os\.(?:system|popen))"
+    r"""\s*\(\s*["']([^"']+)["']""",
+)
+
+_SECRET_FROM_ENV_PATTERN = re.compile(
+    r"""Secret\.from_env_var\(\s*["']([A-Z][A-Z0-9_]*)["']\s*\)""",
+)
+
+# ---------------------------------------------------------------------------
+# Low-level extraction helpers
+# ---------------------------------------------------------------------------
+
+
+def extract_urls(text: str) -> list[str]:
+    """Extract all HTTP/HTTPS URLs from text."""
+    return _URL_PATTERN.findall(text)
+
+
+def extract_env_vars(text: str) -> list[str]:
+    """Extract unique environment variable names from text.
+
+    Captures os.environ[], os.getenv(), $VAR, and Secret.from_env_var().
+    """
+    found: set[str] = set()
+    for match in _ENV_VAR_PATTERN.finditer(text):
+        for group in match.groups():
+            if group:
+                found.add(group)
+    for match in _SECRET_FROM_ENV_PATTERN.finditer(text):
+        found.add(match.group(1))
+    return sorted(found)
+
+
+def extract_shell_commands(text: str) -> list[str]:
+    """Extract shell commands from subprocess/os calls in source."""
+    return _SHELL_CALL_PATTERN.findall(text)
+
+
+class ModuleIndex:
+    """Calls, function definitions and imports of a module, from one walk.
+
+    Tool extraction, pipeline extraction and import collection each used
+    to walk the tree separately. Nodes keep ``ast.walk`` order, so results
+    come out in the same order as those separate walks produced.
+    """
+
+    __slots__ = ("calls", "functions", "imports")
+
+    def __init__(self, tree: ast.Module) -> None:
+        self.calls: list[ast.Call] = []
+        self.functions: list[ast.FunctionDef] = []
+        imports: set[str] = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                self.calls.append(node)
+            elif isinstance(node, ast.FunctionDef):
+                self.functions.append(node)
+            elif isinstance(node, ast.Import):
+                imports.update(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                imports.add(node.module.split(".")[0])
+        self.imports: tuple[str, ...] = tuple(sorted(imports))
+
+
+@functools.lru_cache(maxsize=128)
+def index_module(source: str) -> ModuleIndex | None:
+    """Return the shared index of ``source``, or None if it does not parse.
+
+    Only the index is cached; the tree it was built from is not kept
+    separately. The index is shared by every caller and must not be
+    mutated.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    return ModuleIndex(tree)
+
+
+def extract_imports(text: str) -> list[str]:
+    """Extract top-level import package names via AST, regex fallback."""
+    index = index_module(text)
+    if index is not None:
+        return list(index.imports)
+
+    imports: list[str] = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith(("import ", "from ")):
+            parts = stripped.split()
+            if len(parts) >= 2:
+                imports.append(parts[1].split(".")[0])
+    return sorted(set(imports))
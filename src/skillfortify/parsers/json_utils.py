@@ -0,0 +1,41 @@
+"""JSON loading shared by the parsers that read JSON manifests.
+
+orjson is an optional speedup (the ``speedups`` extra). It is stricter
+than the stdlib parser: it rejects ``NaN``/``Infinity`` literals and any
+input that is not UTF-8, both of which ``json.loads`` accepts. ``loads``
+retries such input with ``json.loads`` so that what a parser reports does
+not depend on whether orjson is installed.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+_orjson_loads: Callable[[bytes], Any] | None
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+
+def loads(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when installed and stdlib json otherwise.
+
+    Args:
+        raw: JSON document; UTF-8, UTF-16 or UTF-32.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+        UnicodeDecodeError: If the bytes are not valid in any JSON encoding.
+    """
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(raw)
+        except ValueError:
+            pass
+    return json.loads(raw)
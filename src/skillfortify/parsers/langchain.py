@@ -9,10 +9,13 @@ imports.
 from __future__ import annotations
 
 import ast
+import functools
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
 from skillfortify.parsers.base import ParsedSkill, SkillParser
+from skillfortify.parsers.file_scan import iter_source_files, read_head
 
 _URL_PATTERN = re.compile(r"https?://[^\s\"'`)\]>]+")
 
@@ -32,12 +35,14 @@ _SHELL_CALL_PATTERN = re.compile(
     r"""\s*\(\s*["']([^"']+)["']""",
 )
 
-# LangChain import markers -- used for fast can_parse probe.
+# LangChain import markers -- probed as bytes against each file's head.
 _LANGCHAIN_IMPORT_MARKERS = (
-    "from langchain",
-    "from langchain_core",
-    "import langchain",
+    b"from langchain",
+    b"from langchain_core",
+    b"import langchain",
 )
+# Tool definitions in files without a LangChain import in their head.
+_TOOL_DEFINITION_MARKER = re.compile(rb"@tool\b|class\s+\w+\s*\(\s*BaseTool\s*\)")
 
 # Patterns that indicate a directory is a tools directory.
 _TOOL_DIR_NAMES = {"tools", "langchain_tools"}
@@ -88,19 +93,23 @@ def _extract_imports(text: str) -> list[str]:
     return sorted(set(imports))
 
 
-def _has_langchain_imports(text: str) -> bool:
-    """Check if text contains LangChain import statements."""
-    return any(marker in text for marker in _LANGCHAIN_IMPORT_MARKERS)
+@functools.lru_cache(maxsize=1024)
+def _probe_tool_file(path: Path, mtime_ns: int, size: int) -> bool:
+    """Check a file's head for LangChain markers, cached per file revision.
 
-
-def _has_tool_decorator(text: str) -> bool:
-    """Check if text contains @tool decorator."""
-    return bool(re.search(r"@tool\b", text))
-
-
-def _has_basetool_subclass(text: str) -> bool:
-    """Check if text contains a BaseTool subclass."""
-    return bool(re.search(r"class\s+\w+\s*\(\s*BaseTool\s*\)", text))
+    Plain substring checks reject most non-LangChain files before the
+    definition regex runs, and a head that is not valid UTF-8 is rejected
+    since ``parse`` could not read it. ``mtime_ns`` and ``size`` only key
+    the cache.
+    """
+    head = read_head(path)
+    if head is None:
+        return False
+    if b"langchain" in head and any(m in head for m in _LANGCHAIN_IMPORT_MARKERS):
+        return True
+    if b"@tool" not in head and b"BaseTool" not in head:
+        return False
+    return _TOOL_DEFINITION_MARKER.search(head) is not None
 
 
 def _extract_tools_from_source(source: str, file_path: Path) -> list[ParsedSkill]:
@@ -243,12 +252,12 @@ class LangChainParser(SkillParser):
 
     def can_parse(self, path: Path) -> bool:
         """Return True if directory contains LangChain tool files."""
-        return any(self._find_tool_files(path))
+        return next(self._iter_tool_files(path), None) is not None
 
     def parse(self, path: Path) -> list[ParsedSkill]:
         """Parse all LangChain tool files and return ParsedSkill list."""
         results: list[ParsedSkill] = []
-        for py_file in self._find_tool_files(path):
+        for py_file in self._iter_tool_files(path):
             try:
                 source = py_file.read_text(encoding="utf-8")
             except (OSError, UnicodeDecodeError):
@@ -256,24 +265,18 @@ class LangChainParser(SkillParser):
             results.extend(_extract_tools_from_source(source, py_file))
         return results
 
-    def _find_tool_files(self, path: Path) -> list[Path]:
-        """Find Python files with LangChain markers in root or tools/ dirs."""
-        candidates: list[Path] = []
+    def _iter_tool_files(self, path: Path) -> Iterator[Path]:
+        """Yield Python files with LangChain markers in root or tools/ dirs.
+
+        Only the first ``HEAD_BYTES`` of each file are read here, so
+        ``can_parse`` stops at the first match without decoding or
+        parsing anything.
+        """
         search_dirs = [path]
         for dir_name in _TOOL_DIR_NAMES:
             sub = path / dir_name
             if sub.is_dir():
                 search_dirs.append(sub)
-        for search_dir in search_dirs:
-            for py_file in sorted(search_dir.glob("*.py")):
-                try:
-                    head = py_file.read_text(encoding="utf-8")[:4096]
-                except (OSError, UnicodeDecodeError):
-                    continue
-                if (
-                    _has_langchain_imports(head)
-                    or _has_tool_decorator(head)
-                    or _has_basetool_subclass(head)
-                ):
-                    candidates.append(py_file)
-        return candidates
+        for py_file, st in iter_source_files(search_dirs, ".py"):
+            if _probe_tool_file(py_file, st.st_mtime_ns, st.st_size):
+                yield py_file
@@ -20,10 +20,13 @@ References:
 from __future__ import annotations
 
 import ast
+import functools
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
 from skillfortify.parsers.base import ParsedSkill, SkillParser
+from skillfortify.parsers.file_scan import iter_source_files, read_head
 from skillfortify.parsers.llamaindex_extractors import (
     build_skill,
     is_agent_from_tools,
@@ -36,17 +39,30 @@ from skillfortify.parsers.llamaindex_extractors import (
     parse_query_engine_tool,
 )
 
+# Probed as bytes against each file's head.
 _LLAMA_IMPORT_MARKERS = (
-    "from llama_index",
-    "import llama_index",
+    b"from llama_index",
+    b"import llama_index",
 )
 
 _TOOL_DIR_NAMES = {"tools", "llamaindex_tools", "agents"}
 
 
-def _has_llama_imports(text: str) -> bool:
-    """Check if *text* contains LlamaIndex import statements."""
-    return any(marker in text for marker in _LLAMA_IMPORT_MARKERS)
+@functools.lru_cache(maxsize=1024)
+def _probe_tool_file(path: Path, mtime_ns: int, size: int) -> bool:
+    """Check whether a file's head imports LlamaIndex, cached per revision.
+
+    Files whose head never mentions ``llama_index`` are rejected with one
+    substring scan, and a head that is not valid UTF-8 is rejected since
+    ``parse`` could not read it. ``mtime_ns`` and ``size`` only key the
+    cache.
+    """
+    head = read_head(path)
+    if head is None:
+        return False
+    if b"llama_index" not in head:
+        return False
+    return any(marker in head for marker in _LLAMA_IMPORT_MARKERS)
 
 
 def _extract_tools_from_source(
@@ -136,7 +152,7 @@ class LlamaIndexParser(SkillParser):
             True if at least one Python file with LlamaIndex imports
             was found.
         """
-        return bool(self._find_tool_files(path))
+        return next(self._iter_tool_files(path), None) is not None
 
     def parse(self, path: Path) -> list[ParsedSkill]:
         """Parse all LlamaIndex tool files under *path*.
@@ -152,7 +168,7 @@ class LlamaIndexParser(SkillParser):
             or all files are malformed.
         """
         results: list[ParsedSkill] = []
-        for py_file in self._find_tool_files(path):
+        for py_file in self._iter_tool_files(path):
             try:
                 source = py_file.read_text(encoding="utf-8")
             except (OSError, UnicodeDecodeError):
@@ -160,31 +176,25 @@ class LlamaIndexParser(SkillParser):
             results.extend(_extract_tools_from_source(source, py_file))
         return results
 
-    def _find_tool_files(self, path: Path) -> list[Path]:
-        """Find Python files containing LlamaIndex import markers.
+    def _iter_tool_files(self, path: Path) -> Iterator[Path]:
+        """Yield Python files containing LlamaIndex import markers.
 
         Searches the root directory and well-known subdirectories for
         ``.py`` files whose first 4 KiB contain a LlamaIndex import
-        statement.
+        statement. Only that head is read, so ``can_parse`` returns at
+        the first match without decoding or parsing any file.
 
         Args:
             path: Root directory to search.
 
-        Returns:
-            Sorted list of candidate Python file paths.
+        Yields:
+            Candidate Python file paths, sorted within each directory.
         """
-        candidates: list[Path] = []
         search_dirs = [path]
         for dir_name in _TOOL_DIR_NAMES:
             sub = path / dir_name
             if sub.is_dir():
                 search_dirs.append(sub)
-        for search_dir in search_dirs:
-            for py_file in sorted(search_dir.glob("*.py")):
-                try:
-                    head = py_file.read_text(encoding="utf-8")[:4096]
-                except (OSError, UnicodeDecodeError):
-                    continue
-                if _has_llama_imports(head):
-                    candidates.append(py_file)
-        return candidates
+        for py_file, st in iter_source_files(search_dirs, ".py"):
+            if _probe_tool_file(py_file, st.st_mtime_ns, st.st_size):
+                yield py_file
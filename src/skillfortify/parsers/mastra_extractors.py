@@ -0,0 +1,161 @@
+"""Security metadata extraction for Mastra TypeScript/JS sources.
+
+Provides the URL, environment variable, shell execution and capability
+scanners used by the Mastra parser. ``scan_source`` runs them once per
+file, skipping every scanner whose literal anchor never occurs. The
+``package.json`` helpers read npm dependencies and Mastra detection.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+from skillfortify.parsers.json_utils import loads as json_loads
+
+# ---------------------------------------------------------------------------
+# Compiled patterns
+# ---------------------------------------------------------------------------
+
+_URL_PATTERN = re.compile(r"https?://[^\s\"'`,)\]}>]+")
+
+_ENV_VAR_PATTERN = re.compile(r"process\.env\.(\w+)")
+
+_ENV_VAR_BRACKET_PATTERN = re.compile(r"""process\.env\[["'](\w+)["']\]""")
+
+_SHELL_EXEC_PATTERNS = (
+    re.compile(r"\bchild_process\b"),
+    re.compile(r"\bexec\s*\("),
+    re.compile(r"\bexecSync\s*\("),
+    re.compile(r"\bspawn\s*\("),
+    re.compile(r"\bspawnSync\s*\("),
+)
+
+_NET_PATTERNS = (re.compile(r"\bfetch\s*\("), re.compile(r"\baxios\b"), re.compile(r"\bhttp\.\w+"))
+_FS_PATTERN = re.compile(r"\bfs\.\w+")
+
+_SENSITIVE_ENV = re.compile(
+    r"(SECRET|KEY|TOKEN|PASSWORD|CREDENTIAL|PRIVATE)",
+    re.IGNORECASE,
+)
+
+# Literal anchors, one substring test each, decide which scanners run.
+# Every scanner above needs at least one of them to match, so scanners
+# whose anchors are absent are skipped. Each anchor is tested on its own:
+# anchors overlap ("child_process" contains "process"), so one combined
+# regex would hide the shorter match. "http" covers URLs and http.* calls,
+# "exec"/"spawn" cover their *Sync variants.
+_ANCHORS = ("process.env", "child_process", "exec", "spawn", "fetch", "axios", "http", "fs.")
+_SHELL_ANCHORS = frozenset({"child_process", "exec", "spawn"})
+_NET_ANCHORS = frozenset({"fetch", "axios", "http"})
+
+
+# ---------------------------------------------------------------------------
+# Scanners
+# ---------------------------------------------------------------------------
+
+
+def extract_env_vars(text: str) -> list[str]:
+    """Extract unique environment variable names from TypeScript source."""
+    found: set[str] = set()
+    found.update(_ENV_VAR_PATTERN.findall(text))
+    found.update(_ENV_VAR_BRACKET_PATTERN.findall(text))
+    return sorted(found)
+
+
+def extract_urls(text: str) -> list[str]:
+    """Extract all HTTP/HTTPS URLs from text."""
+    return _URL_PATTERN.findall(text)
+
+
+def extract_shell_commands(text: str) -> list[str]:
+    """Detect shell execution patterns in TypeScript source."""
+    return [p.pattern for p in _SHELL_EXEC_PATTERNS if p.search(text)]
+
+
+def extract_capabilities(
+    text: str,
+    env_vars: list[str],
+    shell_commands: list[str],
+    anchors: frozenset[str],
+) -> list[str]:
+    """Infer declared capabilities from code patterns.
+
+    Args:
+        text: File source.
+        env_vars: Environment variables referenced by the source.
+        shell_commands: Shell execution patterns found in the source.
+        anchors: Literal anchors present in the source.
+
+    Returns:
+        Sorted capability strings.
+    """
+    caps: set[str] = set()
+    if env_vars:
+        caps.add("env:read")
+    if anchors & _NET_ANCHORS and any(p.search(text) for p in _NET_PATTERNS):
+        caps.update(("network:read", "network:write"))
+    if "fs." in anchors and _FS_PATTERN.search(text):
+        caps.update(("filesystem:read", "filesystem:write"))
+    if shell_commands:
+        caps.add("system:execute")
+    if any(_SENSITIVE_ENV.search(v) for v in env_vars):
+        caps.add("credentials:read")
+    return sorted(caps)
+
+
+def scan_source(text: str) -> tuple[list[str], list[str], list[str], list[str]]:
+    """Scan a file once for the security metadata shared by all its skills.
+
+    Returns:
+        ``(capabilities, urls, env_vars, shell_commands)``.
+    """
+    anchors = frozenset(anchor for anchor in _ANCHORS if anchor in text)
+    env_vars = extract_env_vars(text) if "process.env" in anchors else []
+    urls = extract_urls(text) if "http" in anchors else []
+    shell_commands = extract_shell_commands(text) if anchors & _SHELL_ANCHORS else []
+    caps = extract_capabilities(text, env_vars, shell_commands, anchors)
+    return caps, urls, env_vars, shell_commands
+
+
+# ---------------------------------------------------------------------------
+# package.json
+# ---------------------------------------------------------------------------
+
+
+def extract_npm_deps(path: Path) -> list[str]:
+    """Extract dependency names from package.json in the directory."""
+    pkg_path = path / "package.json"
+    if not pkg_path.is_file():
+        return []
+    try:
+        data = json_loads(pkg_path.read_bytes())
+    except (OSError, json.JSONDecodeError, ValueError):
+        return []
+    if not isinstance(data, dict):
+        return []
+    deps: set[str] = set()
+    for key in ("dependencies", "devDependencies", "peerDependencies"):
+        section = data.get(key, {})
+        if isinstance(section, dict):
+            deps.update(section.keys())
+    return sorted(deps)
+
+
+def package_json_has_mastra(directory: Path) -> bool:
+    """Check if package.json lists @mastra/core as a dependency."""
+    pkg_path = directory / "package.json"
+    if not pkg_path.is_file():
+        return False
+    try:
+        data = json_loads(pkg_path.read_bytes())
+    except (OSError, json.JSONDecodeError, ValueError):
+        return False
+    if not isinstance(data, dict):
+        return False
+    for dep_key in ("dependencies", "devDependencies", "peerDependencies"):
+        deps = data.get(dep_key, {})
+        if isinstance(deps, dict) and "@mastra/core" in deps:
+            return True
+    return False
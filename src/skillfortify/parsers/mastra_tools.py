@@ -3,26 +3,35 @@
 Detects Mastra projects via ``mastra.config.ts``, ``package.json`` with
 ``@mastra/core``, or TS/JS files importing from ``@mastra/core``.
 Extracts ``createTool()`` calls and ``new Agent()`` definitions plus
-security metadata (URLs, env vars, shell calls, capabilities).
+security metadata (URLs, env vars, shell calls, capabilities) gathered
+by ``mastra_extractors``.
 """
 
 from __future__ import annotations
 
-import json
+import functools
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
 from skillfortify.parsers.base import ParsedSkill, SkillParser
+from skillfortify.parsers.file_scan import HEAD_BYTES, iter_source_files, map_files
+from skillfortify.parsers.mastra_extractors import (
+    extract_npm_deps,
+    package_json_has_mastra,
+    scan_source,
+)
 
 # ── Compiled regex patterns ───────────────────────────────────────────────
 
+# Detection runs on raw file heads, so these two patterns are bytes patterns.
 _MASTRA_IMPORT_PATTERN = re.compile(
-    r"""(?:import\s+.*from\s+["']@mastra/core"""
-    r"""|require\s*\(\s*["']@mastra/core)""",
+    rb"""(?:import\s+.*from\s+["']@mastra/core"""
+    rb"""|require\s*\(\s*["']@mastra/core)""",
 )
 
 _CREATE_TOOL_BLOCK = re.compile(
-    r"createTool\s*\(\s*\{",
+    rb"createTool\s*\(\s*\{",
     re.MULTILINE,
 )
 
@@ -46,28 +55,6 @@ _AGENT_INSTRUCTIONS_PATTERN = re.compile(
     re.DOTALL,
 )
 
-_URL_PATTERN = re.compile(r"https?://[^\s\"'`,)\]}>]+")
-
-_ENV_VAR_PATTERN = re.compile(r"process\.env\.(\w+)")
-
-_ENV_VAR_BRACKET = re.compile(r"""process\.env\[["'](\w+)["']\]""")
-
-_SHELL_EXEC_PATTERNS = (
-    re.compile(r"\bchild_process\b"),
-    re.compile(r"\bexec\s*\("),
-    re.compile(r"\bexecSync\s*\("),
-    re.compile(r"\bspawn\s*\("),
-    re.compile(r"\bspawnSync\s*\("),
-)
-
-_NET_PATTERNS = (re.compile(r"\bfetch\s*\("), re.compile(r"\baxios\b"), re.compile(r"\bhttp\.\w+"))
-_FS_PATTERN = re.compile(r"\bfs\.\w+")
-
-_SENSITIVE_ENV = re.compile(
-    r"(SECRET|KEY|TOKEN|PASSWORD|CREDENTIAL|PRIVATE)",
-    re.IGNORECASE,
-)
-
 _MASTRA_CONFIG_FILES = ("mastra.config.ts", "mastra.config.js")
 
 _TS_EXTENSIONS = (".ts", ".js", ".tsx", ".jsx")
@@ -76,70 +63,28 @@ _TS_EXTENSIONS = (".ts", ".js", ".tsx", ".jsx")
 # ── Extraction helpers ────────────────────────────────────────────────────
 
 
-def _extract_env_vars(text: str) -> list[str]:
-    """Extract unique environment variable names from TypeScript source."""
-    found: set[str] = set()
-    found.update(_ENV_VAR_PATTERN.findall(text))
-    found.update(_ENV_VAR_BRACKET.findall(text))
-    return sorted(found)
-
-
-def _extract_urls(text: str) -> list[str]:
-    """Extract all HTTP/HTTPS URLs from text."""
-    return _URL_PATTERN.findall(text)
-
-
-def _extract_shell_commands(text: str) -> list[str]:
-    """Detect shell execution patterns in TypeScript source."""
-    return [p.pattern for p in _SHELL_EXEC_PATTERNS if p.search(text)]
-
+def _has_mastra_import(content: bytes) -> bool:
+    """Check if content contains a Mastra SDK import or require."""
+    return b"@mastra/core" in content and _MASTRA_IMPORT_PATTERN.search(content) is not None
 
-def _extract_capabilities(text: str, env_vars: list[str]) -> list[str]:
-    """Infer declared capabilities from code patterns."""
-    caps: set[str] = set()
-    if env_vars:
-        caps.add("env:read")
-    if any(p.search(text) for p in _NET_PATTERNS):
-        caps.update(("network:read", "network:write"))
-    if _FS_PATTERN.search(text):
-        caps.update(("filesystem:read", "filesystem:write"))
-    if any(p.search(text) for p in _SHELL_EXEC_PATTERNS):
-        caps.add("system:execute")
-    if any(_SENSITIVE_ENV.search(v) for v in env_vars):
-        caps.add("credentials:read")
-    return sorted(caps)
 
+@functools.lru_cache(maxsize=1024)
+def _probe_ts_file(path: Path, mtime_ns: int, size: int) -> bool:
+    """Check a file's first bytes for Mastra markers, cached per revision.
 
-def _extract_npm_deps(path: Path) -> list[str]:
-    """Extract dependency names from package.json in the directory."""
-    pkg_path = path / "package.json"
-    if not pkg_path.is_file():
-        return []
+    ``mtime_ns`` and ``size`` only key the cache.
+    """
     try:
-        data = json.loads(pkg_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError, ValueError):
-        return []
-    if not isinstance(data, dict):
-        return []
-    deps: set[str] = set()
-    for key in ("dependencies", "devDependencies", "peerDependencies"):
-        section = data.get(key, {})
-        if isinstance(section, dict):
-            deps.update(section.keys())
-    return sorted(deps)
-
-
-def _has_mastra_import(content: str) -> bool:
-    """Check if content contains a Mastra SDK import or require."""
-    return bool(_MASTRA_IMPORT_PATTERN.search(content))
+        with path.open("rb") as handle:
+            head = handle.read(HEAD_BYTES)
+    except OSError:
+        return False
+    if _has_mastra_import(head):
+        return True
+    return b"createTool" in head and _CREATE_TOOL_BLOCK.search(head) is not None
 
 
-def _read_safe(filepath: Path) -> str:
-    """Read a file safely, returning empty string on failure."""
-    try:
-        return filepath.read_text(encoding="utf-8", errors="ignore")
-    except OSError:
-        return ""
+_Scan = tuple[list[str], list[str], list[str], list[str]]
 
 
 def _build_skill(
@@ -148,10 +93,14 @@ def _build_skill(
     source: str,
     filepath: Path,
     deps: list[str],
+    scan: _Scan,
     instructions: str = "",
 ) -> ParsedSkill:
-    """Build a ParsedSkill from extracted Mastra metadata."""
-    env_vars = _extract_env_vars(source)
+    """Build a ParsedSkill from extracted Mastra metadata.
+
+    Every skill gets its own copies of the scanned lists.
+    """
+    caps, urls, env_vars, shell_commands = scan
     return ParsedSkill(
         name=name,
         version="unknown",
@@ -159,65 +108,68 @@ def _build_skill(
         format="mastra",
         description=description,
         instructions=instructions,
-        declared_capabilities=_extract_capabilities(source, env_vars),
+        declared_capabilities=list(caps),
         dependencies=deps,
         code_blocks=[source],
-        urls=_extract_urls(source),
-        env_vars_referenced=env_vars,
-        shell_commands=_extract_shell_commands(source),
+        urls=list(urls),
+        env_vars_referenced=list(env_vars),
+        shell_commands=list(shell_commands),
         raw_content=source,
     )
 
 
-def _parse_ts_file(
-    filepath: Path,
-    deps: list[str],
-) -> list[ParsedSkill]:
-    """Parse a single TypeScript/JS file for Mastra tool and agent defs."""
-    source = _read_safe(filepath)
-    if not source:
-        return []
+# One entry per definition: (name, description, instructions).
+_Definition = tuple[str, str, str]
+
 
-    results: list[ParsedSkill] = []
+def _load_ts_file(filepath: Path) -> tuple[str, _Scan, tuple[_Definition, ...]]:
+    """Read and scan a TypeScript/JS file.
+
+    The scanned lists are shared by every definition in the file;
+    ``_build_skill`` copies them into each skill.
+
+    Returns:
+        The source, its security scan and the tool and agent definitions.
+    """
+    try:
+        raw = filepath.read_bytes()
+    except OSError:
+        raw = b""
+    source = raw.decode("utf-8", errors="ignore")
+
+    definitions: list[_Definition] = []
+
+    # Each pattern below needs its literal keyword, and a plain substring
+    # test rejects most files faster than a failed regex search.
 
     # Extract createTool() calls
-    tool_ids = _TOOL_ID_PATTERN.findall(source)
-    tool_descs = _TOOL_DESC_PATTERN.findall(source)
+    tool_ids = _TOOL_ID_PATTERN.findall(source) if "createTool" in source else []
+    tool_descs = _TOOL_DESC_PATTERN.findall(source) if tool_ids else []
     desc_map = dict(zip(tool_ids, tool_descs)) if tool_descs else {}
-
-    for tool_id in tool_ids:
-        desc = desc_map.get(tool_id, "")
-        results.append(_build_skill(tool_id, desc, source, filepath, deps))
+    definitions.extend((tool_id, desc_map.get(tool_id, ""), "") for tool_id in tool_ids)
 
     # Extract new Agent() definitions
-    agent_names = _AGENT_NAME_PATTERN.findall(source)
-    agent_instrs = _AGENT_INSTRUCTIONS_PATTERN.findall(source)
+    agent_names = _AGENT_NAME_PATTERN.findall(source) if "Agent" in source else []
+    agent_instrs = _AGENT_INSTRUCTIONS_PATTERN.findall(source) if agent_names else []
     instr_map = dict(zip(agent_names, agent_instrs)) if agent_instrs else {}
-
     for name in agent_names:
         instr = instr_map.get(name, "")
         desc = f"Mastra agent: {instr[:80]}" if instr else ""
-        results.append(_build_skill(name, desc, source, filepath, deps, instr))
+        definitions.append((name, desc, instr))
 
-    return results
+    return source, scan_source(source), tuple(definitions)
 
 
-def _package_json_has_mastra(directory: Path) -> bool:
-    """Check if package.json lists @mastra/core as a dependency."""
-    pkg_path = directory / "package.json"
-    if not pkg_path.is_file():
-        return False
-    try:
-        data = json.loads(pkg_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError, ValueError):
-        return False
-    if not isinstance(data, dict):
-        return False
-    for dep_key in ("dependencies", "devDependencies", "peerDependencies"):
-        deps = data.get(dep_key, {})
-        if isinstance(deps, dict) and "@mastra/core" in deps:
-            return True
-    return False
+def _parse_ts_file(
+    filepath: Path,
+    deps: list[str],
+) -> list[ParsedSkill]:
+    """Parse a single TypeScript/JS file for Mastra tool and agent defs."""
+    source, scan, definitions = _load_ts_file(filepath)
+    return [
+        _build_skill(name, desc, source, filepath, deps, scan, instr)
+        for name, desc, instr in definitions
+    ]
 
 
 # ── Main parser class ─────────────────────────────────────────────────────
@@ -245,9 +197,9 @@ class MastraParser(SkillParser):
         for cfg_name in _MASTRA_CONFIG_FILES:
             if (path / cfg_name).is_file():
                 return True
-        if _package_json_has_mastra(path):
+        if package_json_has_mastra(path):
             return True
-        return bool(self._find_mastra_files(path))
+        return next(self._iter_mastra_files(path), None) is not None
 
     def parse(self, path: Path) -> list[ParsedSkill]:
         """Parse all Mastra tools and agents in the directory.
@@ -260,34 +212,37 @@ class MastraParser(SkillParser):
         """
         if not path.is_dir():
             return []
-        deps = _extract_npm_deps(path)
+        deps = extract_npm_deps(path)
         results: list[ParsedSkill] = []
 
-        for ts_file in self._find_mastra_files(path):
-            results.extend(_parse_ts_file(ts_file, deps))
+        # Many files are read and scanned on a thread pool; results keep file order.
+        ts_files = list(self._iter_mastra_files(path))
+        for skills in map_files(functools.partial(_parse_ts_file, deps=deps), ts_files):
+            results.extend(skills)
 
-        # Also parse config files directly
+        # Also parse config files that the import probe did not pick up
+        scanned = set(ts_files)
         for cfg_name in _MASTRA_CONFIG_FILES:
             cfg_path = path / cfg_name
-            if cfg_path.is_file() and cfg_path not in {r.source_path for r in results}:
+            if cfg_path.is_file() and cfg_path not in scanned:
                 results.extend(_parse_ts_file(cfg_path, deps))
 
         return results
 
-    def _find_mastra_files(self, path: Path) -> list[Path]:
-        """Find TypeScript/JS files containing Mastra imports."""
-        candidates: list[Path] = []
+    def _iter_mastra_files(self, path: Path) -> Iterator[Path]:
+        """Yield TypeScript/JS files containing Mastra imports or tools.
+
+        Each search directory is listed with one ``os.scandir`` pass; the
+        entry type comes from the directory listing, so non-files are
+        dropped without a stat call of their own. Only the first
+        ``HEAD_BYTES`` of each file are probed, and the result is cached.
+        """
         search_dirs = [path]
         for sub_name in ("src", "tools", "agents", "mastra"):
             sub = path / sub_name
             if sub.is_dir():
                 search_dirs.append(sub)
 
-        for search_dir in search_dirs:
-            for ts_file in sorted(search_dir.glob("*")):
-                if ts_file.suffix not in _TS_EXTENSIONS:
-                    continue
-                head = _read_safe(ts_file)[:4096]
-                if _has_mastra_import(head) or _CREATE_TOOL_BLOCK.search(head):
-                    candidates.append(ts_file)
-        return candidates
+        for ts_file, st in iter_source_files(search_dirs, _TS_EXTENSIONS):
+            if _probe_ts_file(ts_file, st.st_mtime_ns, st.st_size):
+                yield ts_file
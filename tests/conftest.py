@@ -1,9 +1,40 @@
 """Shared fixtures for skillfortify tests."""
 
+import os
 import pathlib
+import sys
 
 import pytest
 
+_TMPFS_ROOT = "/dev/shm"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the opt-in ``--tmpfs`` flag."""
+    parser.addoption(
+        "--tmpfs",
+        action="store_true",
+        default=False,
+        help=f"root tmp_path under {_TMPFS_ROOT} (Linux only)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Root tmp_path on tmpfs when ``--tmpfs`` is given.
+
+    Parser tests write many small fixture files; on Linux ``/dev/shm``
+    keeps that setup off the disk. Nothing changes without the flag, and
+    an explicit ``--basetemp`` or ``PYTEST_DEBUG_TEMPROOT`` still wins.
+    pytest's numbered ``pytest-of-<user>/pytest-N`` rotation is kept so
+    concurrent runs and cleanup behave as usual.
+    """
+    if not config.getoption("tmpfs") or config.option.basetemp:
+        return
+    if sys.platform != "linux":
+        return
+    if os.path.isdir(_TMPFS_ROOT) and os.access(_TMPFS_ROOT, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", _TMPFS_ROOT)
+
 
 @pytest.fixture
 def sample_skill_dir(tmp_path: pathlib.Path) -> pathlib.Path:
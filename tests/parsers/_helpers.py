@@ -0,0 +1,63 @@
+"""Plain helper functions shared by the parser test modules.
+
+Fixtures stay in ``conftest.py``; these are ordinary functions that test
+modules and fixtures import directly.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+
+from skillfortify.parsers.base import ParsedSkill, SkillParser
+
+
+def link_or_copy(source: Path, dest: Path) -> None:
+    """Hard-link ``source`` to ``dest``, copying bytes across filesystems."""
+    try:
+        os.link(source, dest)
+    except OSError:
+        dest.write_bytes(source.read_bytes())
+
+
+def write_samples(directory: Path, files: Mapping[str, bytes]) -> Path:
+    """Write ``{relative path: bytes}`` under ``directory`` and return it.
+
+    Parent directories are created as needed, so a key such as
+    ``"tools/search.py"`` lays out a subdirectory.
+    """
+    for name, content in files.items():
+        target = directory / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+    return directory
+
+
+def samples_tree(
+    factory: pytest.TempPathFactory,
+    basename: str,
+    samples: Mapping[str, Mapping[str, bytes]],
+) -> dict[str, Path]:
+    """Materialise each sample layout as a subdirectory of one temp dir."""
+    root = factory.mktemp(basename)
+    return {key: write_samples(root / key, files) for key, files in samples.items()}
+
+
+def source_dir(factory: pytest.TempPathFactory, filename: str, source: bytes) -> Path:
+    """Create a fresh temp directory holding ``source`` as ``filename``."""
+    directory = factory.mktemp(filename.partition(".")[0])
+    (directory / filename).write_bytes(source)
+    return directory
+
+
+def parse_source(
+    parser: SkillParser,
+    factory: pytest.TempPathFactory,
+    filename: str,
+    source: bytes,
+) -> list[ParsedSkill]:
+    """Parse ``source`` written as ``filename`` into a fresh directory."""
+    return parser.parse(source_dir(factory, filename, source))
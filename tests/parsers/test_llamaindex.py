@@ -8,13 +8,19 @@ URLs, environment variables, dependencies, and code blocks.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 
+from skillfortify.parsers import llamaindex_tools
 from skillfortify.parsers.base import ParsedSkill
+from skillfortify.parsers.file_scan import HEAD_BYTES
 from skillfortify.parsers.llamaindex_tools import LlamaIndexParser
 
+from ._helpers import samples_tree, write_samples
+
 # ---------------------------------------------------------------------------
 # Inline source fragments
 # ---------------------------------------------------------------------------
@@ -26,6 +32,7 @@ _FUNCTION_TOOL = (
     "    return a * b\n\n"
     "tool = FunctionTool.from_defaults(fn=multiply)\n"
 )
+_FUNCTION_TOOL_BYTES = _FUNCTION_TOOL.encode()
 
 _NAMED_TOOL = (
     "from llama_index.core.tools import FunctionTool\n\n"
@@ -34,6 +41,7 @@ _NAMED_TOOL = (
     "tool = FunctionTool.from_defaults(\n"
     '    fn=compute, name="calculator", description="A simple calculator",\n)\n'
 )
+_NAMED_TOOL_BYTES = _NAMED_TOOL.encode()
 
 _QUERY_ENGINE = (
     "from llama_index.core.tools import QueryEngineTool, ToolMetadata\n\n"
@@ -41,6 +49,7 @@ _QUERY_ENGINE = (
     "    metadata=ToolMetadata(\n"
     '        name="doc_search", description="Search through documents",\n    ),\n)\n'
 )
+_QUERY_ENGINE_BYTES = _QUERY_ENGINE.encode()
 
 _REACT_AGENT = (
     "from llama_index.core.agent import ReActAgent\n"
@@ -51,12 +60,14 @@ _REACT_AGENT = (
     "tool = FunctionTool.from_defaults(fn=greet)\n"
     'agent = ReActAgent.from_tools([tool], llm=OpenAI(model="gpt-4"))\n'
 )
+_REACT_AGENT_BYTES = _REACT_AGENT.encode()
 
 _DATA_READER = (
     "from llama_index.readers.web import SimpleWebPageReader\n\n"
     "reader = SimpleWebPageReader(html_to_text=True)\n"
     'docs = reader.load_data(urls=["https://example.com/page"])\n'
 )
+_DATA_READER_BYTES = _DATA_READER.encode()
 
 _ENV_VARS = (
     "from llama_index.core.tools import FunctionTool\nimport os\n\n"
@@ -66,6 +77,7 @@ _ENV_VARS = (
     '    token = os.getenv("AUTH_TOKEN")\n    return x\n\n'
     "tool = FunctionTool.from_defaults(fn=secret_fn)\n"
 )
+_ENV_VARS_BYTES = _ENV_VARS.encode()
 
 _SHELL_CMD = (
     "from llama_index.core.tools import FunctionTool\nimport subprocess\n\n"
@@ -74,6 +86,7 @@ _SHELL_CMD = (
     '    return subprocess.run("ls -la /tmp", capture_output=True, text=True).stdout\n\n'
     "tool = FunctionTool.from_defaults(fn=run_cmd)\n"
 )
+_SHELL_CMD_BYTES = _SHELL_CMD.encode()
 
 _URL_TOOL = (
     "from llama_index.core.tools import FunctionTool\n\n"
@@ -82,6 +95,7 @@ _URL_TOOL = (
     '    return requests.get("https://api.example.com/v1/data").text\n\n'
     'tool = FunctionTool.from_defaults(fn=fetch, name="api_fetch")\n'
 )
+_URL_TOOL_BYTES = _URL_TOOL.encode()
 
 _MULTI_TOOLS = (
     "from llama_index.core.tools import FunctionTool, QueryEngineTool, ToolMetadata\n\n"
@@ -91,6 +105,7 @@ _MULTI_TOOLS = (
     "q = QueryEngineTool(query_engine=None,\n"
     '    metadata=ToolMetadata(name="search", description="Search docs"))\n'
 )
+_MULTI_TOOLS_BYTES = _MULTI_TOOLS.encode()
 
 _POSITIONAL_FN = (
     "from llama_index.core.tools import FunctionTool\n\n"
@@ -98,8 +113,13 @@ _POSITIONAL_FN = (
     '    """A helper."""\n    return x\n\n'
     "tool = FunctionTool.from_defaults(helper)\n"
 )
+_POSITIONAL_FN_BYTES = _POSITIONAL_FN.encode()
+
+_MALFORMED = "from llama_index.core.tools import FunctionTool\ntool = FunctionTool.from_defaults(\n"
+_MALFORMED_BYTES = _MALFORMED.encode()
 
-FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "llamaindex"
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "llamaindex"
+_FIXTURES_AVAILABLE = FIXTURES_DIR.is_dir()
 
 
 # ---------------------------------------------------------------------------
@@ -107,33 +127,113 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "llamaindex"
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> LlamaIndexParser:
+    """Shared LlamaIndexParser; the parser is stateless, so tests can reuse it."""
     return LlamaIndexParser()
 
 
-@pytest.fixture
-def fn_dir(tmp_path: Path) -> Path:
-    (tmp_path / "tools.py").write_text(_FUNCTION_TOOL)
-    return tmp_path
+_SAMPLES: dict[str, dict[str, bytes]] = {
+    "fn": {"tools.py": _FUNCTION_TOOL_BYTES},
+    "qe": {"query.py": _QUERY_ENGINE_BYTES},
+    "agent": {"agent.py": _REACT_AGENT_BYTES},
+    "reader": {"reader.py": _DATA_READER_BYTES},
+    "malformed": {"b.py": _MALFORMED_BYTES},
+    "env": {"e.py": _ENV_VARS_BYTES},
+    "shell": {"s.py": _SHELL_CMD_BYTES},
+    "url": {"u.py": _URL_TOOL_BYTES},
+}
+
+
+@pytest.fixture(scope="session")
+def llamaindex_samples(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    return samples_tree(tmp_path_factory, "llamaindex_samples", _SAMPLES)
+
+
+@pytest.fixture(scope="module")
+def fn_dir(llamaindex_samples: dict[str, Path]) -> Path:
+    return llamaindex_samples["fn"]
+
+
+@pytest.fixture(scope="module")
+def qe_dir(llamaindex_samples: dict[str, Path]) -> Path:
+    return llamaindex_samples["qe"]
+
+
+@pytest.fixture(scope="module")
+def agent_dir(llamaindex_samples: dict[str, Path]) -> Path:
+    return llamaindex_samples["agent"]
+
+
+@pytest.fixture(scope="module")
+def reader_dir(llamaindex_samples: dict[str, Path]) -> Path:
+    return llamaindex_samples["reader"]
+
+
+@pytest.fixture(scope="module")
+def fn_skills(parser: LlamaIndexParser, fn_dir: Path) -> list[ParsedSkill]:
+    return parser.parse(fn_dir)
+
+
+@pytest.fixture(scope="module")
+def qe_skills(parser: LlamaIndexParser, qe_dir: Path) -> list[ParsedSkill]:
+    return parser.parse(qe_dir)
+
+
+@pytest.fixture(scope="module")
+def agent_skills(parser: LlamaIndexParser, agent_dir: Path) -> list[ParsedSkill]:
+    return parser.parse(agent_dir)
+
+
+@pytest.fixture(scope="module")
+def reader_skills(parser: LlamaIndexParser, reader_dir: Path) -> list[ParsedSkill]:
+    return parser.parse(reader_dir)
+
+
+@pytest.fixture(scope="module")
+def malformed_dir(llamaindex_samples: dict[str, Path]) -> Path:
+    return llamaindex_samples["malformed"]
+
+
+@pytest.fixture(scope="module")
+def fixture_skills(parser: LlamaIndexParser) -> list[ParsedSkill]:
+    return parser.parse(FIXTURES_DIR)
+
+
+class _Aggregates(NamedTuple):
+    """Security fields flattened across every skill parsed from one directory."""
+
+    env_vars: frozenset[str]
+    urls: tuple[str, ...]
+    commands: tuple[str, ...]
 
 
-@pytest.fixture
-def qe_dir(tmp_path: Path) -> Path:
-    (tmp_path / "query.py").write_text(_QUERY_ENGINE)
-    return tmp_path
+def _aggregate(skills: list[ParsedSkill]) -> _Aggregates:
+    return _Aggregates(
+        env_vars=frozenset(v for s in skills for v in s.env_vars_referenced),
+        urls=tuple(u for s in skills for u in s.urls),
+        commands=tuple(c for s in skills for c in s.shell_commands),
+    )
 
 
-@pytest.fixture
-def agent_dir(tmp_path: Path) -> Path:
-    (tmp_path / "agent.py").write_text(_REACT_AGENT)
-    return tmp_path
+@pytest.fixture(scope="module")
+def env_aggregate(parser: LlamaIndexParser, llamaindex_samples: dict[str, Path]) -> _Aggregates:
+    return _aggregate(parser.parse(llamaindex_samples["env"]))
 
 
-@pytest.fixture
-def reader_dir(tmp_path: Path) -> Path:
-    (tmp_path / "reader.py").write_text(_DATA_READER)
-    return tmp_path
+@pytest.fixture(scope="module")
+def shell_aggregate(parser: LlamaIndexParser, llamaindex_samples: dict[str, Path]) -> _Aggregates:
+    return _aggregate(parser.parse(llamaindex_samples["shell"]))
+
+
+@pytest.fixture(scope="module")
+def url_aggregate(parser: LlamaIndexParser, llamaindex_samples: dict[str, Path]) -> _Aggregates:
+    return _aggregate(parser.parse(llamaindex_samples["url"]))
+
+
+@pytest.fixture(scope="module")
+def fixture_aggregate(fixture_skills: list[ParsedSkill]) -> _Aggregates:
+    return _aggregate(fixture_skills)
 
 
 # ---------------------------------------------------------------------------
@@ -144,30 +244,51 @@ def reader_dir(tmp_path: Path) -> Path:
 class TestCanParse:
     """Validate LlamaIndex format detection."""
 
-    def test_detects_function_tool(self, parser: LlamaIndexParser, fn_dir: Path) -> None:
-        assert parser.can_parse(fn_dir) is True
-
-    def test_detects_query_engine(self, parser: LlamaIndexParser, qe_dir: Path) -> None:
-        assert parser.can_parse(qe_dir) is True
-
-    def test_detects_agent(self, parser: LlamaIndexParser, agent_dir: Path) -> None:
-        assert parser.can_parse(agent_dir) is True
-
-    def test_detects_reader(self, parser: LlamaIndexParser, reader_dir: Path) -> None:
-        assert parser.can_parse(reader_dir) is True
-
-    def test_rejects_empty(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
+    @pytest.mark.parametrize(
+        ("files", "expected"),
+        [
+            pytest.param({"tools.py": _FUNCTION_TOOL_BYTES}, True, id="function-tool"),
+            pytest.param({"query.py": _QUERY_ENGINE_BYTES}, True, id="query-engine"),
+            pytest.param({"agent.py": _REACT_AGENT_BYTES}, True, id="agent"),
+            pytest.param({"reader.py": _DATA_READER_BYTES}, True, id="reader"),
+            pytest.param({}, False, id="empty"),
+            pytest.param({"app.py": b"print('hello')\n"}, False, id="plain-python"),
+            pytest.param({"tools/t.py": _FUNCTION_TOOL_BYTES}, True, id="tools-subdir"),
+        ],
+    )
+    def test_can_parse(
+        self,
+        parser: LlamaIndexParser,
+        tmp_path: Path,
+        files: dict[str, bytes],
+        expected: bool,
+    ) -> None:
+        write_samples(tmp_path, files)
+        assert parser.can_parse(tmp_path) is expected
+
+    def test_probes_head_only(
+        self,
+        parser: LlamaIndexParser,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A large non-LlamaIndex file is rejected without extracting anything."""
+
+        def _fail(*_args: object) -> list[ParsedSkill]:
+            raise AssertionError("can_parse must not extract tools")
+
+        monkeypatch.setattr(llamaindex_tools, "_extract_tools_from_source", _fail)
+        write_samples(tmp_path, {"big.py": b"x = 1\n" * 20_000})
         assert parser.can_parse(tmp_path) is False
-
-    def test_rejects_plain_python(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        (tmp_path / "app.py").write_text("print('hello')\n")
+        padding = b"#" * HEAD_BYTES + b"\n"
+        write_samples(tmp_path, {"late.py": padding + _FUNCTION_TOOL_BYTES})
         assert parser.can_parse(tmp_path) is False
 
-    def test_detects_tools_subdir(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        sub = tmp_path / "tools"
-        sub.mkdir()
-        (sub / "t.py").write_text(_FUNCTION_TOOL)
-        assert parser.can_parse(tmp_path) is True
+    def test_probe_cached_between_calls(self, parser: LlamaIndexParser, fn_dir: Path) -> None:
+        parser.can_parse(fn_dir)
+        hits = llamaindex_tools._probe_tool_file.cache_info().hits
+        parser.parse(fn_dir)
+        assert llamaindex_tools._probe_tool_file.cache_info().hits > hits
 
 
 # ---------------------------------------------------------------------------
@@ -178,25 +299,23 @@ class TestCanParse:
 class TestFunctionTool:
     """Validate FunctionTool.from_defaults() extraction."""
 
-    def test_extracts_name(self, parser: LlamaIndexParser, fn_dir: Path) -> None:
-        skills = parser.parse(fn_dir)
-        assert any(s.name == "multiply" for s in skills)
+    def test_extracts_name(self, fn_skills: list[ParsedSkill]) -> None:
+        assert any(s.name == "multiply" for s in fn_skills)
 
     def test_named_kwarg(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        (tmp_path / "c.py").write_text(_NAMED_TOOL)
+        write_samples(tmp_path, {"c.py": _NAMED_TOOL_BYTES})
         skills = parser.parse(tmp_path)
         assert any(s.name == "calculator" for s in skills)
         calc = [s for s in skills if s.name == "calculator"][0]
         assert "simple calculator" in calc.description.lower()
 
     def test_positional_fn(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        (tmp_path / "p.py").write_text(_POSITIONAL_FN)
+        write_samples(tmp_path, {"p.py": _POSITIONAL_FN_BYTES})
         skills = parser.parse(tmp_path)
         assert any(s.name == "helper" for s in skills)
 
-    def test_capabilities(self, parser: LlamaIndexParser, fn_dir: Path) -> None:
-        skills = parser.parse(fn_dir)
-        fn_skill = [s for s in skills if s.name == "multiply"][0]
+    def test_capabilities(self, fn_skills: list[ParsedSkill]) -> None:
+        fn_skill = [s for s in fn_skills if s.name == "multiply"][0]
         assert "tool:multiply" in fn_skill.declared_capabilities
 
 
@@ -208,18 +327,15 @@ class TestFunctionTool:
 class TestQueryEngineTool:
     """Validate QueryEngineTool extraction."""
 
-    def test_extracts_name(self, parser: LlamaIndexParser, qe_dir: Path) -> None:
-        skills = parser.parse(qe_dir)
-        assert any(s.name == "doc_search" for s in skills)
+    def test_extracts_name(self, qe_skills: list[ParsedSkill]) -> None:
+        assert any(s.name == "doc_search" for s in qe_skills)
 
-    def test_description(self, parser: LlamaIndexParser, qe_dir: Path) -> None:
-        skills = parser.parse(qe_dir)
-        skill = [s for s in skills if s.name == "doc_search"][0]
+    def test_description(self, qe_skills: list[ParsedSkill]) -> None:
+        skill = [s for s in qe_skills if s.name == "doc_search"][0]
         assert "Search through documents" in skill.description
 
-    def test_capabilities(self, parser: LlamaIndexParser, qe_dir: Path) -> None:
-        skills = parser.parse(qe_dir)
-        skill = [s for s in skills if s.name == "doc_search"][0]
+    def test_capabilities(self, qe_skills: list[ParsedSkill]) -> None:
+        skill = [s for s in qe_skills if s.name == "doc_search"][0]
         assert "query_engine:read" in skill.declared_capabilities
 
 
@@ -231,18 +347,15 @@ class TestQueryEngineTool:
 class TestAgent:
     """Validate ReActAgent.from_tools() extraction."""
 
-    def test_extracts_agent(self, parser: LlamaIndexParser, agent_dir: Path) -> None:
-        skills = parser.parse(agent_dir)
-        assert any(s.name == "ReActAgent" for s in skills)
+    def test_extracts_agent(self, agent_skills: list[ParsedSkill]) -> None:
+        assert any(s.name == "ReActAgent" for s in agent_skills)
 
-    def test_agent_description(self, parser: LlamaIndexParser, agent_dir: Path) -> None:
-        skills = parser.parse(agent_dir)
-        agent_skill = [s for s in skills if s.name == "ReActAgent"][0]
+    def test_agent_description(self, agent_skills: list[ParsedSkill]) -> None:
+        agent_skill = [s for s in agent_skills if s.name == "ReActAgent"][0]
         assert "ReActAgent" in agent_skill.description
 
-    def test_agent_tool_caps(self, parser: LlamaIndexParser, agent_dir: Path) -> None:
-        skills = parser.parse(agent_dir)
-        agent_skill = [s for s in skills if s.name == "ReActAgent"][0]
+    def test_agent_tool_caps(self, agent_skills: list[ParsedSkill]) -> None:
+        agent_skill = [s for s in agent_skills if s.name == "ReActAgent"][0]
         assert "tool:tool" in agent_skill.declared_capabilities
 
 
@@ -254,13 +367,11 @@ class TestAgent:
 class TestDataReader:
     """Validate data reader extraction."""
 
-    def test_extracts_reader(self, parser: LlamaIndexParser, reader_dir: Path) -> None:
-        skills = parser.parse(reader_dir)
-        assert any(s.name == "SimpleWebPageReader" for s in skills)
+    def test_extracts_reader(self, reader_skills: list[ParsedSkill]) -> None:
+        assert any(s.name == "SimpleWebPageReader" for s in reader_skills)
 
-    def test_reader_caps(self, parser: LlamaIndexParser, reader_dir: Path) -> None:
-        skills = parser.parse(reader_dir)
-        skill = [s for s in skills if s.name == "SimpleWebPageReader"][0]
+    def test_reader_caps(self, reader_skills: list[ParsedSkill]) -> None:
+        skill = [s for s in reader_skills if s.name == "SimpleWebPageReader"][0]
         assert "reader:SimpleWebPageReader" in skill.declared_capabilities
 
 
@@ -272,28 +383,18 @@ class TestDataReader:
 class TestSecurity:
     """Validate extraction of security-sensitive patterns."""
 
-    def test_env_vars(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        (tmp_path / "e.py").write_text(_ENV_VARS)
-        skills = parser.parse(tmp_path)
-        all_env = {v for s in skills for v in s.env_vars_referenced}
-        assert "OPENAI_API_KEY" in all_env
-        assert "AUTH_TOKEN" in all_env
+    def test_env_vars(self, env_aggregate: _Aggregates) -> None:
+        assert "OPENAI_API_KEY" in env_aggregate.env_vars
+        assert "AUTH_TOKEN" in env_aggregate.env_vars
 
-    def test_shell_commands(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        (tmp_path / "s.py").write_text(_SHELL_CMD)
-        skills = parser.parse(tmp_path)
-        all_cmds = [c for s in skills for c in s.shell_commands]
-        assert any("ls" in cmd for cmd in all_cmds)
+    def test_shell_commands(self, shell_aggregate: _Aggregates) -> None:
+        assert any("ls" in cmd for cmd in shell_aggregate.commands)
 
-    def test_urls(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        (tmp_path / "u.py").write_text(_URL_TOOL)
-        skills = parser.parse(tmp_path)
-        all_urls = [u for s in skills for u in s.urls]
-        assert any("api.example.com" in url for url in all_urls)
+    def test_urls(self, url_aggregate: _Aggregates) -> None:
+        assert any("api.example.com" in url for url in url_aggregate.urls)
 
-    def test_dependencies(self, parser: LlamaIndexParser, fn_dir: Path) -> None:
-        skills = parser.parse(fn_dir)
-        assert "llama_index" in skills[0].dependencies
+    def test_dependencies(self, fn_skills: list[ParsedSkill]) -> None:
+        assert "llama_index" in fn_skills[0].dependencies
 
 
 # ---------------------------------------------------------------------------
@@ -304,29 +405,32 @@ class TestSecurity:
 class TestOutputShape:
     """Validate structural properties of parser output."""
 
-    def test_format(self, parser: LlamaIndexParser, fn_dir: Path) -> None:
-        for skill in parser.parse(fn_dir):
+    def test_format(self, fn_skills: list[ParsedSkill]) -> None:
+        for skill in fn_skills:
             assert skill.format == "llamaindex"
 
-    def test_source_path(self, parser: LlamaIndexParser, fn_dir: Path) -> None:
-        for skill in parser.parse(fn_dir):
-            assert skill.source_path.exists()
+    def test_source_path(self, fn_skills: list[ParsedSkill], fn_dir: Path) -> None:
+        # One directory listing instead of a stat per skill.
+        with os.scandir(fn_dir) as entries:
+            sources = {fn_dir / e.name for e in entries if e.name.endswith(".py")}
+        for skill in fn_skills:
+            assert skill.source_path in sources
             assert skill.source_path.suffix == ".py"
 
-    def test_raw_content(self, parser: LlamaIndexParser, fn_dir: Path) -> None:
-        for skill in parser.parse(fn_dir):
+    def test_raw_content(self, fn_skills: list[ParsedSkill]) -> None:
+        for skill in fn_skills:
             assert "FunctionTool" in skill.raw_content
 
-    def test_code_blocks(self, parser: LlamaIndexParser, fn_dir: Path) -> None:
-        for skill in parser.parse(fn_dir):
+    def test_code_blocks(self, fn_skills: list[ParsedSkill]) -> None:
+        for skill in fn_skills:
             assert len(skill.code_blocks) >= 1
 
-    def test_parsed_skill_type(self, parser: LlamaIndexParser, fn_dir: Path) -> None:
-        for skill in parser.parse(fn_dir):
+    def test_parsed_skill_type(self, fn_skills: list[ParsedSkill]) -> None:
+        for skill in fn_skills:
             assert isinstance(skill, ParsedSkill)
 
     def test_multiple_tools(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        (tmp_path / "m.py").write_text(_MULTI_TOOLS)
+        write_samples(tmp_path, {"m.py": _MULTI_TOOLS_BYTES})
         skills = parser.parse(tmp_path)
         assert len(skills) >= 3
 
@@ -339,52 +443,39 @@ class TestOutputShape:
 class TestEdgeCases:
     """Validate graceful handling of edge cases."""
 
-    def test_empty_dir(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        assert parser.parse(tmp_path) == []
+    def test_empty_dir(self, parser: LlamaIndexParser, empty_dir: Path) -> None:
+        assert parser.parse(empty_dir) == []
 
-    def test_malformed_no_raise(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        bad = (
-            "from llama_index.core.tools import FunctionTool\ntool = FunctionTool.from_defaults(\n"
-        )
-        (tmp_path / "b.py").write_text(bad)
-        skills = parser.parse(tmp_path)
+    def test_malformed(self, parser: LlamaIndexParser, malformed_dir: Path) -> None:
+        """A syntax error does not raise; the regex fallback still finds the tool."""
+        skills = parser.parse(malformed_dir)
         assert isinstance(skills, list)
-
-    def test_malformed_regex_fallback(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        bad = (
-            "from llama_index.core.tools import FunctionTool\ntool = FunctionTool.from_defaults(\n"
-        )
-        (tmp_path / "b.py").write_text(bad)
-        assert len(parser.parse(tmp_path)) >= 1
+        assert len(skills) >= 1
 
     def test_non_utf8_skipped(self, parser: LlamaIndexParser, tmp_path: Path) -> None:
-        (tmp_path / "x.py").write_bytes(b"\xff\xfe" + b"from llama_index" + b"\x00" * 50)
-        assert isinstance(parser.parse(tmp_path), list)
-
-    def test_fixture_basic(self, parser: LlamaIndexParser) -> None:
-        if not FIXTURES_DIR.exists():
-            pytest.skip("Fixtures directory not found")
-        skills = parser.parse(FIXTURES_DIR)
-        names = {s.name for s in skills}
+        write_samples(tmp_path, {"x.py": b"\xff\xfe" + b"from llama_index" + b"\x00" * 50})
+        assert parser.can_parse(tmp_path) is False
+        assert parser.parse(tmp_path) == []
+
+
+# ---------------------------------------------------------------------------
+# Shipped fixture directory
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.skipif(not _FIXTURES_AVAILABLE, reason="Fixtures directory not found")
+class TestFixtureDir:
+    """Validate parsing of the LlamaIndex files under tests/fixtures."""
+
+    def test_fixture_basic(self, fixture_skills: list[ParsedSkill]) -> None:
+        names = {s.name for s in fixture_skills}
         assert "multiply" in names or "addition" in names
 
-    def test_fixture_env_vars(self, parser: LlamaIndexParser) -> None:
-        if not FIXTURES_DIR.exists():
-            pytest.skip("Fixtures directory not found")
-        skills = parser.parse(FIXTURES_DIR)
-        all_env = {v for s in skills for v in s.env_vars_referenced}
-        assert "SECRET_API_KEY" in all_env
-
-    def test_fixture_urls(self, parser: LlamaIndexParser) -> None:
-        if not FIXTURES_DIR.exists():
-            pytest.skip("Fixtures directory not found")
-        skills = parser.parse(FIXTURES_DIR)
-        all_urls = [u for s in skills for u in s.urls]
-        assert any("evil.example.com" in url for url in all_urls)
-
-    def test_fixture_shell(self, parser: LlamaIndexParser) -> None:
-        if not FIXTURES_DIR.exists():
-            pytest.skip("Fixtures directory not found")
-        skills = parser.parse(FIXTURES_DIR)
-        all_cmds = [c for s in skills for c in s.shell_commands]
-        assert any("rm" in cmd for cmd in all_cmds)
+    def test_fixture_env_vars(self, fixture_aggregate: _Aggregates) -> None:
+        assert "SECRET_API_KEY" in fixture_aggregate.env_vars
+
+    def test_fixture_urls(self, fixture_aggregate: _Aggregates) -> None:
+        assert any("evil.example.com" in url for url in fixture_aggregate.urls)
+
+    def test_fixture_shell(self, fixture_aggregate: _Aggregates) -> None:
+        assert any("rm" in cmd for cmd in fixture_aggregate.commands)
@@ -27,14 +27,16 @@ from skillfortify.parsers.mcp_config import McpConfigParser
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> McpConfigParser:
+    """One McpConfigParser for the module; it keeps no state."""
     return McpConfigParser()
 
 
-@pytest.fixture
-def mcp_config_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def mcp_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a directory with a standard mcp.json file."""
+    tmp_path = tmp_path_factory.mktemp("mcp_config")
     config = {
         "mcpServers": {
             "filesystem": {
@@ -53,6 +55,12 @@ def mcp_config_dir(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def parsed_mcp_skills(parser: McpConfigParser, mcp_config_dir: Path) -> dict[str, ParsedSkill]:
+    """Skills parsed once from ``mcp_config_dir``, keyed by name; read-only."""
+    return {s.name: s for s in parser.parse(mcp_config_dir)}
+
+
 @pytest.fixture
 def hidden_mcp_config_dir(tmp_path: Path) -> Path:
     """Create a directory with a .mcp.json (hidden variant)."""
@@ -128,44 +136,35 @@ class TestMcpConfigParser:
         """Parser rejects a directory without any MCP config file."""
         assert parser.can_parse(tmp_path) is False
 
-    def test_parses_skill_name(self, parser: McpConfigParser, mcp_config_dir: Path) -> None:
+    def test_parses_skill_name(self, parsed_mcp_skills: dict[str, ParsedSkill]) -> None:
         """Each MCP server key becomes a ParsedSkill name."""
-        skills = parser.parse(mcp_config_dir)
-        names = {s.name for s in skills}
-        assert "filesystem" in names
-        assert "github" in names
+        assert "filesystem" in parsed_mcp_skills
+        assert "github" in parsed_mcp_skills
 
-    def test_extracts_description(self, parser: McpConfigParser, mcp_config_dir: Path) -> None:
+    def test_extracts_description(self, parsed_mcp_skills: dict[str, ParsedSkill]) -> None:
         """Description includes the server command for identification."""
-        skills = parser.parse(mcp_config_dir)
-        fs_skill = next(s for s in skills if s.name == "filesystem")
-        assert "npx" in fs_skill.description
+        assert "npx" in parsed_mcp_skills["filesystem"].description
 
-    def test_extracts_env_vars(self, parser: McpConfigParser, mcp_config_dir: Path) -> None:
+    def test_extracts_env_vars(self, parsed_mcp_skills: dict[str, ParsedSkill]) -> None:
         """Extracts environment variable names from the env block."""
-        skills = parser.parse(mcp_config_dir)
-        gh_skill = next(s for s in skills if s.name == "github")
-        assert "GITHUB_TOKEN" in gh_skill.env_vars_referenced
+        assert "GITHUB_TOKEN" in parsed_mcp_skills["github"].env_vars_referenced
 
-    def test_extracts_shell_commands(self, parser: McpConfigParser, mcp_config_dir: Path) -> None:
+    def test_extracts_shell_commands(self, parsed_mcp_skills: dict[str, ParsedSkill]) -> None:
         """The command + args are captured as shell commands."""
-        skills = parser.parse(mcp_config_dir)
-        fs_skill = next(s for s in skills if s.name == "filesystem")
+        fs_skill = parsed_mcp_skills["filesystem"]
         assert any("npx" in cmd for cmd in fs_skill.shell_commands)
         assert any(
             "@modelcontextprotocol/server-filesystem" in cmd for cmd in fs_skill.shell_commands
         )
 
-    def test_format_is_correct(self, parser: McpConfigParser, mcp_config_dir: Path) -> None:
+    def test_format_is_correct(self, parsed_mcp_skills: dict[str, ParsedSkill]) -> None:
         """Parsed skills must have format='mcp'."""
-        skills = parser.parse(mcp_config_dir)
-        for skill in skills:
+        for skill in parsed_mcp_skills.values():
             assert skill.format == "mcp"
 
-    def test_source_path_is_set(self, parser: McpConfigParser, mcp_config_dir: Path) -> None:
+    def test_source_path_is_set(self, parsed_mcp_skills: dict[str, ParsedSkill]) -> None:
         """source_path points to the actual config file on disk."""
-        skills = parser.parse(mcp_config_dir)
-        for skill in skills:
+        for skill in parsed_mcp_skills.values():
             assert skill.source_path.exists()
             assert skill.source_path.name == "mcp.json"
 
@@ -182,22 +181,19 @@ class TestMcpConfigParser:
         assert skills == []
 
     def test_returns_parsed_skill_instances(
-        self, parser: McpConfigParser, mcp_config_dir: Path
+        self, parsed_mcp_skills: dict[str, ParsedSkill]
     ) -> None:
         """All returned items are ParsedSkill instances."""
-        skills = parser.parse(mcp_config_dir)
-        for skill in skills:
+        for skill in parsed_mcp_skills.values():
             assert isinstance(skill, ParsedSkill)
 
     def test_parses_two_servers(self, parser: McpConfigParser, mcp_config_dir: Path) -> None:
         """The fixture has two server entries -- both must be parsed."""
-        skills = parser.parse(mcp_config_dir)
-        assert len(skills) == 2
+        assert len(parser.parse(mcp_config_dir)) == 2
 
-    def test_dependencies_from_args(self, parser: McpConfigParser, mcp_config_dir: Path) -> None:
+    def test_dependencies_from_args(self, parsed_mcp_skills: dict[str, ParsedSkill]) -> None:
         """npm package references in args are captured as dependencies."""
-        skills = parser.parse(mcp_config_dir)
-        fs_skill = next(s for s in skills if s.name == "filesystem")
+        fs_skill = parsed_mcp_skills["filesystem"]
         assert any(
             "@modelcontextprotocol/server-filesystem" in dep for dep in fs_skill.dependencies
         )
@@ -17,20 +17,28 @@ import pytest
 from skillfortify.parsers.base import ParsedSkill
 from skillfortify.parsers.n8n_workflow import N8nWorkflowParser
 
-FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "n8n"
+from ._helpers import link_or_copy
 
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "n8n"
 
-@pytest.fixture
+
+def _workflow_dir(factory: pytest.TempPathFactory, name: str) -> Path:
+    """Create a directory holding the single workflow fixture ``name``."""
+    directory = factory.mktemp(Path(name).stem)
+    link_or_copy(FIXTURES_DIR / name, directory / name)
+    return directory
+
+
+@pytest.fixture(scope="module")
 def parser() -> N8nWorkflowParser:
-    """Return a fresh N8nWorkflowParser instance."""
+    """Return an N8nWorkflowParser shared by this module (it holds no state)."""
     return N8nWorkflowParser()
 
 
-@pytest.fixture
-def basic_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def basic_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Directory with a basic n8n workflow."""
-    shutil.copy(FIXTURES_DIR / "basic_workflow.json", tmp_path / "basic_workflow.json")
-    return tmp_path
+    return _workflow_dir(tmp_path_factory, "basic_workflow.json")
 
 
 @pytest.fixture
@@ -40,39 +48,70 @@ def basic_named_dir(tmp_path: Path) -> Path:
     return tmp_path
 
 
-@pytest.fixture
-def http_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def http_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Directory with an HTTP request workflow."""
-    shutil.copy(FIXTURES_DIR / "http_workflow.json", tmp_path / "http_workflow.json")
-    return tmp_path
+    return _workflow_dir(tmp_path_factory, "http_workflow.json")
 
 
-@pytest.fixture
-def code_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def code_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Directory with a code execution workflow."""
-    shutil.copy(FIXTURES_DIR / "code_workflow.json", tmp_path / "code_workflow.json")
-    return tmp_path
+    return _workflow_dir(tmp_path_factory, "code_workflow.json")
 
 
-@pytest.fixture
-def webhook_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def webhook_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Directory with a webhook workflow."""
-    shutil.copy(FIXTURES_DIR / "webhook_workflow.json", tmp_path / "webhook_workflow.json")
-    return tmp_path
+    return _workflow_dir(tmp_path_factory, "webhook_workflow.json")
 
 
-@pytest.fixture
-def unsafe_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def unsafe_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Directory with an unsafe workflow containing malicious patterns."""
-    shutil.copy(FIXTURES_DIR / "unsafe_workflow.json", tmp_path / "unsafe_workflow.json")
-    return tmp_path
+    return _workflow_dir(tmp_path_factory, "unsafe_workflow.json")
 
 
-@pytest.fixture
-def credentials_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def credentials_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Directory with a workflow referencing multiple credentials."""
-    shutil.copy(FIXTURES_DIR / "credentials_workflow.json", tmp_path / "credentials_workflow.json")
-    return tmp_path
+    return _workflow_dir(tmp_path_factory, "credentials_workflow.json")
+
+
+@pytest.fixture(scope="module")
+def basic_skill(parser: N8nWorkflowParser, basic_dir: Path) -> ParsedSkill:
+    """First skill parsed from the basic workflow, shared by this module."""
+    return parser.parse(basic_dir)[0]
+
+
+@pytest.fixture(scope="module")
+def http_skill(parser: N8nWorkflowParser, http_dir: Path) -> ParsedSkill:
+    """First skill parsed from the HTTP request workflow, shared by this module."""
+    return parser.parse(http_dir)[0]
+
+
+@pytest.fixture(scope="module")
+def code_skill(parser: N8nWorkflowParser, code_dir: Path) -> ParsedSkill:
+    """First skill parsed from the code node workflow, shared by this module."""
+    return parser.parse(code_dir)[0]
+
+
+@pytest.fixture(scope="module")
+def webhook_skill(parser: N8nWorkflowParser, webhook_dir: Path) -> ParsedSkill:
+    """First skill parsed from the webhook workflow, shared by this module."""
+    return parser.parse(webhook_dir)[0]
+
+
+@pytest.fixture(scope="module")
+def unsafe_skill(parser: N8nWorkflowParser, unsafe_dir: Path) -> ParsedSkill:
+    """First skill parsed from the malicious workflow, shared by this module."""
+    return parser.parse(unsafe_dir)[0]
+
+
+@pytest.fixture(scope="module")
+def credentials_skill(parser: N8nWorkflowParser, credentials_dir: Path) -> ParsedSkill:
+    """First skill parsed from the credentials workflow, shared by this module."""
+    return parser.parse(credentials_dir)[0]
 
 
 @pytest.fixture
@@ -133,8 +172,8 @@ class TestParseBasic:
         assert len(skills) >= 1
         assert skills[0].name == "Basic Workflow"
 
-    def test_format_is_n8n(self, parser: N8nWorkflowParser, basic_dir: Path) -> None:
-        assert parser.parse(basic_dir)[0].format == "n8n"
+    def test_format_is_n8n(self, basic_skill: ParsedSkill) -> None:
+        assert basic_skill.format == "n8n"
 
     def test_returns_parsed_skill_instances(
         self, parser: N8nWorkflowParser, basic_dir: Path
@@ -142,154 +181,126 @@ class TestParseBasic:
         for skill in parser.parse(basic_dir):
             assert isinstance(skill, ParsedSkill)
 
-    def test_source_path_exists(self, parser: N8nWorkflowParser, basic_dir: Path) -> None:
-        assert parser.parse(basic_dir)[0].source_path.exists()
+    def test_source_path_exists(self, basic_skill: ParsedSkill) -> None:
+        assert basic_skill.source_path.exists()
 
-    def test_raw_content_preserved(self, parser: N8nWorkflowParser, basic_dir: Path) -> None:
-        assert "Basic Workflow" in parser.parse(basic_dir)[0].raw_content
+    def test_raw_content_preserved(self, basic_skill: ParsedSkill) -> None:
+        assert "Basic Workflow" in basic_skill.raw_content
 
-    def test_dependencies_contain_node_types(
-        self, parser: N8nWorkflowParser, basic_dir: Path
-    ) -> None:
-        deps = parser.parse(basic_dir)[0].dependencies
+    def test_dependencies_contain_node_types(self, basic_skill: ParsedSkill) -> None:
+        deps = basic_skill.dependencies
         assert "n8n-nodes-base.start" in deps
         assert "n8n-nodes-base.set" in deps
 
-    def test_description_contains_workflow_name(
-        self, parser: N8nWorkflowParser, basic_dir: Path
-    ) -> None:
-        assert "Basic Workflow" in parser.parse(basic_dir)[0].description
+    def test_description_contains_workflow_name(self, basic_skill: ParsedSkill) -> None:
+        assert "Basic Workflow" in basic_skill.description
 
 
 class TestParseHTTP:
     """Validate HTTP request node extraction."""
 
-    def test_extracts_http_urls(self, parser: N8nWorkflowParser, http_dir: Path) -> None:
-        assert any("api.example.com/users" in u for u in parser.parse(http_dir)[0].urls)
+    def test_extracts_http_urls(self, http_skill: ParsedSkill) -> None:
+        assert any("api.example.com/users" in u for u in http_skill.urls)
 
-    def test_extracts_webhook_site_url(self, parser: N8nWorkflowParser, http_dir: Path) -> None:
-        assert any("webhook.site" in u for u in parser.parse(http_dir)[0].urls)
+    def test_extracts_webhook_site_url(self, http_skill: ParsedSkill) -> None:
+        assert any("webhook.site" in u for u in http_skill.urls)
 
-    def test_network_access_capability(self, parser: N8nWorkflowParser, http_dir: Path) -> None:
-        assert "network_access" in parser.parse(http_dir)[0].declared_capabilities
+    def test_network_access_capability(self, http_skill: ParsedSkill) -> None:
+        assert "network_access" in http_skill.declared_capabilities
 
-    def test_extracts_http_credentials(self, parser: N8nWorkflowParser, http_dir: Path) -> None:
-        assert "httpBasicAuth" in parser.parse(http_dir)[0].env_vars_referenced
+    def test_extracts_http_credentials(self, http_skill: ParsedSkill) -> None:
+        assert "httpBasicAuth" in http_skill.env_vars_referenced
 
 
 class TestParseCode:
     """Validate code execution node extraction."""
 
-    def test_extracts_js_code(self, parser: N8nWorkflowParser, code_dir: Path) -> None:
-        assert any("$input.all()" in b for b in parser.parse(code_dir)[0].code_blocks)
+    def test_extracts_js_code(self, code_skill: ParsedSkill) -> None:
+        assert any("$input.all()" in b for b in code_skill.code_blocks)
 
-    def test_extracts_python_code(self, parser: N8nWorkflowParser, code_dir: Path) -> None:
-        assert any("import os" in b for b in parser.parse(code_dir)[0].code_blocks)
+    def test_extracts_python_code(self, code_skill: ParsedSkill) -> None:
+        assert any("import os" in b for b in code_skill.code_blocks)
 
-    def test_extracts_legacy_function_code(self, parser: N8nWorkflowParser, code_dir: Path) -> None:
-        assert any("items.map" in b for b in parser.parse(code_dir)[0].code_blocks)
+    def test_extracts_legacy_function_code(self, code_skill: ParsedSkill) -> None:
+        assert any("items.map" in b for b in code_skill.code_blocks)
 
-    def test_code_execution_capability(self, parser: N8nWorkflowParser, code_dir: Path) -> None:
-        assert "code_execution" in parser.parse(code_dir)[0].declared_capabilities
+    def test_code_execution_capability(self, code_skill: ParsedSkill) -> None:
+        assert "code_execution" in code_skill.declared_capabilities
 
-    def test_multiple_code_blocks_extracted(
-        self, parser: N8nWorkflowParser, code_dir: Path
-    ) -> None:
-        assert len(parser.parse(code_dir)[0].code_blocks) >= 3
+    def test_multiple_code_blocks_extracted(self, code_skill: ParsedSkill) -> None:
+        assert len(code_skill.code_blocks) >= 3
 
 
 class TestParseWebhook:
     """Validate webhook node extraction."""
 
-    def test_webhook_endpoint_capability(
-        self, parser: N8nWorkflowParser, webhook_dir: Path
-    ) -> None:
-        assert "webhook_endpoint" in parser.parse(webhook_dir)[0].declared_capabilities
+    def test_webhook_endpoint_capability(self, webhook_skill: ParsedSkill) -> None:
+        assert "webhook_endpoint" in webhook_skill.declared_capabilities
 
-    def test_webhook_node_in_dependencies(
-        self, parser: N8nWorkflowParser, webhook_dir: Path
-    ) -> None:
-        assert "n8n-nodes-base.webhook" in parser.parse(webhook_dir)[0].dependencies
+    def test_webhook_node_in_dependencies(self, webhook_skill: ParsedSkill) -> None:
+        assert "n8n-nodes-base.webhook" in webhook_skill.dependencies
 
 
 class TestParseUnsafe:
     """Validate detection of suspicious/malicious patterns."""
 
-    def test_extracts_malicious_urls(self, parser: N8nWorkflowParser, unsafe_dir: Path) -> None:
-        assert any("evil.attacker.com" in u for u in parser.parse(unsafe_dir)[0].urls)
+    def test_extracts_malicious_urls(self, unsafe_skill: ParsedSkill) -> None:
+        assert any("evil.attacker.com" in u for u in unsafe_skill.urls)
 
-    def test_extracts_shell_from_exec_node(
-        self, parser: N8nWorkflowParser, unsafe_dir: Path
-    ) -> None:
-        assert any("curl" in c for c in parser.parse(unsafe_dir)[0].shell_commands)
+    def test_extracts_shell_from_exec_node(self, unsafe_skill: ParsedSkill) -> None:
+        assert any("curl" in c for c in unsafe_skill.shell_commands)
 
-    def test_extracts_shell_from_ssh_node(
-        self, parser: N8nWorkflowParser, unsafe_dir: Path
-    ) -> None:
-        assert any("rm -rf" in c for c in parser.parse(unsafe_dir)[0].shell_commands)
+    def test_extracts_shell_from_ssh_node(self, unsafe_skill: ParsedSkill) -> None:
+        assert any("rm -rf" in c for c in unsafe_skill.shell_commands)
 
-    def test_extracts_malicious_code_blocks(
-        self, parser: N8nWorkflowParser, unsafe_dir: Path
-    ) -> None:
-        assert any("readFileSync" in b for b in parser.parse(unsafe_dir)[0].code_blocks)
+    def test_extracts_malicious_code_blocks(self, unsafe_skill: ParsedSkill) -> None:
+        assert any("readFileSync" in b for b in unsafe_skill.code_blocks)
 
-    def test_shell_access_capability(self, parser: N8nWorkflowParser, unsafe_dir: Path) -> None:
-        assert "shell_access" in parser.parse(unsafe_dir)[0].declared_capabilities
+    def test_shell_access_capability(self, unsafe_skill: ParsedSkill) -> None:
+        assert "shell_access" in unsafe_skill.declared_capabilities
 
-    def test_database_access_capability(self, parser: N8nWorkflowParser, unsafe_dir: Path) -> None:
-        assert "database_access" in parser.parse(unsafe_dir)[0].declared_capabilities
+    def test_database_access_capability(self, unsafe_skill: ParsedSkill) -> None:
+        assert "database_access" in unsafe_skill.declared_capabilities
 
-    def test_network_access_capability(self, parser: N8nWorkflowParser, unsafe_dir: Path) -> None:
-        assert "network_access" in parser.parse(unsafe_dir)[0].declared_capabilities
+    def test_network_access_capability(self, unsafe_skill: ParsedSkill) -> None:
+        assert "network_access" in unsafe_skill.declared_capabilities
 
-    def test_webhook_endpoint_capability(self, parser: N8nWorkflowParser, unsafe_dir: Path) -> None:
-        assert "webhook_endpoint" in parser.parse(unsafe_dir)[0].declared_capabilities
+    def test_webhook_endpoint_capability(self, unsafe_skill: ParsedSkill) -> None:
+        assert "webhook_endpoint" in unsafe_skill.declared_capabilities
 
-    def test_code_execution_capability(self, parser: N8nWorkflowParser, unsafe_dir: Path) -> None:
-        assert "code_execution" in parser.parse(unsafe_dir)[0].declared_capabilities
+    def test_code_execution_capability(self, unsafe_skill: ParsedSkill) -> None:
+        assert "code_execution" in unsafe_skill.declared_capabilities
 
-    def test_extracts_stolen_token_cred(self, parser: N8nWorkflowParser, unsafe_dir: Path) -> None:
-        assert "Stolen Token" in parser.parse(unsafe_dir)[0].env_vars_referenced
+    def test_extracts_stolen_token_cred(self, unsafe_skill: ParsedSkill) -> None:
+        assert "Stolen Token" in unsafe_skill.env_vars_referenced
 
-    def test_extracts_ssh_credential(self, parser: N8nWorkflowParser, unsafe_dir: Path) -> None:
-        assert "sshPassword" in parser.parse(unsafe_dir)[0].env_vars_referenced
+    def test_extracts_ssh_credential(self, unsafe_skill: ParsedSkill) -> None:
+        assert "sshPassword" in unsafe_skill.env_vars_referenced
 
-    def test_extracts_db_credential(self, parser: N8nWorkflowParser, unsafe_dir: Path) -> None:
-        assert "postgres" in parser.parse(unsafe_dir)[0].env_vars_referenced
+    def test_extracts_db_credential(self, unsafe_skill: ParsedSkill) -> None:
+        assert "postgres" in unsafe_skill.env_vars_referenced
 
 
 class TestParseCredentials:
     """Validate extraction of credential references."""
 
-    def test_extracts_slack_credential(
-        self, parser: N8nWorkflowParser, credentials_dir: Path
-    ) -> None:
-        assert "slackApi" in parser.parse(credentials_dir)[0].env_vars_referenced
+    def test_extracts_slack_credential(self, credentials_skill: ParsedSkill) -> None:
+        assert "slackApi" in credentials_skill.env_vars_referenced
 
-    def test_extracts_gmail_credential(
-        self, parser: N8nWorkflowParser, credentials_dir: Path
-    ) -> None:
-        assert "gmailOAuth2" in parser.parse(credentials_dir)[0].env_vars_referenced
+    def test_extracts_gmail_credential(self, credentials_skill: ParsedSkill) -> None:
+        assert "gmailOAuth2" in credentials_skill.env_vars_referenced
 
-    def test_extracts_aws_credential(
-        self, parser: N8nWorkflowParser, credentials_dir: Path
-    ) -> None:
-        assert "aws" in parser.parse(credentials_dir)[0].env_vars_referenced
+    def test_extracts_aws_credential(self, credentials_skill: ParsedSkill) -> None:
+        assert "aws" in credentials_skill.env_vars_referenced
 
-    def test_extracts_mysql_credential(
-        self, parser: N8nWorkflowParser, credentials_dir: Path
-    ) -> None:
-        assert "mySql" in parser.parse(credentials_dir)[0].env_vars_referenced
+    def test_extracts_mysql_credential(self, credentials_skill: ParsedSkill) -> None:
+        assert "mySql" in credentials_skill.env_vars_referenced
 
-    def test_extracts_credential_names(
-        self, parser: N8nWorkflowParser, credentials_dir: Path
-    ) -> None:
-        assert "AWS Production" in parser.parse(credentials_dir)[0].env_vars_referenced
+    def test_extracts_credential_names(self, credentials_skill: ParsedSkill) -> None:
+        assert "AWS Production" in credentials_skill.env_vars_referenced
 
-    def test_database_access_capability(
-        self, parser: N8nWorkflowParser, credentials_dir: Path
-    ) -> None:
-        assert "database_access" in parser.parse(credentials_dir)[0].declared_capabilities
+    def test_database_access_capability(self, credentials_skill: ParsedSkill) -> None:
+        assert "database_access" in credentials_skill.declared_capabilities
 
 
 class TestEdgeCases:
@@ -363,5 +374,5 @@ class TestEdgeCases:
         (tmp_path / "v.json").write_text(json.dumps(data))
         assert parser.parse(tmp_path)[0].version == "abc-123"
 
-    def test_version_defaults_to_unknown(self, parser: N8nWorkflowParser, basic_dir: Path) -> None:
-        assert parser.parse(basic_dir)[0].version == "unknown"
+    def test_version_defaults_to_unknown(self, basic_skill: ParsedSkill) -> None:
+        assert basic_skill.version == "unknown"
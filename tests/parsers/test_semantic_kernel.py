@@ -93,7 +93,7 @@ kernel.add_service(AzureChatCompletion(
 ))
 """
 
-FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "semantic_kernel"
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "semantic_kernel"
 
 
 @pytest.fixture